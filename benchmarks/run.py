@@ -0,0 +1,277 @@
+"""
+Startup and command-latency benchmarks for the CLI.
+
+Each scenario runs `udicti` in a fresh interpreter against the local stub
+backend and GitHub API (see `stub_server.py`), with its own config
+directory, twice over:
+
+- cold: an empty config directory (no caches, snapshots or roster replica)
+- warm: the config directory left behind by a previous run
+
+For every run the benchmark records wall time, peak RSS (from `os.wait4`),
+the time spent importing modules (from `python -X importtime`) and the
+requests sent to each service. Results are written as JSON and checked
+against `thresholds.json`; the exit status is 1 if any threshold is
+exceeded, so a regression fails the build.
+
+The thresholds allow 1.5x the times and memory of a recorded default run
+(rounded up to 10 ms and 1 MB) and exactly its request counts; record a
+new run and update them together when a change moves the numbers.
+
+Usage:
+    python benchmarks/run.py [--runs 5] [--latency-ms 20] [--output results.json]
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from stub_server import StubServer
+
+BENCHMARKS_DIR = Path(__file__).parent
+THRESHOLDS_PATH = BENCHMARKS_DIR / "thresholds.json"
+
+# The same entry point as the installed `udicti` script
+ENTRY_POINT = (
+    "import sys; from udicti_cli.main import app; sys.exit(app(prog_name='udicti'))"
+)
+
+SCENARIOS = {
+    "help": ["--help"],
+    "welcome": ["welcome"],
+    # stdout is a file here, so ask for the table the terminal would show
+    "show-devs": ["show", "devs", "--format", "table"],
+    "search-devs": ["show", "devs", "--skill", "python", "--format", "table"],
+    "dashboard-me": ["dashboard", "me"],
+}
+
+
+def make_config_dir(root: str) -> dict:
+    """Creates an isolated config directory, logged in with a dummy token."""
+    auth_dir = Path(root) / "udicti-cli" / "auth"
+    auth_dir.mkdir(parents=True)
+    (auth_dir / "github_token.json").write_text(
+        json.dumps({"access_token": "benchmark-token"})
+    )
+    return {"XDG_CONFIG_HOME": root}
+
+
+def child_env(server: StubServer, config_env: dict) -> dict:
+    env = {
+        **os.environ,
+        **config_env,
+        "UDICTI_BACKEND_API": f"{server.url}/api",
+        "UDICTI_GITHUB_API": server.url,
+        "COLUMNS": "100",
+    }
+    # Tracing would only slow the runs down
+    env.pop("PYTHONPROFILEIMPORTTIME", None)
+    return env
+
+
+def run_once(args: list[str], env: dict, importtime: bool = False) -> dict:
+    """
+    Runs the CLI once and measures it.
+
+    Returns:
+        A dictionary with the exit code, wall time, peak RSS and, when
+        `importtime` is set, the total time spent importing modules.
+    """
+    command = [sys.executable]
+    if importtime:
+        command += ["-X", "importtime"]
+    command += ["-c", ENTRY_POINT, *args]
+
+    with tempfile.TemporaryFile() as stdout, tempfile.TemporaryFile() as stderr:
+        started = time.perf_counter()
+        process = subprocess.Popen(command, env=env, stdout=stdout, stderr=stderr)
+        # `wait4` gives this child's own resource usage, unlike `getrusage`
+        _, status, usage = os.wait4(process.pid, 0)
+        wall = time.perf_counter() - started
+        process.returncode = os.waitstatus_to_exitcode(status)
+
+        stderr.seek(0)
+        errors = stderr.read().decode(errors="replace")
+
+    result = {
+        "exit_code": process.returncode,
+        "wall_ms": wall * 1000,
+        # `ru_maxrss` is in kilobytes on Linux
+        "peak_rss_mb": usage.ru_maxrss / 1024,
+    }
+    if importtime:
+        result["import_ms"] = total_import_ms(errors)
+    if process.returncode != 0:
+        result["stderr"] = errors[-2000:]
+    return result
+
+
+def total_import_ms(importtime_output: str) -> float:
+    """Sums the cumulative time of every top-level import."""
+    total_us = 0
+    for line in importtime_output.splitlines():
+        if not line.startswith("import time:") or line.count("|") != 2:
+            continue
+        _, cumulative, name = line.split("|")
+        # Nested imports are indented under the import that triggered them
+        if cumulative.strip().isdigit() and not name.startswith("  "):
+            total_us += int(cumulative)
+    return total_us / 1000
+
+
+def group_requests(counts: dict) -> dict:
+    """Totals the per-route counts by service (`backend`, `github`)."""
+    totals = {}
+    for route, count in counts.items():
+        service = route.split(":")[0]
+        totals[service] = totals.get(service, 0) + count
+    return totals
+
+
+def measure(server: StubServer, args: list[str], config_env: dict) -> dict:
+    """Measures one run, including the requests it sent to the stub."""
+    server.take_counts()
+    result = run_once(args, child_env(server, config_env))
+    result["requests"] = server.take_counts()
+    return result
+
+
+def summarize(runs: list[dict], import_ms: float) -> dict:
+    """Combines repeated runs: median times, worst RSS, last run's requests."""
+    failed = [run for run in runs if run["exit_code"] != 0]
+    summary = {
+        "runs": len(runs),
+        "wall_ms": round(statistics.median(run["wall_ms"] for run in runs), 1),
+        "wall_ms_min": round(min(run["wall_ms"] for run in runs), 1),
+        "peak_rss_mb": round(max(run["peak_rss_mb"] for run in runs), 1),
+        "import_ms": round(import_ms, 1),
+        "requests": group_requests(runs[-1]["requests"]),
+        "requests_by_route": runs[-1]["requests"],
+    }
+    if failed:
+        summary["errors"] = [run["stderr"] for run in failed]
+    return summary
+
+
+def bench_scenario(server: StubServer, args: list[str], runs: int) -> dict:
+    """Runs a scenario cold and warm, `runs` times each."""
+    results = {}
+
+    # 1. Cold: every run starts from an empty config directory
+    cold = []
+    for _ in range(runs):
+        with tempfile.TemporaryDirectory() as root:
+            cold.append(measure(server, args, make_config_dir(root)))
+    with tempfile.TemporaryDirectory() as root:
+        env = child_env(server, make_config_dir(root))
+        cold_import = run_once(args, env, importtime=True)["import_ms"]
+    server.take_counts()
+    results["cold"] = summarize(cold, cold_import)
+
+    # 2. Warm: one priming run fills the caches, then every run reuses them
+    with tempfile.TemporaryDirectory() as root:
+        config_env = make_config_dir(root)
+        measure(server, args, config_env)
+        warm = [measure(server, args, config_env) for _ in range(runs)]
+        env = child_env(server, config_env)
+        warm_import = run_once(args, env, importtime=True)["import_ms"]
+    server.take_counts()
+    results["warm"] = summarize(warm, warm_import)
+    return results
+
+
+def check_thresholds(results: dict, thresholds: dict) -> list[str]:
+    """Returns a message for every measurement over its threshold."""
+    failures = []
+    for scenario, modes in thresholds.items():
+        for mode, limits in modes.items():
+            measured = results.get(scenario, {}).get(mode)
+            if measured is None:
+                failures.append(f"{scenario}/{mode}: not measured")
+                continue
+            if measured.get("errors"):
+                failures.append(f"{scenario}/{mode}: the command failed")
+            for metric in ("wall_ms", "peak_rss_mb", "import_ms"):
+                if metric in limits and measured[metric] > limits[metric]:
+                    failures.append(
+                        f"{scenario}/{mode}: {metric} {measured[metric]} "
+                        f"> {limits[metric]}"
+                    )
+            for service, limit in limits.get("requests", {}).items():
+                count = measured["requests"].get(service, 0)
+                if count > limit:
+                    failures.append(
+                        f"{scenario}/{mode}: {count} {service} requests > {limit}"
+                    )
+    return failures
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5, help="Runs per measurement.")
+    parser.add_argument(
+        "--latency-ms",
+        type=float,
+        default=20.0,
+        help="Latency the stub adds to every response.",
+    )
+    parser.add_argument("--output", type=Path, default=BENCHMARKS_DIR / "results.json")
+    parser.add_argument("--thresholds", type=Path, default=THRESHOLDS_PATH)
+    parser.add_argument(
+        "scenarios", nargs="*", help=f"Any of {', '.join(SCENARIOS)} (default: all)."
+    )
+    args = parser.parse_args()
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+
+    server = StubServer(latency=args.latency_ms / 1000).start()
+    results = {}
+    try:
+        for name in args.scenarios or SCENARIOS:
+            print(f"Running {name}...", file=sys.stderr)
+            results[name] = bench_scenario(server, SCENARIOS[name], args.runs)
+    finally:
+        server.stop()
+
+    with open(args.thresholds) as f:
+        thresholds = {
+            name: modes for name, modes in json.load(f).items() if name in results
+        }
+    failures = check_thresholds(results, thresholds)
+
+    report = {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "runs": args.runs,
+        "latency_ms": args.latency_ms,
+        "scenarios": results,
+        "failures": failures,
+    }
+    args.output.write_text(json.dumps(report, indent=2) + "\n")
+
+    for name, modes in results.items():
+        for mode, measured in modes.items():
+            print(
+                f"{name:>13} {mode:<4}  {measured['wall_ms']:8.1f} ms  "
+                f"{measured['peak_rss_mb']:6.1f} MB  "
+                f"imports {measured['import_ms']:6.1f} ms  "
+                f"requests {measured['requests']}"
+            )
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    print(f"Results written to {args.output}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
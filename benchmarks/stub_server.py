@@ -0,0 +1,391 @@
+"""
+A local stand-in for the UDICTI backend and the GitHub REST API, serving
+the recorded responses in `fixtures/`.
+
+Fixture timestamps are shifted by the time elapsed since they were recorded,
+so "last year" or "last 6 months" windows see the same data on every run.
+The server counts requests per route, answers conditional requests with
+`304 Not Modified` like GitHub does, and can add a fixed latency to every
+response to make network round trips visible in the timings.
+
+Run it on its own to try commands by hand:
+
+    python benchmarks/stub_server.py --port 8765
+    UDICTI_BACKEND_API=http://127.0.0.1:8765/api \
+    UDICTI_GITHUB_API=http://127.0.0.1:8765 udicti show devs
+"""
+
+import argparse
+import hashlib
+import json
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, unquote, urlencode, urlsplit
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+# Fixture keys holding timestamps, shifted to keep the data's age constant
+TIMESTAMP_KEYS = {"created_at", "updated_at", "pushed_at", "joined_at", "date"}
+
+
+def _parse_date(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _shift_timestamps(value, shift: timedelta):
+    """Returns a copy of a fixture with every timestamp moved by `shift`."""
+    if isinstance(value, dict):
+        return {
+            key: (
+                (_parse_date(item) + shift).isoformat().replace("+00:00", "Z")
+                if key in TIMESTAMP_KEYS and isinstance(item, str)
+                else _shift_timestamps(item, shift)
+            )
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [_shift_timestamps(item, shift) for item in value]
+    return value
+
+
+def load_fixture(name: str) -> dict:
+    """Loads a fixture file, rebased to the current time."""
+    with open(FIXTURES_DIR / f"{name}.json") as f:
+        fixture = json.load(f)
+    shift = datetime.now(timezone.utc) - _parse_date(fixture.pop("recorded_at"))
+    return _shift_timestamps(fixture, shift)
+
+
+class StubServer:
+    """
+    Serves the fixtures on a background thread.
+
+    Args:
+        port: The port to listen on; 0 picks a free one.
+        latency: Seconds added to every response.
+    """
+
+    def __init__(self, port: int = 0, latency: float = 0.0):
+        self.github = load_fixture("github")
+        self.developers = load_fixture("developers")["developers"]
+        self.latency = latency
+        self.requests = Counter()
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), self._handler())
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StubServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def take_counts(self) -> dict:
+        """Returns the requests counted per route since the last call."""
+        with self._lock:
+            counts = dict(self.requests)
+            self.requests.clear()
+        return counts
+
+    def count(self, route: str):
+        with self._lock:
+            self.requests[route] += 1
+
+    # Routes: each returns (status, body, Link header or None)
+
+    def backend_developers(self, query: dict):
+        body = {"server_time": datetime.now(timezone.utc).isoformat()}
+        developers = self.developers
+        if "github" in query:
+            github = query["github"].lower()
+            developers = [d for d in developers if d["github"].lower() == github]
+        elif "updated_since" in query:
+            since = _parse_date(query["updated_since"])
+            developers = [
+                d for d in developers if _parse_date(d["updated_at"]) >= since
+            ]
+        elif "limit" in query:
+            # Cursor pagination, ordered by email
+            limit = int(query["limit"])
+            cursor = query.get("cursor", "")
+            developers = sorted(
+                (d for d in developers if d["email"] > cursor), key=lambda d: d["email"]
+            )[:limit]
+            full_page = len(developers) == limit
+            body["next_cursor"] = developers[-1]["email"] if full_page else None
+        body.update(developers=developers, count=len(developers))
+        return 200, body, None
+
+    def backend_developer(self, github: str):
+        for dev in self.developers:
+            if dev["github"].lower() == github.lower():
+                return 200, {"developer": dev}, None
+        return 404, {"error": "Developer not found"}, None
+
+    def backend_handles(self, query: dict):
+        prefix = query.get("prefix", "").lower()
+        handles = sorted(
+            (
+                {"github": d["github"], "name": d["name"]}
+                for d in self.developers
+                if d["github"].lower().startswith(prefix)
+            ),
+            key=lambda h: h["github"].lower(),
+        )[: int(query.get("limit", 10))]
+        return 200, {"handles": handles, "count": len(handles)}, None
+
+    def backend_search(self, query: dict, params: dict):
+        """Like the backend's search index: normalized terms, all or any."""
+
+        def normalize(term):
+            return " ".join(term.split()).casefold()
+
+        def terms(name):
+            values = params.get(name, [])
+            return {normalize(t) for v in values for t in v.split(",")} - {""}
+
+        match = query.get("match", "all")
+        if match not in ("all", "any"):
+            return 400, {"error": "match must be 'all' or 'any'"}, None
+        wanted = [("skills", t) for t in terms("skill")] + [
+            ("interests", t) for t in terms("interest")
+        ]
+        if not wanted:
+            return 400, {"error": "Give at least one skill or interest"}, None
+        developers = []
+        for dev in sorted(self.developers, key=lambda d: d["email"]):
+            has = {field: {normalize(t) for t in dev[field]} for field, _ in wanted}
+            hits = [term in has[field] for field, term in wanted]
+            if all(hits) if match == "all" else any(hits):
+                developers.append(dev)
+        body = {"developers": developers, "count": len(developers), "match": match}
+        return 200, body, None
+
+    def github_commits(self, repo: str, query: dict, path: str):
+        commits = self.github["commits"].get(repo)
+        if commits is None:
+            return 404, {"message": "Not Found"}, None
+        if "author" in query:
+            commits = [c for c in commits if c["author"]["login"] == query["author"]]
+        if "since" in query:
+            since = _parse_date(query["since"])
+            commits = [
+                c
+                for c in commits
+                if _parse_date(c["commit"]["author"]["date"]) >= since
+            ]
+        if "until" in query:
+            until = _parse_date(query["until"])
+            commits = [
+                c
+                for c in commits
+                if _parse_date(c["commit"]["author"]["date"]) <= until
+            ]
+        return self.paginate(commits, query, path)
+
+    def paginate(self, items: list, query: dict, path: str):
+        """Slices a list like GitHub does, with `Link` next/last headers."""
+        per_page = int(query.get("per_page", 30))
+        page = int(query.get("page", 1))
+        last = max(1, -(-len(items) // per_page))
+        links = []
+        if page < last:
+            for rel, number in (("next", page + 1), ("last", last)):
+                url = f"{self.url}{path}?{urlencode({**query, 'page': number})}"
+                links.append(f'<{url}>; rel="{rel}"')
+        chunk = items[(page - 1) * per_page : page * per_page]
+        return 200, chunk, ", ".join(links) or None
+
+    def route_get(self, path: str, query: dict, params: dict | None = None):
+        """
+        Dispatches a GET; returns the route name and the response. `query`
+        has the first value of each parameter, `params` all of them.
+        """
+        parts = path.strip("/").split("/")
+        login = self.github["user"]["login"]
+
+        if parts == ["api", "developers"]:
+            return "backend:developers", self.backend_developers(query)
+        if parts == ["api", "search", "developers"]:
+            return "backend:search", self.backend_search(query, params or {})
+        if parts[:2] == ["api", "developers"] and len(parts) == 3:
+            return "backend:developer", self.backend_developer(unquote(parts[2]))
+        if parts == ["api", "developer-handles"]:
+            return "backend:developer-handles", self.backend_handles(query)
+        if parts == ["user"]:
+            return "github:user", (200, self.github["user"], None)
+        if parts[:1] == ["users"] and parts[2:] == ["repos"] and parts[1] == login:
+            return "github:repos", self.paginate(self.github["repos"], query, path)
+        if parts[:1] == ["repos"] and len(parts) == 4 and parts[1] == login:
+            if parts[3] == "languages":
+                languages = self.github["languages"].get(parts[2])
+                if languages is None:
+                    return "github:languages", (404, {"message": "Not Found"}, None)
+                return "github:languages", (200, languages, None)
+            if parts[3] == "commits":
+                return "github:commits", self.github_commits(parts[2], query, path)
+        return "unknown", (404, {"message": "Not Found"}, None)
+
+    def github_graphql(self, body: dict):
+        """
+        Answers the dashboard's GraphQL queries from the fixtures. Like
+        GitHub, the viewer's `repositories` also include a private repo and
+        an organization repo, which the public REST listing never shows,
+        unless the query leaves them out.
+        """
+        query, variables = body.get("query", ""), body.get("variables") or {}
+        user = self.github["user"]
+        if "$cursor" not in query:
+            viewer = {
+                "id": user["node_id"],
+                "login": user["login"],
+                "followers": {"totalCount": user["followers"]},
+                "following": {"totalCount": user["following"]},
+                "repositories": {"totalCount": user["public_repos"]},
+            }
+            return 200, {"data": {"viewer": viewer}}, None
+
+        template = self.github["repos"][0]
+        repos = list(self.github["repos"])
+        languages = dict(self.github["languages"])
+        if "privacy: PUBLIC" not in query:
+            repos.append({**template, "name": "private-notes", "private": True})
+            languages["private-notes"] = {"Haskell": 40960}
+        if "ORGANIZATION_MEMBER" in query:
+            repos.append({**template, "name": "org-monorepo"})
+            languages["org-monorepo"] = {"Go": 81920}
+
+        since = _parse_date(variables["since"])
+        start = int(variables.get("cursor") or 0)
+        nodes = []
+        for repo in repos[start : start + 100]:
+            commits = [
+                c
+                for c in self.github["commits"].get(repo["name"], [])
+                if c["author"]["login"] == user["login"]
+                and _parse_date(c["commit"]["author"]["date"]) >= since
+            ]
+            history = {
+                "totalCount": len(commits),
+                "nodes": [
+                    {
+                        "message": c["commit"]["message"],
+                        "committedDate": c["commit"]["author"]["date"],
+                    }
+                    for c in commits[:5]
+                ],
+            }
+            nodes.append(
+                {
+                    "name": repo["name"],
+                    "isFork": repo["fork"],
+                    "updatedAt": repo["updated_at"],
+                    "pushedAt": repo["pushed_at"],
+                    "languages": {
+                        "edges": [
+                            {"size": size, "node": {"name": name}}
+                            for name, size in languages.get(repo["name"], {}).items()
+                        ]
+                    },
+                    "defaultBranchRef": {"target": {"history": history}},
+                }
+            )
+        end = start + len(nodes)
+        page_info = {"hasNextPage": end < len(repos), "endCursor": str(end)}
+        repositories = {"pageInfo": page_info, "nodes": nodes}
+        return 200, {"data": {"viewer": {"repositories": repositories}}}, None
+
+    def backend_add_developer(self, body: dict):
+        now = datetime.now(timezone.utc).isoformat()
+        developer = {**body, "joined_at": now, "updated_at": now}
+        self.developers = [
+            d for d in self.developers if d["email"] != developer["email"]
+        ] + [developer]
+        return 200, {"success": True, "message": "Developer added successfully"}, None
+
+    def route_post(self, path: str, body: dict):
+        if path in ("/api/log", "/api/log/batch"):
+            return "backend:log", (200, {"status": "logged"}, None)
+        if path == "/api/developers":
+            return "backend:add-developer", self.backend_add_developer(body)
+        if path == "/graphql":
+            return "github:graphql", self.github_graphql(body)
+        return "unknown", (404, {"message": "Not Found"}, None)
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def respond(self, route: str, status: int, body, link: str | None):
+                stub.count(route)
+                if stub.latency:
+                    time.sleep(stub.latency)
+                payload = json.dumps(body).encode()
+                etag = f'"{hashlib.sha1(payload).hexdigest()}"'
+                if self.command == "GET" and self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.send_header("ETag", etag)
+                self.send_header("X-RateLimit-Remaining", "4999")
+                self.send_header("X-RateLimit-Reset", str(int(time.time()) + 3600))
+                if link:
+                    self.send_header("Link", link)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_GET(self):
+                url = urlsplit(self.path)
+                params = parse_qs(url.query)
+                query = {k: v[0] for k, v in params.items()}
+                route, response = stub.route_get(url.path, query, params)
+                self.respond(route, *response)
+
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length", 0))
+                body = json.loads(self.rfile.read(length) or b"{}")
+                route, response = stub.route_post(urlsplit(self.path).path, body)
+                self.respond(route, *response)
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the benchmark fixtures.")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = StubServer(args.port, args.latency_ms / 1000).start()
+    print(f"Serving fixtures on {server.url} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -4,14 +4,20 @@
 This __init__.py file makes the 'commands' directory a Python package
 and serves to expose individual command modules so they can be imported
 by the main application.
+
+The apps are resolved on first access, so importing one command module
+doesn't import all the others (and the libraries they depend on).
 """
 
+import importlib
 
-from .onboarding import onboarding_app
-from .show import show_app
-from .github_auth import github_auth_app
-from .dashboard import dashboard_app
-from .welcome import app
+_EXPORTS = {
+    "onboarding_app": ".onboarding",
+    "show_app": ".show",
+    "github_auth_app": ".github_auth",
+    "dashboard_app": ".dashboard",
+    "app": ".welcome",
+}
 
 __all__ = [
     "onboarding_app",
@@ -20,3 +26,9 @@ __all__ = [
     "dashboard_app",
     "app",
 ]
+
+
+def __getattr__(name: str):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,8 +2,11 @@
 
 """
 This module defines the `dashboard` command, providing insights into
-personal GitHub contributions and UDICTI organization activity.
+personal GitHub contributions (`dashboard me`). The organization and team
+views live in `dashboard_org.py` and `dashboard_team.py`, which are loaded
+only when their command runs and build on the helpers here.
 """
+
 import typer
 import httpx
 import asyncio
@@ -11,300 +14,1178 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
 from rich.columns import Columns
+from rich.console import Group
+from rich.live import Live
 import datetime
+import json
+import os
+import sys
+from enum import Enum
+from urllib.parse import quote
 
 # Import utilities - Updated imports
 from .github_auth import load_github_token, clear_github_token  # Updated function names
-from . import firebase
+from ..utils import api_request
+from .. import github_client, http_cache, profiling, snapshots
+from ..lazy import LazyCommand, LazyGroup
 
 console = Console()
-dashboard_app = typer.Typer(help="Display an overview of your current profile and progress in Github")
+# Messages for json/ndjson output, which keeps stdout for data
+err_console = Console(stderr=True)
+
+
+class DashboardGroup(LazyGroup):
+    """
+    The `dashboard` group. Subcommands listed in `lazy_commands` are only
+    imported when invoked; scripts/check_import_time.py checks their help.
+    """
+
+    lazy_commands = {
+        "org": LazyCommand(
+            "udicti_cli.commands.dashboard_org",
+            "org_app",
+            "Displays activity across every repository and member of the UDICTI "
+            "GitHub organization: commits per member, languages, the most active "
+            "repositories and recent work.",
+            group=False,
+        ),
+        "team": LazyCommand(
+            "udicti_cli.commands.dashboard_team",
+            "team_app",
+            "Computes the `dashboard me` stats for every registered UDICTI developer "
+            "in one concurrent run and shows them side by side.",
+            group=False,
+        ),
+    }
+
+
+dashboard_app = typer.Typer(
+    cls=DashboardGroup,
+    help="Display an overview of your current profile and progress in Github",
+)
+
+
+class Backend(str, Enum):
+    """Where the dashboard gets its GitHub data from."""
+
+    rest = "rest"
+    graphql = "graphql"
+
+
+class OutputFormat(str, Enum):
+    """How dashboard results are written out."""
+
+    table = "table"
+    json = "json"
+    ndjson = "ndjson"
 
-GITHUB_API_BASE_URL = "https://api.github.com"
-UDICTI_ORG_NAME = "udicti"
+
+# One page of the viewer's repositories with everything the dashboard needs.
+# Commit history is filtered by author and date on GitHub's side, so a single
+# paginated query replaces the 2 REST calls per repository. It covers the
+# same repositories as the REST path's `users/{login}/repos?type=all`: the
+# public ones the user owns or collaborates on, so both backends give the
+# same stats and can share snapshots.
+DASHBOARD_GRAPHQL_QUERY = """
+query($userId: ID!, $since: GitTimestamp!, $cursor: String) {
+  viewer {
+    repositories(
+      first: 100
+      after: $cursor
+      privacy: PUBLIC
+      ownerAffiliations: [OWNER, COLLABORATOR]
+      orderBy: {field: UPDATED_AT, direction: DESC}
+    ) {
+      pageInfo { hasNextPage endCursor }
+      nodes {
+        name
+        isFork
+        updatedAt
+        pushedAt
+        languages(first: 100) { edges { size node { name } } }
+        defaultBranchRef {
+          target {
+            ... on Commit {
+              history(first: 5, since: $since, author: {id: $userId}) {
+                totalCount
+                nodes { message committedDate }
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+DASHBOARD_GRAPHQL_VIEWER_QUERY = """
+query {
+  viewer {
+    id
+    login
+    followers { totalCount }
+    following { totalCount }
+    repositories(privacy: PUBLIC, ownerAffiliations: [OWNER]) { totalCount }
+  }
+}
+"""
 
 
 async def _make_github_api_request(endpoint: str, token: str, params: dict = None):
     """Helper to make authenticated GitHub API requests."""
-    headers = {
-        "Authorization": f"token {token}",  # OAuth tokens use same format
-        "Accept": "application/vnd.github.v3+json",
+    response = await github_client.aget(endpoint, token, params=params)
+    response.raise_for_status()
+    return response.json()
+
+
+def _parse_date(value: str) -> datetime.datetime:
+    """Parses a GitHub ISO-8601 timestamp into an aware datetime."""
+    return datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _one_year_ago(today: datetime.datetime) -> datetime.datetime:
+    """
+    Returns the start of the dashboard's one-year window. It is day-aligned
+    so the commits URL is stable between runs and stays cacheable.
+    """
+    return (today - datetime.timedelta(days=365)).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+
+
+def _recent_entry(repo_name: str, message: str, date: str) -> dict:
+    """Builds a "Recent Commits" entry, shortening long commit messages."""
+    return {
+        "repo": repo_name,
+        "message": message[:50] + "..." if len(message) > 50 else message,
+        "date": _parse_date(date),
     }
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            f"{GITHUB_API_BASE_URL}/{endpoint}",
-            headers=headers,
-            params=params,
-            timeout=20,
+
+
+async def _count_commits(endpoint: str, token: str, params: dict) -> int:
+    """
+    Counts the commits matching `params` without downloading them.
+
+    With `per_page=1` every page holds one commit, so the page number of the
+    `Link: rel="last"` URL is the exact total.
+    """
+    response = await github_client.aget(
+        endpoint, token, params={**params, "per_page": 1}
+    )
+    response.raise_for_status()
+    last_url = response.links.get("last", {}).get("url")
+    if last_url:
+        return int(httpx.URL(last_url).params["page"])
+    return len(response.json())
+
+
+async def _scan_commits(
+    repo_name: str, endpoint: str, token: str, params: dict, keep: int = 5
+) -> tuple[int, list[dict]]:
+    """
+    Counts the commits matching `params` on `endpoint`.
+
+    Only the first `keep` commits are downloaded, for "Recent Commits"; if
+    there are more than that, the total comes from `_count_commits`.
+
+    Returns:
+        The number of commits and "Recent Commits" entries for the first
+        `keep` of them (newest first).
+    """
+    if keep == 0:
+        return await _count_commits(endpoint, token, params), []
+
+    response = await github_client.aget(
+        endpoint, token, params={**params, "per_page": keep}
+    )
+    response.raise_for_status()
+    commits = response.json()
+    recent = [
+        _recent_entry(
+            repo_name, commit["commit"]["message"], commit["commit"]["author"]["date"]
         )
-        response.raise_for_status()
-        return response.json()
+        for commit in commits
+    ]
+    if "next" not in response.links:
+        return len(commits), recent
+    return await _count_commits(endpoint, token, params), recent
 
 
-# File: packages/cli/udicti_cli/commands/dashboard.py
+async def _analyze_repo(
+    repo: dict,
+    username: str,
+    token: str,
+    today: datetime.datetime,
+    previous: dict | None = None,
+    previous_window_start: datetime.datetime | None = None,
+) -> dict:
+    """
+    Fetches language and commit data for a single repository.
 
+    The `/languages` and `/commits` requests run concurrently with each other
+    and with other repositories, paced by the shared rate-limit scheduler.
+    Requests that still fail are counted as skipped rather than silently
+    dropped.
 
-async def _personal_dashboard_async():
-    """Async implementation of personal dashboard with accurate data."""
-    token = load_github_token()
-    if not token:
-        console.print(
-            Panel(
-                "[bold yellow]GitHub Login Required![/bold yellow]\n\n"
-                "Please run [bold green]udicti github-auth login[/bold green] to authenticate with GitHub.",
-                title="[bold yellow]Action Required[/bold yellow]",
-                border_style="yellow",
-                padding=(1, 2),
+    When `previous` stats from a snapshot are given, repositories that
+    haven't been pushed to since are not asked again: their languages and
+    commit count are reused, less the commits that fell out of the one-year
+    window since `previous_window_start`. A push means a full recount, as
+    it can bring in commits dated before the last run (e.g. a merged branch),
+    which a `since` filter on the commit date would miss.
+
+    Returns:
+        A dictionary with the repo name, whether it was recently active, its
+        language byte counts, its commit count for the last year, up to five
+        recent commits, its `pushed_at` and its commit sync watermark.
+    """
+    one_year_ago = _one_year_ago(today)
+    repo_updated = _parse_date(repo.get("updated_at"))
+    pushed_at = repo.get("pushed_at")
+    endpoint = f"repos/{username}/{repo['name']}"
+
+    stats = {
+        "name": repo["name"],
+        # Count active repos (updated in last 6 months)
+        "active": repo_updated >= (today - datetime.timedelta(days=180)),
+        "languages": {},
+        "commit_count": 0,
+        "recent": [],
+        "pushed_at": pushed_at,
+        "watermark": None,
+    }
+
+    # Languages and commits can only change when something is pushed
+    unchanged = previous is not None and previous["pushed_at"] == pushed_at
+
+    def forget_push():
+        # Stats that couldn't be refreshed stay keyed to the previous push,
+        # so the next run asks again instead of taking them as up to date
+        stats["pushed_at"] = previous["pushed_at"] if previous else None
+
+    async def fetch_languages():
+        if unchanged:
+            stats["languages"] = previous["languages"]
+            return
+        try:
+            stats["languages"] = await _make_github_api_request(
+                f"{endpoint}/languages", token
             )
+        except Exception:
+            # Skip if can't access repo languages, keeping any older numbers
+            github_client.scheduler.record_skip()
+            if previous:
+                stats["languages"] = previous["languages"]
+            forget_push()
+
+    async def fetch_commits():
+        params = {"author": username}
+        synced = previous is not None and previous["watermark"] is not None
+        try:
+            if not (unchanged and synced and previous_window_start is not None):
+                count, recent = await _scan_commits(
+                    repo["name"],
+                    f"{endpoint}/commits",
+                    token,
+                    {**params, "since": one_year_ago.isoformat()},
+                )
+            else:
+                count, recent = previous["commit_count"], previous["recent"]
+
+                # Expire commits that fell out of the one-year window
+                if count and one_year_ago > previous_window_start:
+                    expired, _ = await _scan_commits(
+                        repo["name"],
+                        f"{endpoint}/commits",
+                        token,
+                        {
+                            **params,
+                            "since": previous_window_start.isoformat(),
+                            "until": (
+                                one_year_ago - datetime.timedelta(seconds=1)
+                            ).isoformat(),
+                        },
+                        keep=0,
+                    )
+                    count = max(count - expired, 0)
+                recent = [e for e in recent if e["date"] >= one_year_ago][:5]
+        except Exception:
+            # Skip if can't access commits, keeping any older numbers
+            github_client.scheduler.record_skip()
+            if synced:
+                stats["commit_count"] = previous["commit_count"]
+                stats["recent"] = previous["recent"]
+                stats["watermark"] = previous["watermark"]
+            forget_push()
+            return
+
+        stats["commit_count"] = count
+        stats["recent"] = recent
+        stats["watermark"] = today.replace(microsecond=0).isoformat()
+
+    tasks = [fetch_languages()]
+    # Get commit count for recent repos
+    if repo_updated >= one_year_ago and not repo.get("fork", False):
+        tasks.append(fetch_commits())
+    await asyncio.gather(*tasks)
+
+    return stats
+
+
+async def _fetch_graphql_viewer(token: str) -> dict:
+    """
+    Fetches the viewer's profile via GraphQL, shaped like the REST `/user`
+    payload plus the node `id` needed to filter commit history by author.
+    """
+    viewer = (await github_client.agraphql(DASHBOARD_GRAPHQL_VIEWER_QUERY, token))[
+        "viewer"
+    ]
+    return {
+        "id": viewer["id"],
+        "login": viewer["login"],
+        "public_repos": viewer["repositories"]["totalCount"],
+        "followers": viewer["followers"]["totalCount"],
+        "following": viewer["following"]["totalCount"],
+    }
+
+
+async def _iter_graphql_repo_stats(token: str, user_id: str, today: datetime.datetime):
+    """
+    Streams per-repository stats via GraphQL, one page of up to 100
+    repositories per query.
+
+    Yields lists of the same `_analyze_repo`-style dictionaries as the REST
+    path, so aggregation and rendering are shared.
+    """
+    one_year_ago = _one_year_ago(today)
+    cursor = None
+    while True:
+        data = await github_client.agraphql(
+            DASHBOARD_GRAPHQL_QUERY,
+            token,
+            {
+                "userId": user_id,
+                "since": one_year_ago.isoformat(),
+                "cursor": cursor,
+            },
         )
-        raise typer.Exit(code=1)
+        repositories = data["viewer"]["repositories"]
 
-    console.print("[bold cyan]📊 Analyzing your developer activity...[/bold cyan]")
+        page = []
+        for repo in repositories["nodes"]:
+            repo_updated = _parse_date(repo["updatedAt"])
+            stats = {
+                "name": repo["name"],
+                "active": repo_updated >= (today - datetime.timedelta(days=180)),
+                "languages": {
+                    edge["node"]["name"]: edge["size"]
+                    for edge in repo["languages"]["edges"]
+                },
+                "commit_count": 0,
+                "recent": [],
+                "pushed_at": repo["pushedAt"],
+                "watermark": None,
+            }
 
-    try:
-        # 1. Get authenticated user's profile
-        user_data = await _make_github_api_request("user", token)
-        username = user_data.get("login")
-        public_repos = user_data.get("public_repos", 0)
-        followers = user_data.get("followers", 0)
-        following = user_data.get("following", 0)
-
-        # 2. Get UDICTI profile info
-        udicti_name = username
-        udicti_interests = []
-        udicti_skills = []
+            # Same rule as the REST path: only non-fork repos touched this year
+            target = (repo.get("defaultBranchRef") or {}).get("target") or {}
+            history = target.get("history")
+            if history and repo_updated >= one_year_ago and not repo["isFork"]:
+                stats["commit_count"] = history["totalCount"]
+                stats["recent"] = [
+                    _recent_entry(repo["name"], node["message"], node["committedDate"])
+                    for node in history["nodes"]
+                ]
+                stats["watermark"] = today.replace(microsecond=0).isoformat()
 
-        try:
-            from ..main import FIREBASE_CONFIG
-
-            firebase.init_firebase(FIREBASE_CONFIG)
-
-            registered_developers = firebase.get_developers()
-            for dev in registered_developers:
-                if dev.get("github", "").lower() == username.lower():
-                    udicti_name = dev.get("name", username)
-                    udicti_interests = dev.get("interests", [])
-                    udicti_skills = dev.get("skills", [])
-                    break
-        except Exception as e:
-            console.print(f"[dim red]⚠️  Could not fetch UDICTI profile: {e}[/dim red]")
-
-        # 3. Get comprehensive repository data (more accurate than events)
-        repos = await _make_github_api_request(
+            page.append(stats)
+        yield page
+
+        if not repositories["pageInfo"]["hasNextPage"]:
+            break
+        cursor = repositories["pageInfo"]["endCursor"]
+
+
+def _fetch_udicti_profile(username: str) -> dict:
+    """
+    Looks up the developer's UDICTI profile by GitHub username, with the
+    backend's single-developer lookup rather than fetching the whole roster.
+
+    Returns:
+        A dictionary with `name`, `interests` and `skills`, defaulting to the
+        GitHub username and empty lists if no profile is found.
+    """
+    profile = {"name": username, "interests": [], "skills": []}
+    # api_request reports connection errors itself and returns None; users
+    # who haven't joined are a 404, which isn't an error here. The profile
+    # is only a greeting, so it isn't worth retrying while the user waits.
+    result = (
+        api_request(
+            f"developers/{quote(username, safe='')}", missing_ok=True, retry=False
+        )
+        or {}
+    )
+    dev = result.get("developer")
+    if dev:
+        profile["name"] = dev.get("name", username)
+        profile["interests"] = dev.get("interests", [])
+        profile["skills"] = dev.get("skills", [])
+    return profile
+
+
+async def _analyze_user_repos(
+    username: str,
+    token: str,
+    today: datetime.datetime,
+    snapshot: dict | None = None,
+    on_repo_done=None,
+    on_listed=None,
+) -> list[dict]:
+    """
+    Analyzes every repository of a GitHub user with `_analyze_repo`.
+
+    Repositories are streamed page by page and each one is analyzed as soon
+    as its page arrives; the shared scheduler bounds in-flight requests.
+
+    Args:
+        snapshot: The user's last saved snapshot, to refresh incrementally.
+        on_repo_done: Optional callback, called with each finished task and
+            the list of all tasks so far (in repository order).
+        on_listed: Optional callback, called with the number of repositories
+            listed so far and whether the listing is finished.
+
+    Returns:
+        The per-repository stats, in repository order.
+    """
+    previous_repos = snapshot["repos"] if snapshot else {}
+    previous_window_start = snapshot["window_start"] if snapshot else None
+
+    tasks = []
+    try:
+        async for repos in github_client.apaginate(
             f"users/{username}/repos",
             token,
             params={"type": "all", "per_page": 100, "sort": "updated"},
-        )
+        ):
+            for repo in repos:
+                task = asyncio.create_task(
+                    _analyze_repo(
+                        repo,
+                        username,
+                        token,
+                        today,
+                        previous_repos.get(repo["name"]),
+                        previous_window_start,
+                    )
+                )
+                if on_repo_done is not None:
+                    task.add_done_callback(
+                        lambda done_task: on_repo_done(done_task, tasks)
+                    )
+                tasks.append(task)
+            if on_listed is not None:
+                on_listed(len(tasks), False)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+    if on_listed is not None:
+        on_listed(len(tasks), True)
+    return list(await asyncio.gather(*tasks))
 
-        # 4. Get contribution statistics (last year)
-        today = datetime.datetime.now(datetime.timezone.utc)
-        one_year_ago = today - datetime.timedelta(days=365)
 
-        # Analyze repositories for accurate stats
-        total_commits = 0
-        languages_used = {}
-        recent_activity = []
-        active_repos = 0
+async def _collect_dashboard(
+    token: str,
+    today: datetime.datetime,
+    backend: Backend = Backend.rest,
+    use_snapshot: bool = True,
+    on_update=None,
+    on_repo=None,
+    out: Console = console,
+) -> dict:
+    """
+    Collects everything the personal dashboard shows.
+
+    Args:
+        token: The GitHub OAuth token.
+        today: The current time, which the one-year window is relative to.
+        backend: Whether to collect data through the REST or GraphQL API.
+            GraphQL falls back to REST if a query fails.
+        use_snapshot: Whether to refresh incrementally from the last saved
+            snapshot instead of recomputing the whole year.
+        on_update: Optional callback, called with the partial result as soon
+            as the profile is known and again as repositories are analyzed.
+        on_repo: Optional callback, called with each repository's stats as
+            soon as they are computed (in completion order).
+        out: The console to print warnings on.
 
-        for repo in repos:
-            repo_updated = datetime.datetime.fromisoformat(
-                repo.get("updated_at").replace("Z", "+00:00")
+    Returns:
+        A dictionary with the GitHub `user` profile, the `udicti` profile,
+        the per-repository `repo_stats` (in repository order), and the
+        `repos_done`/`repos_listed` progress counters.
+    """
+    result = {
+        "user": None,
+        "udicti": None,
+        "repo_stats": [],
+        "repos_done": 0,
+        "repos_listed": 0,
+        "listing_done": False,
+    }
+
+    def notify():
+        if on_update is not None:
+            on_update(result)
+
+    use_graphql = backend == Backend.graphql
+    if use_graphql:
+        try:
+            result["user"] = await _fetch_graphql_viewer(token)
+        except (github_client.GraphQLError, httpx.HTTPError) as e:
+            out.print(
+                f"[dim yellow]⚠️  GraphQL query failed ({e}), using REST instead.[/dim yellow]"
             )
+            use_graphql = False
 
-            # Count active repos (updated in last 6 months)
-            if repo_updated >= (today - datetime.timedelta(days=180)):
-                active_repos += 1
+    # 1. Get authenticated user's profile
+    if result["user"] is None:
+        result["user"] = await _make_github_api_request("user", token)
+    username = result["user"].get("login")
+    notify()
 
-            # Get languages for each repo
+    # 2. Get UDICTI profile info while the GitHub requests below run
+    async def fetch_udicti_profile():
+        result["udicti"] = await asyncio.to_thread(_fetch_udicti_profile, username)
+        notify()
+
+    udicti_task = asyncio.create_task(fetch_udicti_profile())
+
+    try:
+        repo_stats = None
+        if use_graphql:
             try:
-                repo_languages = await _make_github_api_request(
-                    f"repos/{username}/{repo['name']}/languages", token
+                repo_stats = []
+                async for page in _iter_graphql_repo_stats(
+                    token, result["user"]["id"], today
+                ):
+                    repo_stats.extend(page)
+                    if on_repo is not None:
+                        for stats in page:
+                            on_repo(stats)
+                    result["repo_stats"] = list(repo_stats)
+                    result["repos_done"] = result["repos_listed"] = len(repo_stats)
+                    notify()
+            except (github_client.GraphQLError, httpx.HTTPError) as e:
+                out.print(
+                    f"[dim yellow]⚠️  GraphQL query failed ({e}), using REST instead.[/dim yellow]"
                 )
-                for lang, bytes_count in repo_languages.items():
-                    languages_used[lang] = languages_used.get(lang, 0) + bytes_count
-            except Exception:
-                pass  # Skip if can't access repo languages
-
-            # Get commit count for recent repos
-            if repo_updated >= one_year_ago and not repo.get("fork", False):
-                try:
-                    commits = await _make_github_api_request(
-                        f"repos/{username}/{repo['name']}/commits",
-                        token,
-                        params={
-                            "author": username,
-                            "since": one_year_ago.isoformat(),
-                            "per_page": 100,
-                        },
-                    )
-                    total_commits += len(commits)
-
-                    # Track recent activity
-                    for commit in commits[:5]:  # Last 5 commits from this repo
-                        commit_date = datetime.datetime.fromisoformat(
-                            commit["commit"]["author"]["date"].replace("Z", "+00:00")
-                        )
-                        recent_activity.append(
-                            {
-                                "repo": repo["name"],
-                                "message": (
-                                    commit["commit"]["message"][:50] + "..."
-                                    if len(commit["commit"]["message"]) > 50
-                                    else commit["commit"]["message"]
-                                ),
-                                "date": commit_date,
-                            }
-                        )
-                except Exception:
-                    pass  # Skip if can't access commits
-
-        # Sort recent activity by date
-        recent_activity.sort(key=lambda x: x["date"], reverse=True)
-        recent_activity = recent_activity[:10]  # Keep only last 10 commits
-
-        # 5. Calculate top languages (by bytes of code)
-        total_bytes = sum(languages_used.values())
-        top_languages = []
-        if total_bytes > 0:
-            sorted_languages = sorted(
-                languages_used.items(), key=lambda x: x[1], reverse=True
+                repo_stats = None
+
+        if repo_stats is None:
+            # 3. Get comprehensive repository data (more accurate than events)
+            # and 4. contribution statistics (last year)
+            snapshot = snapshots.load_snapshot(username) if use_snapshot else None
+
+            def on_repo_done(done_task, tasks):
+                if on_repo is not None and not done_task.cancelled():
+                    if not done_task.exception():
+                        on_repo(done_task.result())
+                # Partial results stay in repository order, like the final ones
+                result["repo_stats"] = [
+                    task.result()
+                    for task in tasks
+                    if task.done() and not task.cancelled() and not task.exception()
+                ]
+                result["repos_done"] = len(result["repo_stats"])
+                notify()
+
+            def on_listed(listed, finished):
+                result["repos_listed"] = listed
+                result["listing_done"] = finished
+                notify()
+
+            repo_stats = await _analyze_user_repos(
+                username, token, today, snapshot, on_repo_done, on_listed
             )
-            for lang, bytes_count in sorted_languages[:5]:
-                percentage = (bytes_count / total_bytes) * 100
-                top_languages.append((lang, percentage))
 
-        # 6. Create improved UI with accurate data
+        await udicti_task
+    finally:
+        if not udicti_task.done():
+            udicti_task.cancel()
+
+    result["repo_stats"] = repo_stats
+    result["repos_done"] = result["repos_listed"] = len(repo_stats)
+    result["listing_done"] = True
+    snapshots.save_snapshot(
+        username,
+        _one_year_ago(today),
+        repo_stats,
+        user=result["user"],
+        udicti=result["udicti"],
+        token=token,
+    )
+    return result
 
-        # Profile Overview Panel
 
-        profile_content = Text.from_markup(
-            f"[bold green]👋 Hello, [bold white]{udicti_name}[/bold white]![/bold green]\n\n"
-            f"[dim]GitHub:[/dim] [bold cyan]@{username}[/bold cyan] [dim] [/dim]\n"
-            f"[dim]Repositories:[/dim] [bold white]{public_repos}[/bold white] public • [bold white]{active_repos}[/bold white] recently active\n"
-            f"[dim]Network:[/dim] [bold white]{followers}[/bold white] followers • [bold white]{following}[/bold white] following\n\n"
-            f"[dim]UDICTI Interests:[/dim] [italic blue]{', '.join(udicti_interests) if udicti_interests else 'Not specified'}[/italic blue]\n"
-            f"[dim]Skills:[/dim] [italic green]{', '.join(udicti_skills) if udicti_skills else 'Not specified'}[/italic green]"
+def _summarize(repo_stats: list[dict]) -> dict:
+    """
+    Aggregates per-repository stats into the dashboard totals.
+
+    Stats are merged in the order given, so totals and tie-breaks are the
+    same however the repositories were fetched.
+    """
+    total_commits = 0
+    languages_used = {}
+    recent_activity = []
+    active_repos = 0
+
+    for stats in repo_stats:
+        if stats["active"]:
+            active_repos += 1
+        for lang, bytes_count in stats["languages"].items():
+            languages_used[lang] = languages_used.get(lang, 0) + bytes_count
+        total_commits += stats["commit_count"]
+        recent_activity.extend(stats["recent"])
+
+    # Sort recent activity by date
+    recent_activity.sort(key=lambda x: x["date"], reverse=True)
+    recent_activity = recent_activity[:10]  # Keep only last 10 commits
+
+    # Calculate top languages (by bytes of code)
+    total_bytes = sum(languages_used.values())
+    top_languages = []
+    if total_bytes > 0:
+        sorted_languages = sorted(
+            languages_used.items(), key=lambda x: x[1], reverse=True
         )
+        for lang, bytes_count in sorted_languages[:5]:
+            percentage = (bytes_count / total_bytes) * 100
+            top_languages.append((lang, percentage))
+
+    return {
+        "total_commits": total_commits,
+        "languages_used": languages_used,
+        "recent_activity": recent_activity,
+        "active_repos": active_repos,
+        "top_languages": top_languages,
+    }
 
-        profile_panel = Panel(
-            profile_content,
-            title="[bold white]📊 Developer Profile[/bold white]",
-            border_style="blue",
-            padding=(1, 2),
+
+def _profile_panel(user_data: dict, udicti_profile: dict | None, summary: dict):
+    """Builds the Developer Profile panel."""
+    username = user_data.get("login")
+    public_repos = user_data.get("public_repos", 0)
+    followers = user_data.get("followers", 0)
+    following = user_data.get("following", 0)
+
+    if udicti_profile is None:
+        # Still being looked up
+        udicti_name = username
+        interests_display = skills_display = "Loading..."
+    else:
+        udicti_name = udicti_profile["name"]
+        interests_display = (
+            ", ".join(udicti_profile["interests"])
+            if udicti_profile["interests"]
+            else "Not specified"
         )
+        skills_display = (
+            ", ".join(udicti_profile["skills"])
+            if udicti_profile["skills"]
+            else "Not specified"
+        )
+
+    profile_content = Text.from_markup(
+        f"[bold green]👋 Hello, [bold white]{udicti_name}[/bold white]![/bold green]\n\n"
+        f"[dim]GitHub:[/dim] [bold cyan]@{username}[/bold cyan] [dim] [/dim]\n"
+        f"[dim]Repositories:[/dim] [bold white]{public_repos}[/bold white] public • [bold white]{summary['active_repos']}[/bold white] recently active\n"
+        f"[dim]Network:[/dim] [bold white]{followers}[/bold white] followers • [bold white]{following}[/bold white] following\n\n"
+        f"[dim]UDICTI Interests:[/dim] [italic blue]{interests_display}[/italic blue]\n"
+        f"[dim]Skills:[/dim] [italic green]{skills_display}[/italic green]"
+    )
+
+    return Panel(
+        profile_content,
+        title="[bold white]📊 Developer Profile[/bold white]",
+        border_style="blue",
+        padding=(1, 2),
+    )
+
+
+def _activity_panel(summary: dict):
+    """Builds the Activity Stats panel."""
+    total_commits = summary["total_commits"]
+    activity_content = Text.from_markup(
+        f"[bold magenta]📈 Activity Overview (Last Year):[/bold magenta]\n\n"
+        f"[dim]Total Commits:[/dim] [bold white]{total_commits}[/bold white]\n"
+        f"[dim]Active Repositories:[/dim] [bold white]{summary['active_repos']}[/bold white]\n"
+        f"[dim]Languages Used:[/dim] [bold white]{len(summary['languages_used'])}[/bold white]\n"
+        f"[dim]Avg Commits/Month:[/dim] [bold white]{total_commits // 12}[/bold white]"
+    )
+
+    return Panel(
+        activity_content,
+        title="[bold white]📊 Activity Stats[/bold white]",
+        border_style="green",
+        padding=(1, 2),
+    )
+
+
+def _languages_panel(summary: dict):
+    """Builds the Language Usage panel."""
+    if summary["top_languages"]:
+        lang_lines = ["[bold yellow]🔥 Top Programming Languages:[/bold yellow]\n"]
+        max_bar_length = 25
+
+        for lang, percentage in summary["top_languages"]:
+            bar_length = int((percentage / 100) * max_bar_length)
+            bar = "█" * bar_length
+            lang_lines.append(
+                f"[dim]{lang:12}[/dim] [cyan]{bar}[/cyan] [bold white]{percentage:.1f}%[/bold white]"
+            )
+
+        languages_content = Text.from_markup("\n".join(lang_lines))
+    else:
+        languages_content = Text.from_markup("[dim]No language data available[/dim]")
+
+    return Panel(
+        languages_content,
+        title="[bold white]💻 Language Usage[/bold white]",
+        border_style="yellow",
+        padding=(1, 2),
+    )
+
+
+def _recent_panel(summary: dict, today: datetime.datetime):
+    """Builds the Recent Work panel."""
+    if summary["recent_activity"]:
+        activity_lines = ["[bold cyan]⚡ Recent Commits:[/bold cyan]\n"]
+        for activity in summary["recent_activity"][:8]:
+            days_ago = (today - activity["date"]).days
+            time_str = f"{days_ago}d ago" if days_ago > 0 else "today"
+            activity_lines.append(
+                f"[dim]{activity['repo']}[/dim] • {activity['message']} [dim]({time_str})[/dim]"
+            )
 
-        # Activity Stats Panel
-        activity_content = Text.from_markup(
-            f"[bold magenta]📈 Activity Overview (Last Year):[/bold magenta]\n\n"
-            f"[dim]Total Commits:[/dim] [bold white]{total_commits}[/bold white]\n"
-            f"[dim]Active Repositories:[/dim] [bold white]{active_repos}[/bold white]\n"
-            f"[dim]Languages Used:[/dim] [bold white]{len(languages_used)}[/bold white]\n"
-            f"[dim]Avg Commits/Month:[/dim] [bold white]{total_commits // 12}[/bold white]"
+        recent_content = Text.from_markup("\n".join(activity_lines))
+    else:
+        recent_content = Text.from_markup("[dim]No recent activity found[/dim]")
+
+    return Panel(
+        recent_content,
+        title="[bold white]🚀 Recent Work[/bold white]",
+        border_style="cyan",
+        padding=(1, 2),
+    )
+
+
+def _insights_panel(summary: dict):
+    """Builds the Growth Suggestions panel, or returns None if there are none."""
+    insights = []
+    if summary["total_commits"] < 50:
+        insights.append(
+            "💡 Try to commit more regularly - aim for small, frequent commits!"
+        )
+    if len(summary["languages_used"]) < 3:
+        insights.append(
+            "🌟 Consider exploring new programming languages to broaden your skills!"
         )
+    if summary["active_repos"] < 3:
+        insights.append("🚀 Start more projects or contribute to existing ones!")
 
-        activity_panel = Panel(
-            activity_content,
-            title="[bold white]📊 Activity Stats[/bold white]",
-            border_style="green",
-            padding=(1, 2),
+    if not insights:
+        return None
+
+    return Panel(
+        Text.from_markup("\n".join(insights)),
+        title="[bold white]💭 Growth Suggestions[/bold white]",
+        border_style="magenta",
+        padding=(1, 2),
+    )
+
+
+def _render_dashboard(result: dict, today: datetime.datetime):
+    """Renders the complete dashboard from a collection result."""
+    summary = _summarize(result["repo_stats"])
+    renderables = [
+        _profile_panel(result["user"], result["udicti"], summary),
+        # Two column layout for stats
+        Columns([_activity_panel(summary), _languages_panel(summary)], expand=True),
+        _recent_panel(summary, today),
+    ]
+    # Add some actionable insights
+    insights_panel = _insights_panel(summary)
+    if insights_panel is not None:
+        renderables.append(insights_panel)
+    return Group(*renderables)
+
+
+def _progress_line(result: dict) -> str:
+    """Describes how far the repository analysis has got."""
+    listed = f"{result['repos_listed']}{'' if result['listing_done'] else '+'}"
+    return f"Analyzed {result['repos_done']} of {listed} repositories..."
+
+
+def _render_progress(result: dict, today: datetime.datetime):
+    """Renders the in-progress dashboard from a partial collection result."""
+    summary = _summarize(result["repo_stats"])
+    return Group(
+        _profile_panel(result["user"], result["udicti"], summary),
+        Columns([_activity_panel(summary), _languages_panel(summary)], expand=True),
+        _recent_panel(summary, today),
+        Text.from_markup(f"[dim]⏳ {_progress_line(result)}[/dim]"),
+    )
+
+
+def _stale_result(snapshot: dict) -> dict:
+    """Turns a saved snapshot back into a collection result."""
+    return {
+        "user": snapshot["user"],
+        "udicti": snapshot["udicti"],
+        "repo_stats": list(snapshot["repos"].values()),
+    }
+
+
+def _as_of(saved_at: datetime.datetime, today: datetime.datetime) -> str:
+    """Describes when a saved result is from, e.g. `2025-03-01 14:05 (3h ago)`."""
+    age = int((today - saved_at).total_seconds())
+    if age < 3600:
+        ago = f"{max(age // 60, 0)}m ago"
+    elif age < 86400:
+        ago = f"{age // 3600}h ago"
+    else:
+        ago = f"{age // 86400}d ago"
+    local_time = saved_at.astimezone().strftime("%Y-%m-%d %H:%M")
+    return f"{local_time} ({ago})"
+
+
+def _json_default(value):
+    """Serializes the datetimes found in dashboard results."""
+    if isinstance(value, datetime.datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _write_record(record: dict, indent: int | None = None):
+    """Writes one JSON document to stdout directly, without going through Rich."""
+    try:
+        sys.stdout.write(
+            json.dumps(record, default=_json_default, indent=indent) + "\n"
         )
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # The reader went away (e.g. `| head`): send the rest to /dev/null
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
 
-        # Language Distribution Panel
-        if top_languages:
-            lang_lines = ["[bold yellow]🔥 Top Programming Languages:[/bold yellow]\n"]
-            max_bar_length = 25
 
-            for lang, percentage in top_languages:
-                bar_length = int((percentage / 100) * max_bar_length)
-                bar = "█" * bar_length
-                lang_lines.append(
-                    f"[dim]{lang:12}[/dim] [cyan]{bar}[/cyan] [bold white]{percentage:.1f}%[/bold white]"
-                )
+def _repo_record(stats: dict) -> dict:
+    """Returns the public fields of a repository's stats."""
+    return {key: value for key, value in stats.items() if key != "watermark"}
 
-            languages_content = Text.from_markup("\n".join(lang_lines))
-        else:
-            languages_content = Text.from_markup(
-                "[dim]No language data available[/dim]"
-            )
 
-        languages_panel = Panel(
-            languages_content,
-            title="[bold white]💻 Language Usage[/bold white]",
-            border_style="yellow",
-            padding=(1, 2),
+def _write_repo_record(stats: dict):
+    """Streams one repository as an NDJSON `repo` record."""
+    _write_record({"type": "repo", **_repo_record(stats)})
+
+
+def _summary_record(summary: dict) -> dict:
+    """Returns the totals shared by the personal and org JSON outputs."""
+    return {
+        "total_commits": summary["total_commits"],
+        "active_repos": summary["active_repos"],
+        "languages": summary["languages_used"],
+        "top_languages": [
+            {"language": lang, "percentage": round(percentage, 2)}
+            for lang, percentage in summary["top_languages"]
+        ],
+        "recent_activity": summary["recent_activity"],
+    }
+
+
+def _personal_record(
+    result: dict, summary: dict, as_of: datetime.datetime, stale: bool = False
+) -> dict:
+    """Builds the machine-readable summary of a personal dashboard."""
+    user = result["user"]
+    return {
+        "as_of": as_of,
+        "stale": stale,
+        "user": {
+            "login": user.get("login"),
+            "public_repos": user.get("public_repos", 0),
+            "followers": user.get("followers", 0),
+            "following": user.get("following", 0),
+        },
+        "udicti": result["udicti"],
+        **_summary_record(summary),
+        "skipped_requests": github_client.scheduler.skipped,
+    }
+
+
+def _write_personal_records(
+    result: dict,
+    output_format: OutputFormat,
+    as_of: datetime.datetime,
+    stale: bool = False,
+    streamed: bool = False,
+):
+    """
+    Writes a personal dashboard as JSON or NDJSON.
+
+    Args:
+        streamed: Whether the NDJSON repo records were already written while
+            collecting, so only the summary record is left.
+    """
+    record = _personal_record(result, _summarize(result["repo_stats"]), as_of, stale)
+    if output_format == OutputFormat.json:
+        record["repos"] = [_repo_record(stats) for stats in result["repo_stats"]]
+        _write_record(record, indent=2)
+        return
+    if not streamed:
+        for stats in result["repo_stats"]:
+            _write_repo_record(stats)
+    _write_record({"type": "summary", **record})
+
+
+def _is_unreachable(error: httpx.HTTPError) -> bool:
+    """Whether an error means GitHub can't be reached, rather than refused us."""
+    if isinstance(error, httpx.HTTPStatusError):
+        return error.response.status_code >= 500
+    return isinstance(error, httpx.TransportError)
+
+
+def _require_token(out: Console = console) -> str:
+    """
+    Returns the stored GitHub token, or exits asking the user to log in.
+
+    Args:
+        out: The console to ask on.
+    """
+    token = load_github_token()
+    if not token:
+        out.print(
+            Panel(
+                "[bold yellow]GitHub Login Required![/bold yellow]\n\n"
+                "Please run [bold green]udicti github-auth login[/bold green] to authenticate with GitHub.",
+                title="[bold yellow]Action Required[/bold yellow]",
+                border_style="yellow",
+                padding=(1, 2),
+            )
         )
+        raise typer.Exit(code=1)
+    return token
 
-        # Recent Activity Panel
-        if recent_activity:
-            activity_lines = ["[bold cyan]⚡ Recent Commits:[/bold cyan]\n"]
-            for activity in recent_activity[:8]:
-                days_ago = (today - activity["date"]).days
-                time_str = f"{days_ago}d ago" if days_ago > 0 else "today"
-                activity_lines.append(
-                    f"[dim]{activity['repo']}[/dim] • {activity['message']} [dim]({time_str})[/dim]"
-                )
 
-            recent_content = Text.from_markup("\n".join(activity_lines))
-        else:
-            recent_content = Text.from_markup("[dim]No recent activity found[/dim]")
+async def _personal_dashboard_async(
+    concurrency: int = 16,
+    backend: Backend = Backend.rest,
+    use_snapshot: bool = True,
+    output_format: OutputFormat = OutputFormat.table,
+    offline: bool = False,
+):
+    """
+    Async implementation of personal dashboard with accurate data.
+
+    The dashboard last saved with the current login is shown right away,
+    marked with when it is from, while fresh data is collected; without one, the profile panel is
+    shown as soon as GitHub returns it and the other panels fill in live from
+    partial results. If GitHub can't be reached, the saved dashboard is kept.
+    The `json` and `ndjson` formats skip rendering entirely: `json` writes
+    one document at the end, `ndjson` streams a record per repository as it
+    is computed followed by a summary record.
+
+    Args:
+        concurrency: The maximum number of GitHub requests in flight at once.
+        backend: Whether to collect data through the REST or GraphQL API.
+            GraphQL falls back to REST if the query fails.
+        use_snapshot: Whether to refresh incrementally from the last saved
+            snapshot instead of recomputing the whole year.
+        output_format: Whether to render panels or write JSON/NDJSON.
+        offline: Whether to only show the last saved dashboard, without
+            touching the network.
+    """
+    machine_output = output_format != OutputFormat.table
+    # Keep stdout for data; warnings and errors still reach the user
+    out = err_console if machine_output else console
+
+    # The saved dashboard is only shown to the login that saved it, so the
+    # token is needed even offline (reading it doesn't touch the network)
+    token = _require_token(out)
+    today = datetime.datetime.now(datetime.timezone.utc)
+    saved = snapshots.load_token_snapshot(token)
+    if saved is not None and saved.get("user") is None:
+        saved = None  # Saved before profiles were kept alongside the stats
 
-        recent_panel = Panel(
-            recent_content,
-            title="[bold white]🚀 Recent Work[/bold white]",
-            border_style="cyan",
-            padding=(1, 2),
+    def show_saved(reason: str):
+        if machine_output:
+            _write_personal_records(
+                _stale_result(saved), output_format, saved["saved_at"], stale=True
+            )
+        else:
+            console.print(_render_dashboard(_stale_result(saved), today))
+        out.print(
+            f"[yellow]🕒 {reason}; showing your dashboard as of "
+            f"{_as_of(saved['saved_at'], today)}.[/yellow]"
         )
 
-        # Display all panels
-        console.print(profile_panel)
+    if offline:
+        if saved is None:
+            out.print(
+                "[bold red]❌ No saved dashboard for this login yet.[/bold red] Run "
+                "[bold green]udicti dashboard me[/bold green] once while online."
+            )
+            raise typer.Exit(code=1)
+        show_saved("Offline")
+        return
 
-        # Two column layout for stats
-        columns = Columns([activity_panel, languages_panel], expand=True)
-        console.print(columns)
+    github_client.scheduler.max_concurrency = concurrency
+    # Repo records already streamed as NDJSON; stale ones mustn't follow them
+    streamed_records = 0
 
-        console.print(recent_panel)
+    def write_repo_record(stats: dict):
+        nonlocal streamed_records
+        _write_repo_record(stats)
+        streamed_records += 1
 
-        # Add some actionable insights
-        insights = []
-        if total_commits < 50:
-            insights.append(
-                "💡 Try to commit more regularly - aim for small, frequent commits!"
+    try:
+        if machine_output:
+            streaming = output_format == OutputFormat.ndjson
+            result = await _collect_dashboard(
+                token,
+                today,
+                backend,
+                use_snapshot,
+                on_repo=write_repo_record if streaming else None,
+                out=out,
             )
-        if len(languages_used) < 3:
-            insights.append(
-                "🌟 Consider exploring new programming languages to broaden your skills!"
+            _write_personal_records(result, output_format, today, streamed=streaming)
+            return
+
+        console.print("[bold cyan]📊 Analyzing your developer activity...[/bold cyan]")
+
+        # The live view is transient: once everything is in, it is replaced
+        # by the final panels printed normally (and only those reach a
+        # pipe/file)
+        live = Live(console=console, refresh_per_second=8, transient=True)
+        saved_view = None
+        if saved is not None:
+            saved_view = _render_dashboard(_stale_result(saved), today)
+            as_of = _as_of(saved["saved_at"], today)
+
+        def on_update(result):
+            if saved_view is None:
+                live.update(_render_progress(result, today))
+            else:
+                # Keep the saved dashboard up until the fresh one is complete
+                live.update(
+                    Group(
+                        saved_view,
+                        Text.from_markup(
+                            f"[dim]🕒 As of {as_of}. Refreshing: "
+                            f"{_progress_line(result)}[/dim]"
+                        ),
+                    )
+                )
+            live.start()
+
+        if saved_view is not None:
+            live.update(
+                Group(
+                    saved_view,
+                    Text.from_markup(f"[dim]🕒 As of {as_of}. Refreshing...[/dim]"),
+                )
             )
-        if active_repos < 3:
-            insights.append("🚀 Start more projects or contribute to existing ones!")
-
-        if insights:
-            insights_content = Text.from_markup("\n".join(insights))
-            insights_panel = Panel(
-                insights_content,
-                title="[bold white]💭 Growth Suggestions[/bold white]",
-                border_style="magenta",
-                padding=(1, 2),
+            live.start()
+
+        try:
+            result = await _collect_dashboard(
+                token, today, backend, use_snapshot, on_update=on_update
             )
-            console.print(insights_panel)
+        finally:
+            live.stop()
 
-    except httpx.HTTPStatusError as e:
-        console.print(
-            f"[bold red]❌ Error accessing GitHub API: {e.response.status_code}[/bold red]"
-        )
-        console.print(
-            "[yellow]💡 Tip:[/yellow] Your token might be invalid. Try [bold green]udicti github-auth login[/bold green] again."
-        )
-        clear_github_token()
+        # Display all panels
+        with profiling.span("render", "dashboard me"):
+            console.print(_render_dashboard(result, today))
+
+        if github_client.scheduler.skipped:
+            console.print(
+                f"[dim yellow]⚠️  {github_client.scheduler.skipped} GitHub request(s) "
+                "failed or were rate limited; some numbers may be incomplete.[/dim yellow]"
+            )
+
+    except httpx.HTTPError as e:
+        if _is_unreachable(e) and saved is not None and not streamed_records:
+            show_saved(f"Could not reach GitHub ({e})")
+            return
+        if isinstance(e, httpx.HTTPStatusError):
+            out.print(
+                f"[bold red]❌ Error accessing GitHub API: {e.response.status_code}[/bold red]"
+            )
+        else:
+            out.print(f"[bold red]❌ Could not reach GitHub: {e}[/bold red]")
+        if streamed_records:
+            out.print(
+                f"[yellow]{streamed_records} repository record(s) were written "
+                "before the failure; the output is incomplete.[/yellow]"
+            )
+        # Only an authentication failure means the token itself is bad
+        if isinstance(e, httpx.HTTPStatusError) and e.response.status_code == 401:
+            out.print(
+                "[yellow]💡 Tip:[/yellow] Your token might be invalid. Try [bold green]udicti github-auth login[/bold green] again."
+            )
+            clear_github_token()
         raise typer.Exit(code=1)
     except Exception as e:
-        console.print(f"[bold red]❌ An unexpected error occurred: {e}[/bold red]")
+        out.print(f"[bold red]❌ An unexpected error occurred: {e}[/bold red]")
         raise typer.Exit(code=1)
 
 
 @dashboard_app.command("me")
-def personal_dashboard():
+def personal_dashboard(
+    concurrency: int = typer.Option(
+        16,
+        "--concurrency",
+        "-c",
+        min=1,
+        help="Maximum number of concurrent GitHub API requests.",
+    ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Recompute everything instead of revalidating and refreshing "
+        "the last snapshot.",
+    ),
+    backend: Backend = typer.Option(
+        Backend.rest,
+        "--backend",
+        help="GitHub API to collect data from. GraphQL needs far fewer requests.",
+    ),
+    output_format: OutputFormat = typer.Option(
+        OutputFormat.table,
+        "--format",
+        "-f",
+        help="Output format. json and ndjson skip rendering for scripts.",
+    ),
+    offline: bool = typer.Option(
+        False,
+        "--offline",
+        help="Show the last saved dashboard without touching the network.",
+    ),
+):
     """
     Displays your personal GitHub contribution dashboard.
     Requires GitHub authentication via `udicti github-auth login`.
     """
-    asyncio.run(_personal_dashboard_async())
+    if no_cache:
+        http_cache.disable()
+    github_client.run(
+        _personal_dashboard_async(
+            concurrency,
+            backend,
+            use_snapshot=not no_cache,
+            output_format=output_format,
+            offline=offline,
+        )
+    )
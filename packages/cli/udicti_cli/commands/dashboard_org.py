@@ -0,0 +1,436 @@
+# File: packages/cli/udicti_cli/commands/dashboard_org.py
+
+"""
+This module defines the `dashboard org` command, showing activity across
+every repository and member of a GitHub organization. It builds on the
+collection and rendering helpers of `dashboard me` (see `dashboard.py`).
+"""
+
+import typer
+import httpx
+import asyncio
+from rich.panel import Panel
+from rich.text import Text
+from rich.columns import Columns
+import datetime
+
+from .dashboard import (
+    OutputFormat,
+    console,
+    err_console,
+    _languages_panel,
+    _make_github_api_request,
+    _one_year_ago,
+    _parse_date,
+    _recent_entry,
+    _repo_record,
+    _require_token,
+    _summarize,
+    _summary_record,
+    _write_record,
+    _write_repo_record,
+)
+from .. import github_client, http_cache, profiling
+
+# Commands sit directly on `dashboard_app` (see `DashboardGroup`)
+org_app = typer.Typer()
+
+UDICTI_ORG_NAME = "udicti"
+
+
+async def _analyze_org_repo(
+    org: str, repo: dict, token: str, today: datetime.datetime
+) -> dict:
+    """
+    Fetches language and per-author commit data for one organization repo.
+
+    Like `_analyze_repo`, but counts the last year's commits by every author
+    instead of a single user.
+
+    Returns:
+        A dictionary with the repo name, whether it was recently active, its
+        language byte counts, its commit count, commits per author login and
+        up to five recent commits.
+    """
+    one_year_ago = _one_year_ago(today)
+    repo_updated = _parse_date(repo.get("updated_at"))
+    endpoint = f"repos/{org}/{repo['name']}"
+
+    stats = {
+        "name": repo["name"],
+        "active": repo_updated >= (today - datetime.timedelta(days=180)),
+        "languages": {},
+        "commit_count": 0,
+        "commits_by_author": {},
+        "recent": [],
+    }
+
+    async def fetch_languages():
+        try:
+            stats["languages"] = await _make_github_api_request(
+                f"{endpoint}/languages", token
+            )
+        except Exception:
+            github_client.scheduler.record_skip()
+
+    async def fetch_commits():
+        try:
+            async for commits in github_client.apaginate(
+                f"{endpoint}/commits",
+                token,
+                params={"since": one_year_ago.isoformat(), "per_page": 100},
+            ):
+                for commit in commits:
+                    stats["commit_count"] += 1
+                    # Commits from unlinked git identities have no GitHub author
+                    author = (commit.get("author") or {}).get("login")
+                    if author:
+                        by_author = stats["commits_by_author"]
+                        by_author[author] = by_author.get(author, 0) + 1
+                    if len(stats["recent"]) < 5:
+                        entry = _recent_entry(
+                            repo["name"],
+                            commit["commit"]["message"],
+                            commit["commit"]["author"]["date"],
+                        )
+                        entry["author"] = author
+                        stats["recent"].append(entry)
+        except Exception:
+            github_client.scheduler.record_skip()
+
+    tasks = [fetch_languages()]
+    if repo_updated >= one_year_ago and not repo.get("fork", False):
+        tasks.append(fetch_commits())
+    await asyncio.gather(*tasks)
+
+    return stats
+
+
+async def _collect_org(
+    org: str, token: str, today: datetime.datetime, on_progress=None, on_repo=None
+):
+    """
+    Collects activity for every repository and member of an organization.
+
+    The member list and the repository list are fetched in parallel, and each
+    repository is analyzed as soon as its page arrives.
+
+    Args:
+        on_progress: Optional callback, called with `(done, listed)` repository
+            counts as the analysis progresses.
+        on_repo: Optional callback, called with each repository's stats as
+            soon as they are computed (in completion order).
+
+    Returns:
+        A dictionary with the organization's `members` logins and per-repo
+        `repo_stats` (in repository order).
+    """
+    tasks = []
+
+    def on_repo_done(done_task):
+        if on_repo is not None and not done_task.cancelled():
+            if not done_task.exception():
+                on_repo(done_task.result())
+        if on_progress is not None:
+            on_progress(sum(task.done() for task in tasks), len(tasks))
+
+    async def list_members():
+        members = []
+        async for page in github_client.apaginate(
+            f"orgs/{org}/members", token, params={"per_page": 100}
+        ):
+            members.extend(member["login"] for member in page)
+        return members
+
+    async def list_and_analyze_repos():
+        try:
+            async for repos in github_client.apaginate(
+                f"orgs/{org}/repos",
+                token,
+                params={"type": "all", "per_page": 100, "sort": "updated"},
+            ):
+                for repo in repos:
+                    task = asyncio.create_task(
+                        _analyze_org_repo(org, repo, token, today)
+                    )
+                    task.add_done_callback(on_repo_done)
+                    tasks.append(task)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+        return await asyncio.gather(*tasks)
+
+    members, repo_stats = await asyncio.gather(list_members(), list_and_analyze_repos())
+    return {"members": members, "repo_stats": repo_stats}
+
+
+def _summarize_org(members: list[str], repo_stats: list[dict]) -> dict:
+    """
+    Aggregates organization repo stats into the org dashboard totals.
+
+    Returns:
+        The `_summarize` totals plus `commits_by_member` (every member, most
+        active first), `outside_commits` from non-members and the
+        `top_repos` by commit count.
+    """
+    summary = _summarize(repo_stats)
+
+    commits_by_member = {member: 0 for member in members}
+    outside_commits = 0
+    for stats in repo_stats:
+        for author, count in stats["commits_by_author"].items():
+            if author in commits_by_member:
+                commits_by_member[author] += count
+            else:
+                outside_commits += count
+
+    summary["commits_by_member"] = sorted(
+        commits_by_member.items(), key=lambda x: x[1], reverse=True
+    )
+    summary["outside_commits"] = outside_commits
+    summary["top_repos"] = sorted(
+        ((stats["name"], stats["commit_count"]) for stats in repo_stats),
+        key=lambda x: x[1],
+        reverse=True,
+    )[:5]
+    return summary
+
+
+def _org_overview_panel(org: str, members: list[str], repo_stats: list, summary):
+    """Builds the Organization overview panel."""
+    content = Text.from_markup(
+        f"[bold green]🏢 [bold white]{org}[/bold white] on GitHub[/bold green]\n\n"
+        f"[dim]Repositories:[/dim] [bold white]{len(repo_stats)}[/bold white] • [bold white]{summary['active_repos']}[/bold white] recently active\n"
+        f"[dim]Members:[/dim] [bold white]{len(members)}[/bold white]\n"
+        f"[dim]Commits (Last Year):[/dim] [bold white]{summary['total_commits']}[/bold white]"
+    )
+    return Panel(
+        content,
+        title="[bold white]📊 Organization Overview[/bold white]",
+        border_style="blue",
+        padding=(1, 2),
+    )
+
+
+def _bar_lines(title: str, rows: list[tuple[str, int]], unit: str) -> list[str]:
+    """Formats `(label, count)` rows as bars scaled to the largest count."""
+    lines = [title]
+    max_count = max((count for _, count in rows), default=0)
+    max_bar_length = 20
+    for label, count in rows:
+        bar_length = int((count / max_count) * max_bar_length) if max_count else 0
+        lines.append(
+            f"[dim]{label[:16]:16}[/dim] [cyan]{'█' * bar_length}[/cyan] [bold white]{count}[/bold white] {unit}"
+        )
+    return lines
+
+
+def _org_members_panel(summary: dict):
+    """Builds the Commits per Member panel."""
+    if summary["commits_by_member"]:
+        lines = _bar_lines(
+            "[bold magenta]👥 Commits per Member (Last Year):[/bold magenta]\n",
+            summary["commits_by_member"][:10],
+            "commits",
+        )
+        if len(summary["commits_by_member"]) > 10:
+            lines.append(
+                f"[dim]...and {len(summary['commits_by_member']) - 10} more members[/dim]"
+            )
+        if summary["outside_commits"]:
+            lines.append(
+                f"[dim]Outside contributors:[/dim] [bold white]{summary['outside_commits']}[/bold white] commits"
+            )
+        content = Text.from_markup("\n".join(lines))
+    else:
+        content = Text.from_markup("[dim]No public members found[/dim]")
+
+    return Panel(
+        content,
+        title="[bold white]👥 Members[/bold white]",
+        border_style="green",
+        padding=(1, 2),
+    )
+
+
+def _org_repos_panel(summary: dict):
+    """Builds the Most Active Repositories panel."""
+    rows = [row for row in summary["top_repos"] if row[1] > 0]
+    if rows:
+        content = Text.from_markup(
+            "\n".join(
+                _bar_lines(
+                    "[bold yellow]🔥 Most Active Repositories:[/bold yellow]\n",
+                    rows,
+                    "commits",
+                )
+            )
+        )
+    else:
+        content = Text.from_markup("[dim]No commits in the last year[/dim]")
+
+    return Panel(
+        content,
+        title="[bold white]📁 Repositories[/bold white]",
+        border_style="yellow",
+        padding=(1, 2),
+    )
+
+
+def _org_recent_panel(summary: dict, today: datetime.datetime):
+    """Builds the organization's Recent Work panel, including commit authors."""
+    if summary["recent_activity"]:
+        activity_lines = ["[bold cyan]⚡ Recent Commits:[/bold cyan]\n"]
+        for activity in summary["recent_activity"][:8]:
+            days_ago = (today - activity["date"]).days
+            time_str = f"{days_ago}d ago" if days_ago > 0 else "today"
+            author = f"@{activity['author']}" if activity.get("author") else "unknown"
+            activity_lines.append(
+                f"[dim]{activity['repo']}[/dim] • {activity['message']} [dim]({author}, {time_str})[/dim]"
+            )
+        recent_content = Text.from_markup("\n".join(activity_lines))
+    else:
+        recent_content = Text.from_markup("[dim]No recent activity found[/dim]")
+
+    return Panel(
+        recent_content,
+        title="[bold white]🚀 Recent Work[/bold white]",
+        border_style="cyan",
+        padding=(1, 2),
+    )
+
+
+def _org_record(org: str, members: list[str], summary: dict) -> dict:
+    """Builds the machine-readable summary of an organization dashboard."""
+    return {
+        "org": org,
+        "members": members,
+        **_summary_record(summary),
+        "commits_by_member": dict(summary["commits_by_member"]),
+        "outside_commits": summary["outside_commits"],
+        "top_repos": [
+            {"name": name, "commits": commits} for name, commits in summary["top_repos"]
+        ],
+        "skipped_requests": github_client.scheduler.skipped,
+    }
+
+
+async def _org_dashboard_async(
+    org: str, concurrency: int = 16, output_format: OutputFormat = OutputFormat.table
+):
+    """
+    Async implementation of the organization dashboard.
+
+    Args:
+        org: The GitHub organization to analyze.
+        concurrency: The maximum number of GitHub requests in flight at once.
+        output_format: Whether to render panels or write JSON/NDJSON.
+    """
+    machine_output = output_format != OutputFormat.table
+    # Keep stdout for data; warnings and errors still reach the user
+    out = err_console if machine_output else console
+    token = _require_token(out)
+    github_client.scheduler.max_concurrency = concurrency
+    today = datetime.datetime.now(datetime.timezone.utc)
+
+    if machine_output:
+        streaming = output_format == OutputFormat.ndjson
+        on_repo = _write_repo_record if streaming else None
+
+        try:
+            result = await _collect_org(org, token, today, on_repo=on_repo)
+        except httpx.HTTPError as e:
+            out.print(f"[bold red]❌ Error accessing GitHub API: {e}[/bold red]")
+            raise typer.Exit(code=1)
+
+        summary = _summarize_org(result["members"], result["repo_stats"])
+        record = _org_record(org, result["members"], summary)
+        if output_format == OutputFormat.json:
+            record["repos"] = [_repo_record(stats) for stats in result["repo_stats"]]
+            _write_record(record, indent=2)
+        else:
+            _write_record({"type": "summary", **record})
+        return
+
+    try:
+        with console.status(
+            f"[bold cyan]📊 Analyzing activity across {org}...[/bold cyan]"
+        ) as status:
+
+            def on_progress(done, listed):
+                status.update(
+                    f"[bold cyan]📊 Analyzing activity across {org}... "
+                    f"({done}/{listed} repositories)[/bold cyan]"
+                )
+
+            result = await _collect_org(org, token, today, on_progress)
+
+        summary = _summarize_org(result["members"], result["repo_stats"])
+
+        with profiling.span("render", "dashboard org"):
+            console.print(
+                _org_overview_panel(
+                    org, result["members"], result["repo_stats"], summary
+                )
+            )
+            console.print(
+                Columns(
+                    [_org_members_panel(summary), _languages_panel(summary)],
+                    expand=True,
+                )
+            )
+            console.print(_org_repos_panel(summary))
+            console.print(_org_recent_panel(summary, today))
+
+        if github_client.scheduler.skipped:
+            console.print(
+                f"[dim yellow]⚠️  {github_client.scheduler.skipped} GitHub request(s) "
+                "failed or were rate limited; some numbers may be incomplete.[/dim yellow]"
+            )
+
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 404:
+            console.print(
+                f"[bold red]❌ Organization '{org}' was not found.[/bold red]"
+            )
+        else:
+            console.print(
+                f"[bold red]❌ Error accessing GitHub API: {e.response.status_code}[/bold red]"
+            )
+        raise typer.Exit(code=1)
+    except Exception as e:
+        console.print(f"[bold red]❌ An unexpected error occurred: {e}[/bold red]")
+        raise typer.Exit(code=1)
+
+
+@org_app.command("org")
+def org_dashboard(
+    org: str = typer.Option(
+        UDICTI_ORG_NAME, "--org", help="GitHub organization to analyze."
+    ),
+    concurrency: int = typer.Option(
+        16,
+        "--concurrency",
+        "-c",
+        min=1,
+        help="Maximum number of concurrent GitHub API requests.",
+    ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Re-download everything instead of revalidating."
+    ),
+    output_format: OutputFormat = typer.Option(
+        OutputFormat.table,
+        "--format",
+        "-f",
+        help="Output format. json and ndjson skip rendering for scripts.",
+    ),
+):
+    """
+    Displays activity across every repository and member of the UDICTI
+    GitHub organization: commits per member, languages, the most active
+    repositories and recent work.
+    """
+    if no_cache:
+        http_cache.disable()
+    github_client.run(_org_dashboard_async(org, concurrency, output_format))
@@ -0,0 +1,254 @@
+# File: packages/cli/udicti_cli/commands/dashboard_team.py
+
+"""
+This module defines the `dashboard team` command, which computes the
+`dashboard me` stats (see `dashboard.py`) for every registered UDICTI
+developer in one concurrent run.
+"""
+
+import typer
+import httpx
+import asyncio
+from rich.table import Table
+import datetime
+
+from .dashboard import (
+    OutputFormat,
+    console,
+    err_console,
+    _analyze_user_repos,
+    _require_token,
+    _summarize,
+    _summary_record,
+    _write_record,
+)
+from .. import github_client, http_cache, profiling, roster
+
+# Commands sit directly on `dashboard_app` (see `DashboardGroup`)
+team_app = typer.Typer()
+
+
+async def _analyze_developer(dev: dict, token: str, today: datetime.datetime) -> dict:
+    """
+    Computes the `dashboard me` stats for one registered developer.
+
+    Returns:
+        A dictionary with the developer's `name` and `github` handle, and
+        either their `summary` or the `error` that stopped the analysis.
+    """
+    handle = dev["github"]
+    entry = {"name": dev.get("name", handle), "github": handle}
+    try:
+        repo_stats = await _analyze_user_repos(handle, token, today)
+    except httpx.HTTPStatusError as e:
+        status = e.response.status_code
+        entry["error"] = "GitHub user not found" if status == 404 else f"HTTP {status}"
+        return entry
+    except httpx.HTTPError as e:
+        entry["error"] = str(e) or type(e).__name__
+        return entry
+    entry["summary"] = _summarize(repo_stats)
+    return entry
+
+
+async def _collect_team(
+    developers: list[dict], token: str, today: datetime.datetime, on_developer=None
+) -> list[dict]:
+    """
+    Analyzes every developer concurrently. All of their requests share the
+    pooled client, the HTTP cache and the rate-limit scheduler, which bounds
+    how many are in flight across the whole team.
+
+    Args:
+        on_developer: Optional callback, called with each developer's entry
+            as soon as it is computed (in completion order).
+
+    Returns:
+        One entry per developer (see `_analyze_developer`), in roster order.
+    """
+
+    def on_done(done_task):
+        if not done_task.cancelled():
+            on_developer(done_task.result())
+
+    tasks = [
+        asyncio.create_task(_analyze_developer(dev, token, today)) for dev in developers
+    ]
+    if on_developer is not None:
+        for task in tasks:
+            task.add_done_callback(on_done)
+    try:
+        return list(await asyncio.gather(*tasks))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+
+def _team_record(entry: dict) -> dict:
+    """Builds the machine-readable record of one developer's stats."""
+    record = {"name": entry["name"], "github": entry["github"]}
+    if "error" in entry:
+        record["error"] = entry["error"]
+    else:
+        record.update(_summary_record(entry["summary"]))
+    return record
+
+
+def _write_developer_record(entry: dict):
+    """Streams one developer as an NDJSON `developer` record."""
+    _write_record({"type": "developer", **_team_record(entry)})
+
+
+def _team_table(entries: list[dict], today: datetime.datetime):
+    """Builds the team results table, most commits first."""
+    table = Table(
+        title="[bold white]👥 UDICTI Team Activity (Last Year)[/bold white]",
+        show_header=True,
+        header_style="bold magenta",
+    )
+    table.add_column("Name", style="cyan", no_wrap=True)
+    table.add_column("GitHub", style="bold yellow", no_wrap=True)
+    table.add_column("Commits", justify="right", style="bold white")
+    table.add_column("Active Repos", justify="right")
+    table.add_column("Top Languages", style="italic green")
+    table.add_column("Last Commit", style="dim")
+
+    def sort_key(entry):
+        summary = entry.get("summary")
+        return -(summary["total_commits"] if summary else -1)
+
+    for entry in sorted(entries, key=sort_key):
+        summary = entry.get("summary")
+        if summary is None:
+            table.add_row(
+                entry["name"],
+                f"@{entry['github']}",
+                "-",
+                "-",
+                f"[red]{entry['error']}[/red]",
+                "",
+            )
+            continue
+
+        languages = ", ".join(lang for lang, _ in summary["top_languages"][:3])
+        if summary["recent_activity"]:
+            days_ago = (today - summary["recent_activity"][0]["date"]).days
+            last_commit = f"{days_ago}d ago" if days_ago > 0 else "today"
+        else:
+            last_commit = "N/A"
+        table.add_row(
+            entry["name"],
+            f"@{entry['github']}",
+            str(summary["total_commits"]),
+            str(summary["active_repos"]),
+            languages or "N/A",
+            last_commit,
+        )
+    return table
+
+
+async def _team_dashboard_async(
+    concurrency: int = 16, output_format: OutputFormat = OutputFormat.table
+):
+    """
+    Async implementation of the team dashboard.
+
+    Args:
+        concurrency: The maximum number of GitHub requests in flight at once,
+            across all developers.
+        output_format: Whether to render a table or write JSON/NDJSON.
+    """
+    machine_output = output_format != OutputFormat.table
+    # Keep stdout for data; warnings and errors still reach the user
+    out = err_console if machine_output else console
+
+    token = _require_token(out)
+    github_client.scheduler.max_concurrency = concurrency
+    today = datetime.datetime.now(datetime.timezone.utc)
+
+    # 1. Get the registered developers from the local roster replica
+    await asyncio.to_thread(roster.sync)
+    developers = [dev for dev in roster.list_developers() if dev.get("github")]
+    if not developers:
+        out.print("[dim]No developers registered yet.[/dim]")
+        return
+
+    # 2. Analyze all of them concurrently under one rate-limit budget
+    try:
+        if machine_output:
+            streaming = output_format == OutputFormat.ndjson
+            entries = await _collect_team(
+                developers,
+                token,
+                today,
+                on_developer=_write_developer_record if streaming else None,
+            )
+            record = {
+                "as_of": today,
+                "count": len(entries),
+                "failed": sum("error" in entry for entry in entries),
+                "skipped_requests": github_client.scheduler.skipped,
+            }
+            if streaming:
+                _write_record({"type": "summary", **record})
+            else:
+                record["developers"] = [_team_record(entry) for entry in entries]
+                _write_record(record, indent=2)
+            return
+
+        with console.status(
+            f"[bold cyan]📊 Analyzing {len(developers)} developers...[/bold cyan]"
+        ) as status:
+            done = 0
+
+            def on_developer(_entry):
+                nonlocal done
+                done += 1
+                status.update(
+                    f"[bold cyan]📊 Analyzing {len(developers)} developers... "
+                    f"({done}/{len(developers)})[/bold cyan]"
+                )
+
+            entries = await _collect_team(developers, token, today, on_developer)
+
+        with profiling.span("render", "dashboard team"):
+            console.print(_team_table(entries, today))
+
+        if github_client.scheduler.skipped:
+            console.print(
+                f"[dim yellow]⚠️  {github_client.scheduler.skipped} GitHub request(s) "
+                "failed or were rate limited; some numbers may be incomplete.[/dim yellow]"
+            )
+
+    except Exception as e:
+        out.print(f"[bold red]❌ An unexpected error occurred: {e}[/bold red]")
+        raise typer.Exit(code=1)
+
+
+@team_app.command("team")
+def team_dashboard(
+    concurrency: int = typer.Option(
+        16,
+        "--concurrency",
+        "-c",
+        min=1,
+        help="Maximum number of concurrent GitHub API requests, shared by everyone.",
+    ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Re-download everything instead of revalidating."
+    ),
+    output_format: OutputFormat = typer.Option(
+        OutputFormat.table,
+        "--format",
+        "-f",
+        help="Output format. json and ndjson skip rendering for scripts.",
+    ),
+):
+    """
+    Computes the `dashboard me` stats for every registered UDICTI developer
+    in one concurrent run and shows them side by side.
+    """
+    if no_cache:
+        http_cache.disable()
+    github_client.run(_team_dashboard_async(concurrency, output_format))
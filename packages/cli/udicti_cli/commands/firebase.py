@@ -4,11 +4,15 @@
 This module provides utility functions for connecting to and interacting with
 a Firebase Firestore database. It centralizes all database logic.
 """
+
 import firebase_admin
 from firebase_admin import credentials
 from firebase_admin import firestore
 
+from .. import profiling
+
 
+@profiling.timed("firestore")
 def init_firebase(firebase_config: dict):
     """
     Initializes the Firebase Admin SDK if it hasn't been initialized already.
@@ -38,6 +42,7 @@ def init_firebase(firebase_config: dict):
             raise Exception(f"Failed to initialize Firebase: {e}")
 
 
+@profiling.timed("firestore")
 def get_developers() -> list[dict]:
     """
     Fetches the list of all registered developers from the Firestore database.
@@ -68,6 +73,7 @@ def get_developers() -> list[dict]:
     return devs
 
 
+@profiling.timed("firestore")
 def add_developer(
     name: str, email: str, github: str, interests: list = None, skills: list = None
 ):
@@ -89,6 +95,8 @@ def add_developer(
         "name": name,
         "email": email,
         "github": github,
+        # Normalized copy of the handle for case-insensitive keyed lookups
+        "github_lower": github.lower(),
         "interests": interests if interests is not None else [],
         "skills": skills if skills is not None else [],
     }
@@ -97,6 +105,7 @@ def add_developer(
     developers_ref.document(email).set(new_developer_data)
 
 
+@profiling.timed("firestore")
 def get_timetable() -> list[dict]:
     """
     Fetches all timetable entries from the Firestore database.
@@ -119,6 +128,7 @@ def get_timetable() -> list[dict]:
     return entries
 
 
+@profiling.timed("firestore")
 def add_timetable_entry(entry_data: dict):
     """
     Adds a new timetable entry to the Firestore database. Firestore will
@@ -7,15 +7,16 @@ from pathlib import Path
 import os
 import stat
 import typer
-import requests
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Confirm
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
+from .. import github_client
+
 console = Console()
 
-GITHUB_CLIENT_ID = "Iv23liYBZbvclFcmuOd6"  
+GITHUB_CLIENT_ID = "Iv23liYBZbvclFcmuOd6"
 
 # Path to store the OAuth token securely
 AUTH_DIR = Path(typer.get_app_dir("udicti-cli", roaming=True)) / "auth"
@@ -64,7 +65,7 @@ def start_device_flow():
     Initiates the GitHub OAuth Device Flow.
     Returns device_code, user_code, verification_uri, and interval.
     """
-    response = requests.post(
+    response = github_client.post(
         "https://github.com/login/device/code",
         data={"client_id": GITHUB_CLIENT_ID, "scope": "read:user user:email"},
         headers={"Accept": "application/json"},
@@ -81,7 +82,7 @@ def poll_for_token(device_code: str, interval: int):
     Polls GitHub for the access token after user authorization.
     """
     while True:
-        response = requests.post(
+        response = github_client.post(
             "https://github.com/login/oauth/access_token",
             data={
                 "client_id": GITHUB_CLIENT_ID,
@@ -108,7 +109,9 @@ def poll_for_token(device_code: str, interval: int):
             raise Exception(f"Unexpected error: {data}")
 
 
-github_auth_app = typer.Typer(help="A secure way to authenticate with your Github Account")
+github_auth_app = typer.Typer(
+    help="A secure way to authenticate with your Github Account"
+)
 
 
 @github_auth_app.command("login")
@@ -205,13 +208,7 @@ def github_status_command():
 
     # Validate token by making a test API call
     try:
-        response = requests.get(
-            "https://api.github.com/user",
-            headers={
-                "Authorization": f"token {token}",
-                "Accept": "application/vnd.github.v3+json",
-            },
-        )
+        response = github_client.get("user", token)
 
         if response.status_code == 200:
             user_data = response.json()
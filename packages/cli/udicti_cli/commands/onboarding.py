@@ -4,8 +4,9 @@
 This module defines the commands for new user onboarding, such as the `join` command.
 It handles user input, GitHub authentication, and registration via the backend API.
 """
+
 import typer
-import requests
+import httpx
 from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt, Confirm
@@ -14,6 +15,7 @@ from rich.text import Text
 
 # Import GitHub auth utilities
 from .github_auth import load_github_pat
+from .. import github_client
 from ..utils import api_request, log_event
 
 # Initialize a rich console object for printing
@@ -22,25 +24,19 @@ console = Console()
 # Create a Typer application for the onboarding commands
 onboarding_app = typer.Typer()
 
+
 def get_github_user_info(pat: str) -> dict:
     """
     Fetches user information from GitHub using the Personal Access Token.
     """
-    headers = {
-        "Authorization": f"token {pat}",
-        "Accept": "application/vnd.github.v3+json",
-    }
-
     try:
         # Get user profile
-        user_response = requests.get("https://api.github.com/user", headers=headers)
+        user_response = github_client.get("user", pat)
         user_response.raise_for_status()
         user_data = user_response.json()
 
         # Get user emails
-        emails_response = requests.get(
-            "https://api.github.com/user/emails", headers=headers
-        )
+        emails_response = github_client.get("user/emails", pat)
         emails_response.raise_for_status()
         emails_data = emails_response.json()
 
@@ -55,17 +51,18 @@ def get_github_user_info(pat: str) -> dict:
             "github": user_data.get("login"),
             "avatar_url": user_data.get("avatar_url"),
         }
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         console.print(f"[bold red]Error fetching GitHub info: {e}[/bold red]")
         return None
 
+
 @onboarding_app.command("join")
 def join_community():
     """
     Joins the UDICTI community using GitHub authentication and backend API.
     """
     log_event("join_command_started")
-    
+
     console.print(
         "[bold dodger_blue3]🚀 Welcome to the UDICTI Dev Team! Let's get you signed up.[/bold dodger_blue3]"
     )
@@ -152,9 +149,11 @@ def join_community():
         }
 
         result = api_request("developers", method="POST", data=developer_data)
-        
+
         if result and result.get("success"):
-            console.print("[bold green] ✅ Successfully registered with UDICTI![/bold green]")
+            console.print(
+                "[bold green] ✅ Successfully registered with UDICTI![/bold green]"
+            )
             log_event("developer_registered", {"github": github_info["github"]})
         else:
             console.print("[bold red] ❌ Error saving to database[/bold red]")
@@ -186,10 +185,10 @@ def join_community():
     # Step 6: Display all registered developers from backend
     try:
         developers_data = api_request("developers")
-        
+
         if developers_data and developers_data.get("developers"):
             developers = developers_data["developers"]
-            
+
             table = Table(
                 title="[bold white] UDICTI Developer Roster[/bold white]",
                 show_header=True,
@@ -224,5 +223,5 @@ def join_community():
     console.print(
         "\n[bold dodger_blue3]🚀 Ready to start building amazing things with UDICTI![/bold dodger_blue3]"
     )
-    
-    log_event("join_command_completed")
\ No newline at end of file
+
+    log_event("join_command_completed")
@@ -1,62 +1,136 @@
 # File: packages/cli/udicti_cli/commands/show.py
 
 """
-This module defines the `show` command, which fetches and displays a
-list of all registered developers from the shared database.
+This module defines the `show` command, which fetches and displays the
+developers registered in the shared database: all of them (`show devs`) or
+one by GitHub handle (`show dev`).
 """
+
+import csv
+import json
+import os
+import sys
+from enum import Enum
+from urllib.parse import quote
+
 import typer
 from rich.console import Console
+from rich.markup import escape
+from rich.panel import Panel
+from rich.segment import Segment, Segments
 from rich.table import Table
+from rich.text import Text
 
 # Import the utils for API requests
 from ..utils import api_request, log_event
+from .. import profiling, roster
 
 # Initialize a rich console object for printing
 console = Console()
+# Messages for exports, which keep stdout for data
+err_console = Console(stderr=True)
 
 # Create a Typer application for the show command
 show_app = typer.Typer(help="Show information about UDICTI community")
 
+# Developers shown in the table when neither --limit nor --all is given
+# (exports include everyone by default)
+DEFAULT_LIMIT = 50
 
-@show_app.command("devs")
-def show_developers():
+# Columns as (header, style, no_wrap, share of the table width). Widths are
+# fixed up front so every page of the table lines up with the first one.
+DEVELOPER_COLUMNS = [
+    ("Name", "cyan", True, 3),
+    ("Email", "dim", True, 4),
+    ("GitHub", "bold yellow", True, 2),
+    ("Skills", "italic green", False, 3),  # Skills might be long, so they wrap
+    ("Interests", "italic blue", False, 3),  # Interests might be long too
+]
+MAX_TABLE_WIDTH = 140
+
+
+class OutputFormat(str, Enum):
+    """How `show devs` writes developers out."""
+
+    table = "table"
+    csv = "csv"
+    json = "json"
+    ndjson = "ndjson"
+
+
+# Fields written by the CSV/JSON/NDJSON exports, in CSV column order
+EXPORT_FIELDS = [
+    "name",
+    "email",
+    "github",
+    "skills",
+    "interests",
+    "joined_at",
+    "updated_at",
+]
+
+
+class Match(str, Enum):
+    """Whether a search needs every skill/interest given, or any of them."""
+
+    all = "all"
+    any = "any"
+
+
+class DeveloperTable:
     """
-    Fetches and displays a table of all developers registered in the community.
-    Includes their name, email, GitHub username, interests, and skills.
+    Prints the developers table a page at a time, so rows appear as soon as
+    each page arrives instead of after the whole roster has been fetched.
+
+    Each page is rendered as its own table with the same column widths, and
+    the borders between pages are swapped for row separators, so the result
+    reads as one continuous table.
     """
-    console.print("[bold cyan]Fetching UDICTI developers from the cloud...[/bold cyan]")
-    log_event("show_developers_command")
-    
-    try:
-        # Retrieve the list of developers from backend API
-        result = api_request("developers")
-        
-        if not result or not result.get("developers"):
-            console.print(
-                "[dim]No developers registered yet. Use `udicti join` to be the first![/dim]"
-            )
-            return
 
-        developers = result["developers"]
+    def __init__(self):
+        table_width = min(console.width, MAX_TABLE_WIDTH)
+        # One border per column plus one, and a space either side of each cell
+        available = (
+            table_width - (len(DEVELOPER_COLUMNS) + 1) - 2 * len(DEVELOPER_COLUMNS)
+        )
+        total_share = sum(share for *_, share in DEVELOPER_COLUMNS)
+        self.widths = [
+            max(4, available * share // total_share) for *_, share in DEVELOPER_COLUMNS
+        ]
+        self.shown = 0
+        self._separator, self._bottom = self._border_lines()
 
-        # Create a Rich Table to display the developer data
+    def _table(self, first: bool) -> Table:
         table = Table(
-            title="[bold white]Current UDICTI Devs[/bold white]",
-            show_header=True,
+            title="[bold white]Current UDICTI Devs[/bold white]" if first else None,
+            show_header=first,
             header_style="bold magenta",
             show_lines=True,  # Adds lines to visually separate rows and columns
         )
-        # Define the columns for the table
-        table.add_column("Name", style="cyan", no_wrap=True)
-        table.add_column("Email", style="dim", no_wrap=True)
-        table.add_column("GitHub", style="bold yellow", no_wrap=True)
-        table.add_column(
-            "Skills", style="italic green", no_wrap=False
-        )  # Skills might be long, so no_wrap=False
-        table.add_column(
-            "Interests", style="italic blue", no_wrap=False
-        )  # Interests might be long, so no_wrap=False
+        for (header, style, no_wrap, _), width in zip(DEVELOPER_COLUMNS, self.widths):
+            table.add_column(header, style=style, no_wrap=no_wrap, width=width)
+        return table
+
+    def _border_lines(self):
+        """Renders a row separator and a bottom border in this table's style."""
+        table = self._table(first=False)
+        table.add_row()
+        table.add_row()
+        lines = console.render_lines(table, console.options, pad=False)
+        # Top border, row, separator, row, bottom border
+        return lines[2], lines[-1]
+
+    def _print_lines(self, lines: list[list[Segment]]):
+        segments = []
+        for line in lines:
+            segments.extend(line)
+            segments.append(Segment.line())
+        console.print(Segments(segments), end="")
 
+    def add_page(self, developers: list[dict]):
+        """Prints a page of developers as rows of the table."""
+        first = self.shown == 0
+        table = self._table(first)
         # Populate the table with data from the fetched developers
         for dev in developers:
             # Format lists of interests and skills into comma-separated strings for display
@@ -75,13 +149,397 @@ def show_developers():
                 interests_display,
             )
 
-        # Print the fully constructed table to the console
-        console.print(table)
-        
-        console.print(f"\n[dim]Total developers: {len(developers)}[/dim]")
-        
+        with profiling.span("render", "show devs"):
+            lines = console.render_lines(table, console.options, pad=False)
+            # The bottom border is printed by `close`, after the last page
+            lines = lines[:-1] if first else [self._separator, *lines[1:-1]]
+            self._print_lines(lines)
+        self.shown += len(developers)
+
+    def close(self):
+        """Finishes the table, if any rows were printed."""
+        if self.shown:
+            self._print_lines([self._bottom])
+
+
+class DeveloperExporter:
+    """
+    Streams developers to stdout as CSV, JSON or NDJSON, a page at a time.
+
+    It has the same interface as `DeveloperTable`, so pages are written as
+    they arrive and nothing beyond the current page is held in memory. A
+    JSON export is a single array, written element by element.
+    """
+
+    def __init__(self, output_format: OutputFormat):
+        self.format = output_format
+        self.shown = 0
+        self._closed_pipe = False
+        if output_format == OutputFormat.csv:
+            self._csv = csv.writer(sys.stdout, lineterminator="\n")
+
+    def _write(self, write):
+        """Runs a write to stdout, stopping quietly if the reader went away."""
+        if self._closed_pipe:
+            return
+        try:
+            write()
+            sys.stdout.flush()
+        except BrokenPipeError:
+            # The reader went away (e.g. `| head`): send the rest to /dev/null
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+            self._closed_pipe = True
+
+    def _write_page(self, developers: list[dict]):
+        records = [
+            {field: dev.get(field) for field in EXPORT_FIELDS} for dev in developers
+        ]
+        if self.format == OutputFormat.csv:
+            if self.shown == 0:
+                self._csv.writerow(EXPORT_FIELDS)
+            for record in records:
+                # Lists become `;`-separated, as `join` splits them on commas
+                record["skills"] = ";".join(record["skills"] or [])
+                record["interests"] = ";".join(record["interests"] or [])
+                self._csv.writerow([record[field] for field in EXPORT_FIELDS])
+        elif self.format == OutputFormat.json:
+            separator = "[\n" if self.shown == 0 else ",\n"
+            sys.stdout.write(separator + ",\n".join(json.dumps(r) for r in records))
+        else:
+            sys.stdout.write("".join(json.dumps(r) + "\n" for r in records))
+
+    def add_page(self, developers: list[dict]):
+        """Writes a page of developers."""
+        if not developers:
+            return  # The header or opening bracket waits for a real page
+        self._write(lambda: self._write_page(developers))
+        self.shown += len(developers)
+
+    def close(self):
+        """Finishes the output (a CSV header or JSON array even if empty)."""
+        if self.format == OutputFormat.csv and self.shown == 0:
+            self._write(lambda: self._csv.writerow(EXPORT_FIELDS))
+        elif self.format == OutputFormat.json:
+            self._write(lambda: sys.stdout.write("\n]\n" if self.shown else "[]\n"))
+
+
+def _split_terms(values: list[str] | None) -> list[str]:
+    """Splits repeated and comma-separated options into a list of terms."""
+    return [
+        term.strip()
+        for value in values or []
+        for term in value.split(",")
+        if term.strip()
+    ]
+
+
+def _search_developers(
+    skills: list[str], interests: list[str], match: Match
+) -> tuple[list[dict], bool]:
+    """
+    Finds developers by skill and interest using the backend's search index,
+    or by filtering the local replica if the backend can't be reached.
+
+    Returns:
+        The matching developers (ordered by email), and whether they came
+        from the backend.
+    """
+    params = {"skill": skills, "interest": interests, "match": match.value}
+    # Always fresh: it's a single indexed query, and a new `join` must show up
+    result = api_request("search/developers", params=params, cache_ttl=0)
+    if result is not None:
+        return result.get("developers", []), True
+    return roster.search(skills, interests, match_all=match == Match.all), False
+
+
+def _show_search_results(
+    table: DeveloperTable | DeveloperExporter,
+    show_page,
+    skills: list[str],
+    interests: list[str],
+    match: Match,
+    out: Console,
+):
+    """Shows the developers matching a skill/interest search."""
+    developers, online = _search_developers(skills, interests, match)
+    if not online and roster.count_developers() == 0:
+        out.print(
+            "[bold red]Couldn't reach the backend, and no roster has been "
+            "synced yet to search instead.[/bold red]"
+        )
+        # Not "no matches": scripts must not take it for one
+        raise typer.Exit(code=1)
+    for start in range(0, len(developers), roster.PAGE_SIZE):
+        show_page(developers[start : start + roster.PAGE_SIZE])
+    table.close()
+
+    joiner = " and " if match == Match.all else " or "
+    wanted = joiner.join(
+        [f"skill '{skill}'" for skill in skills]
+        + [f"interest '{interest}'" for interest in interests]
+    )
+    if table.shown == 0:
+        out.print(f"[dim]No developers found with {wanted}.[/dim]")
+    elif table.shown < len(developers):
+        out.print(
+            f"\n[dim]Showing {table.shown} of {len(developers)} developers with "
+            f"{wanted}. Use --all to see everyone.[/dim]"
+        )
+    else:
+        out.print(f"\n[dim]Developers with {wanted}: {len(developers)}[/dim]")
+    if not online:
+        out.print(
+            "[dim yellow]⚠️  Couldn't reach the backend; searched the roster "
+            "from the last sync.[/dim yellow]"
+        )
+
+
+@show_app.command("devs")
+def show_developers(
+    limit: int = typer.Option(
+        None,
+        "--limit",
+        "-n",
+        min=1,
+        help=f"Show at most this many developers (default: {DEFAULT_LIMIT} in "
+        "the table, all of them in exports). The first run still downloads "
+        "the whole roster.",
+        show_default=False,
+    ),
+    show_all: bool = typer.Option(
+        False, "--all", help="Show every developer, however many there are."
+    ),
+    skill: list[str] = typer.Option(
+        None,
+        "--skill",
+        "-s",
+        help="Only developers with this skill (repeatable, or comma-separated).",
+    ),
+    interest: list[str] = typer.Option(
+        None,
+        "--interest",
+        "-i",
+        help="Only developers with this interest (repeatable, or comma-separated).",
+    ),
+    match: Match = typer.Option(
+        Match.all,
+        "--match",
+        "-m",
+        case_sensitive=False,
+        help="Whether developers need all the skills/interests given, or any.",
+    ),
+    output_format: OutputFormat = typer.Option(
+        None,
+        "--format",
+        "-f",
+        case_sensitive=False,
+        help="Output format. csv, json and ndjson stream rows for scripts "
+        "(lists are ;-separated in CSV). Defaults to table on a terminal, csv "
+        "when piped.",
+        show_default=False,
+    ),
+):
+    """
+    Fetches and displays a table of the developers registered in the community.
+    Includes their name, email, GitHub username, interests, and skills.
+    The roster is read from a local replica, which only downloads the
+    developers that changed since the last run; rows are shown a page at a
+    time as they are read. The first run downloads the whole roster to fill
+    the replica, whatever --limit is; the first rows still show as soon as
+    their page arrives. With --skill/--interest, developers are looked
+    up in the backend's search index instead (ignoring case and spacing).
+    With --format csv/json/ndjson (the default when stdout is piped), rows
+    are streamed to stdout instead, for other tools to read.
+    """
+    if output_format is None:
+        output_format = OutputFormat.table if sys.stdout.isatty() else OutputFormat.csv
+    exporting = output_format != OutputFormat.table
+    # Keep stdout for data when exporting; progress and warnings go to stderr
+    out = err_console if exporting else console
+    if show_all:
+        limit = None
+    elif limit is None and not exporting:
+        limit = DEFAULT_LIMIT
+
+    out.print("[bold cyan]Fetching UDICTI developers from the cloud...[/bold cyan]")
+    log_event("show_developers_command")
+
+    try:
+        if exporting:
+            table = DeveloperExporter(output_format)
+        else:
+            table = DeveloperTable()
+
+        def show_page(developers: list[dict]):
+            if limit is not None:
+                developers = developers[: limit - table.shown]
+            if developers:
+                table.add_page(developers)
+
+        skills, interests = _split_terms(skill), _split_terms(interest)
+        if skills or interests:
+            _show_search_results(table, show_page, skills, interests, match, out)
+            return
+
+        # The first sync downloads the roster page by page; each page is
+        # shown as it arrives. --limit only cuts what is shown: the download
+        # runs to the end, as a partial replica would give wrong totals and
+        # offline results. Later syncs only fetch changes, and the list is
+        # then read from the replica, again a page at a time.
+        synced = roster.sync(on_page=show_page)
+        if table.shown == 0:
+            for page in roster.iter_pages():
+                show_page(page)
+                if limit is not None and table.shown >= limit:
+                    break
+
+        if table.shown == 0 and synced is None:
+            out.print(
+                "[bold red]Couldn't reach the backend, and no roster has been "
+                "synced yet to show instead.[/bold red]"
+            )
+            # Not an empty roster: scripts must not take it for one
+            raise typer.Exit(code=1)
+        table.close()
+        if table.shown == 0:
+            out.print(
+                "[dim]No developers registered yet. Use `udicti join` to be the first![/dim]"
+            )
+            return
+
+        total = roster.count_developers()
+        if table.shown < total:
+            out.print(
+                f"\n[dim]Showing {table.shown} of {total} developers. "
+                "Use --all to see everyone.[/dim]"
+            )
+        else:
+            out.print(f"\n[dim]Total developers: {total}[/dim]")
+        if synced is None:
+            out.print(
+                "[dim yellow]⚠️  Couldn't reach the backend; showing the roster "
+                "from the last sync.[/dim yellow]"
+            )
+
+    except typer.Exit:
+        raise
     except Exception as e:
         # Catch and report any errors that occur during the process
-        console.print(
+        out.print(
             f"[bold red]An error occurred while fetching the list: {e}[/bold red]"
-        )
\ No newline at end of file
+        )
+        if exporting:
+            # The export isn't closed (a JSON array stays unterminated), and
+            # the exit status tells scripts not to use it
+            raise typer.Exit(code=1)
+
+
+# Longest shell completion waits for the backend, in seconds
+COMPLETION_DEADLINE = 1.5
+
+
+def _complete_handle(incomplete: str) -> list[tuple[str, str]]:
+    """
+    Completes GitHub handles from the local roster replica, so pressing Tab
+    doesn't wait on the network; asks the backend if nothing has synced yet,
+    once, briefly and without printing into the prompt if it can't.
+    """
+    handles = roster.handles_with_prefix(incomplete)
+    if not handles and roster.count_developers() == 0:
+        result = api_request(
+            "developer-handles",
+            params={"prefix": incomplete},
+            retry=False,
+            deadline=COMPLETION_DEADLINE,
+            quiet=True,
+        )
+        handles = (result or {}).get("handles", [])
+    return [(handle["github"], handle["name"]) for handle in handles]
+
+
+def _developer_panel(dev: dict) -> Panel:
+    """Builds the panel showing one developer."""
+    skills = ", ".join(dev.get("skills", [])) or "None specified"
+    interests = ", ".join(dev.get("interests", [])) or "None specified"
+    joined = (dev.get("joined_at") or "")[:10] or "Unknown"
+    content = Text.from_markup(
+        f"[bold cyan]{escape(dev['name'])}[/bold cyan]\n\n"
+        f"[dim]GitHub:[/dim] [bold yellow]@{escape(dev['github'])}[/bold yellow]\n"
+        f"[dim]Email:[/dim] {escape(dev['email'])}\n"
+        f"[dim]Joined:[/dim] {joined}\n\n"
+        f"[dim]Skills:[/dim] [italic green]{escape(skills)}[/italic green]\n"
+        f"[dim]Interests:[/dim] [italic blue]{escape(interests)}[/italic blue]"
+    )
+    return Panel(
+        content,
+        title="[bold white]👤 UDICTI Developer[/bold white]",
+        border_style="blue",
+        padding=(1, 2),
+    )
+
+
+@show_app.command("dev")
+def show_developer(
+    handle: str = typer.Argument(
+        ...,
+        help="The developer's GitHub username (any case).",
+        autocompletion=_complete_handle,
+    ),
+    output_format: OutputFormat = typer.Option(
+        None,
+        "--format",
+        "-f",
+        case_sensitive=False,
+        help="Output format, as for `show devs`. Defaults to table on a "
+        "terminal, csv when piped.",
+        show_default=False,
+    ),
+):
+    """
+    Shows one developer, looked up by GitHub username. The backend finds
+    them with a keyed read, however large the community is. When it can't
+    be reached, the roster from the last sync is used instead.
+    """
+    if output_format is None:
+        output_format = OutputFormat.table if sys.stdout.isatty() else OutputFormat.csv
+    exporting = output_format != OutputFormat.table
+    # Keep stdout for data when exporting; errors go to stderr
+    out = err_console if exporting else console
+    log_event("show_developer_command")
+    handle = handle.lstrip("@")
+
+    # 1. Ask the backend, once: None means it couldn't be reached (and the
+    # roster from the last sync is used instead), {} not found
+    result = api_request(
+        f"developers/{quote(handle, safe='')}", missing_ok=True, retry=False
+    )
+    if result is None:
+        dev = roster.find_developer(handle)
+    else:
+        dev = result.get("developer")
+
+    if dev is None and result is None:
+        out.print(
+            f"[bold red]Couldn't reach the backend, and '{escape(handle)}' isn't "
+            "in the roster from the last sync.[/bold red]"
+        )
+        raise typer.Exit(code=1)
+    if dev is None:
+        out.print(
+            f"[bold red]No UDICTI developer with GitHub username "
+            f"'{escape(handle)}'.[/bold red]"
+        )
+        raise typer.Exit(code=1)
+
+    # 2. Show them
+    if not exporting:
+        console.print(_developer_panel(dev))
+    else:
+        exporter = DeveloperExporter(output_format)
+        exporter.add_page([dev])
+        exporter.close()
+    if result is None:
+        out.print(
+            "[dim yellow]⚠️  Couldn't reach the backend; showing the roster "
+            "from the last sync.[/dim yellow]"
+        )
@@ -2,13 +2,22 @@
 
 """
 Welcome module for displaying the UDICTI CLI banner and introduction.
+
+The gradient banner is rendered once per terminal width bucket and color
+system and cached as ANSI text in the app dir, so later runs print it
+without importing `rich_gradient` at all.
 """
 
+import hashlib
+import os
+
 import typer
 from rich.console import Console
 from rich.panel import Panel
 from rich.text import Text
-from rich_gradient import Gradient
+
+from .. import profiling
+from ..utils import APP_DIR
 
 # Create the welcome command app
 app = typer.Typer(help="Display welcome messages and CLI information.")
@@ -49,6 +58,15 @@ UDICTI_BANNER_TINY = """
 """
 
 
+# Light blue → UDICTI Blue → Dark blue
+BANNER_COLORS = ["#87ceeb", "#0864af", "#1264a7", "#043463"]
+
+BANNER_CACHE_DIR = APP_DIR / "banner_cache"
+# The gradient stretches across the whole console width, so it is rendered
+# at the width rounded down to this step; the difference is invisible
+BANNER_WIDTH_STEP = 10
+
+
 def get_responsive_banner():
     """Return appropriate banner based on terminal width"""
     terminal_width = console.size.width
@@ -63,25 +81,63 @@ def get_responsive_banner():
         return UDICTI_BANNER_TINY
 
 
-@app.command("")
-def show_welcome():
+def _banner_cache_path(banner: str, width: int, color_system: str):
     """
-    Display the UDICTI CLI welcome banner and getting started information.
+    Returns the cache file for a banner rendering. The name holds the width
+    bucket and color system, plus a hash of everything that affects the
+    output, so editing the banner or its colors invalidates old renderings.
     """
-    # Get responsive banner
+    material = "\0".join([banner, *BANNER_COLORS, str(width), color_system])
+    digest = hashlib.sha256(material.encode()).hexdigest()[:16]
+    return BANNER_CACHE_DIR / f"{width}-{color_system}-{digest}.ansi"
+
+
+def _gradient_banner(banner: str):
+    # Imported here so a cached banner doesn't need the library at all
+    from rich_gradient import Gradient
+
+    return Gradient(banner, rainbow=False, colors=BANNER_COLORS)
+
+
+def print_banner():
+    """Prints the responsive banner, from the cache when possible."""
     banner = get_responsive_banner()
 
-    gradient_banner = Gradient(
-        banner,
-        rainbow=False,
-        colors=[
-            "#87ceeb",
-            "#0864af",
-            "#1264a7",
-            "#043463",
-        ],  # Light blue → UDICTI Blue → Dark blue
-    )
+    # Legacy Windows consoles are colored through the Win32 API, not ANSI
+    if console.legacy_windows:
+        console.print(_gradient_banner(banner))
+        return
+
+    width = console.size.width
+    width = width - width % BANNER_WIDTH_STEP or width
+    color_system = "none" if console.no_color else console.color_system or "none"
+    path = _banner_cache_path(banner, width, color_system)
+    try:
+        rendered = path.read_text(encoding="utf-8")
+    except OSError:
+        with console.capture() as capture:
+            console.print(_gradient_banner(banner), width=width)
+        rendered = capture.get()
+        try:
+            BANNER_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            # Drop renderings of an older banner for the same width and colors
+            for stale in BANNER_CACHE_DIR.glob(f"{width}-{color_system}-*.ansi"):
+                stale.unlink(missing_ok=True)
+            temp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            temp_path.write_text(rendered, encoding="utf-8")
+            os.replace(temp_path, path)
+        except OSError:
+            pass  # Caching is only an optimization
+
+    console.file.write(rendered)
+    console.file.flush()
+
 
+@app.command("")
+def show_welcome():
+    """
+    Display the UDICTI CLI welcome banner and getting started information.
+    """
     main_message = Text.from_markup(
         "\n[bold green]Welcome to the UDICTI Developer CLI![/bold green]\n"
         "Your Developer Analytics & Workflow Toolkit for UDICTI\n\n"
@@ -93,8 +149,9 @@ def show_welcome():
         "[#f6b418]💡 Tip:[/#f6b418] Start with GitHub authentication if you're new!\n"
     )
 
-    console.print(gradient_banner)
-    console.print(main_message)
+    with profiling.span("render", "welcome"):
+        print_banner()
+        console.print(main_message)
 
 
 @app.callback(invoke_without_command=True)
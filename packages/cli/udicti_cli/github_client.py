@@ -0,0 +1,373 @@
+# File: packages/cli/udicti_cli/github_client.py
+
+"""
+This module provides the single HTTP client layer used to talk to GitHub.
+It keeps one pooled, keep-alive (and HTTP/2 when available) connection pool
+per process, with a sync face for simple commands and an async face for the
+dashboard, so TLS handshakes are paid once rather than once per request.
+"""
+
+import asyncio
+import atexit
+import importlib.util
+import os
+import random
+import time
+
+import httpx
+
+from . import http_cache, profiling
+
+# Overridable, e.g. to run against a local stub
+GITHUB_API_BASE_URL = os.environ.get("UDICTI_GITHUB_API", "https://api.github.com")
+
+
+class GraphQLError(Exception):
+    """Raised when the GitHub GraphQL API answers with an `errors` payload."""
+
+
+# HTTP/2 needs the optional `h2` package, installed through `httpx[http2]`
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+POOL_LIMITS = httpx.Limits(
+    max_connections=32, max_keepalive_connections=16, keepalive_expiry=30
+)
+DEFAULT_TIMEOUT = httpx.Timeout(20.0)
+
+_client: httpx.Client | None = None
+_async_client: httpx.AsyncClient | None = None
+_async_client_loop: asyncio.AbstractEventLoop | None = None
+
+
+class RateLimitScheduler:
+    """
+    Paces asynchronous GitHub requests using the rate-limit headers GitHub
+    sends back.
+
+    It tracks the remaining budget from `X-RateLimit-Remaining`/`-Reset`,
+    lowers the number of requests allowed in flight as the budget runs low,
+    waits for the reset once it is exhausted, and retries `403`/`429`
+    responses after `Retry-After` (or an exponential backoff for secondary
+    rate limits). Callers report the requests they had to give up on with
+    `record_skip`, so commands can say their numbers are incomplete.
+    """
+
+    # Below this many remaining requests, concurrency is scaled down
+    LOW_BUDGET = 50 * 16
+    # Never sleep longer than this waiting for a retry or a budget reset
+    MAX_WAIT_SECONDS = 60
+    MAX_RETRIES = 3
+
+    def __init__(self, max_concurrency: int = 16):
+        self.max_concurrency = max_concurrency
+        self.remaining: int | None = None
+        self.reset_at: float | None = None
+        self.retried = 0
+        self.skipped = 0
+        self._in_flight = 0
+        self._condition: asyncio.Condition | None = None
+        self._condition_loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def concurrency(self) -> int:
+        """The number of requests currently allowed in flight."""
+        if self.remaining is None or self.remaining >= self.LOW_BUDGET:
+            return self.max_concurrency
+        return max(1, min(self.max_concurrency, self.remaining // 50))
+
+    def _get_condition(self) -> asyncio.Condition:
+        # Like the async client, asyncio primitives belong to one event loop
+        loop = asyncio.get_running_loop()
+        if self._condition is None or self._condition_loop is not loop:
+            self._condition = asyncio.Condition()
+            self._condition_loop = loop
+            self._in_flight = 0
+        return self._condition
+
+    def update(self, response: httpx.Response):
+        """Records the rate-limit budget reported by a response."""
+        remaining = response.headers.get("x-ratelimit-remaining")
+        reset = response.headers.get("x-ratelimit-reset")
+        if remaining is not None and remaining.isdigit():
+            self.remaining = int(remaining)
+        if reset is not None and reset.isdigit():
+            self.reset_at = float(reset)
+
+    def record_skip(self):
+        """Counts a request whose data had to be left out."""
+        self.skipped += 1
+
+    def _retry_delay(self, response: httpx.Response, attempt: int) -> float | None:
+        """Returns how long to wait before retrying, or None to not retry."""
+        if response.status_code not in (403, 429):
+            return None
+
+        retry_after = response.headers.get("retry-after")
+        if retry_after is not None and retry_after.isdigit():
+            delay = float(retry_after)
+        elif response.headers.get("x-ratelimit-remaining") == "0" and self.reset_at:
+            # Primary rate limit: the budget comes back at the reset time
+            delay = self.reset_at - time.time() + 1
+        elif response.status_code == 429 or "secondary rate limit" in response.text:
+            delay = 2**attempt + random.random()
+        else:
+            return None  # A plain permission error, retrying won't help
+
+        return delay if delay <= self.MAX_WAIT_SECONDS else None
+
+    async def _wait_for_budget(self):
+        """Sleeps until the reset if the budget is known to be exhausted."""
+        if self.remaining == 0 and self.reset_at:
+            delay = self.reset_at - time.time() + 1
+            if 0 < delay <= self.MAX_WAIT_SECONDS:
+                await asyncio.sleep(delay)
+                self.remaining = None
+
+    async def send(self, send_request) -> httpx.Response:
+        """
+        Sends a request through the scheduler.
+
+        Args:
+            send_request: A zero-argument coroutine function performing the
+                actual request; it is called again for each retry.
+        """
+        condition = self._get_condition()
+        for attempt in range(self.MAX_RETRIES + 1):
+            await self._wait_for_budget()
+
+            async with condition:
+                await condition.wait_for(lambda: self._in_flight < self.concurrency)
+                self._in_flight += 1
+            try:
+                response = await send_request()
+            finally:
+                async with condition:
+                    self._in_flight -= 1
+                    condition.notify_all()
+
+            self.update(response)
+            delay = self._retry_delay(response, attempt)
+            if delay is None or attempt == self.MAX_RETRIES:
+                return response
+            self.retried += 1
+            await asyncio.sleep(max(delay, 0))
+
+
+# Shared by every async request so all commands draw on one rate-limit budget
+scheduler = RateLimitScheduler()
+
+
+def github_headers(token: str | None = None) -> dict:
+    """Returns the standard GitHub API headers, authenticated if a token is given."""
+    headers = {"Accept": "application/vnd.github.v3+json"}
+    if token:
+        headers["Authorization"] = f"token {token}"  # OAuth tokens use same format
+    return headers
+
+
+def _url(endpoint: str) -> str:
+    """Resolves an API endpoint like `users/octocat` to a full URL."""
+    if endpoint.startswith(("http://", "https://")):
+        return endpoint
+    return f"{GITHUB_API_BASE_URL}/{endpoint.lstrip('/')}"
+
+
+def get_client() -> httpx.Client:
+    """Returns the shared synchronous client, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = httpx.Client(
+            http2=HTTP2_AVAILABLE, limits=POOL_LIMITS, timeout=DEFAULT_TIMEOUT
+        )
+    return _client
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """
+    Returns the shared asynchronous client for the running event loop.
+
+    An `AsyncClient` is bound to the loop it was first used on, so a new one
+    is created if called from a different loop (e.g. a second `asyncio.run`).
+    """
+    global _async_client, _async_client_loop
+    loop = asyncio.get_running_loop()
+    if _async_client is None or _async_client_loop is not loop:
+        _async_client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE, limits=POOL_LIMITS, timeout=DEFAULT_TIMEOUT
+        )
+        _async_client_loop = loop
+    return _async_client
+
+
+def close_client():
+    """Closes the shared synchronous client, if one was opened."""
+    global _client
+    if _client is not None:
+        _client.close()
+        _client = None
+    http_cache.prune()
+
+
+async def aclose_async_client():
+    """Closes the shared asynchronous client, if one was opened."""
+    global _async_client, _async_client_loop
+    if _async_client is not None:
+        await _async_client.aclose()
+        _async_client = None
+        _async_client_loop = None
+
+
+atexit.register(close_client)
+
+
+def run(coro):
+    """
+    Runs a coroutine with `asyncio.run`, closing the async client afterwards
+    so its connections are shut down cleanly before the event loop goes away.
+    """
+
+    async def runner():
+        try:
+            return await coro
+        finally:
+            await aclose_async_client()
+            http_cache.prune()
+
+    return asyncio.run(runner())
+
+
+def _record_http(response: httpx.Response, started: float):
+    """Adds a finished request to the `--profile` report."""
+    if not profiling.enabled:
+        return
+    request = response.request
+    cache = None
+    if request.method == "GET":
+        cache = "hit" if response.status_code == 304 else "miss"
+    profiling.record_http(
+        request.method,
+        str(request.url),
+        started,
+        response.status_code,
+        len(response.content),
+        cache,
+    )
+
+
+def _send(method: str, url: str, **kwargs) -> httpx.Response:
+    """Sends a request on the shared sync client, timing it for `--profile`."""
+    started = time.perf_counter()
+    try:
+        response = get_client().request(method, url, **kwargs)
+    except httpx.TransportError:
+        profiling.record_http(method, url, started)
+        raise
+    _record_http(response, started)
+    return response
+
+
+async def _asend(method: str, url: str, **kwargs) -> httpx.Response:
+    """Sends a request on the shared async client, timing it for `--profile`."""
+    client = get_async_client()
+    started = time.perf_counter()
+    try:
+        response = await client.request(method, url, **kwargs)
+    except httpx.TransportError:
+        profiling.record_http(method, url, started)
+        raise
+    _record_http(response, started)
+    return response
+
+
+def _prepare(endpoint: str, token: str | None, params: dict | None):
+    """
+    Builds the URL and headers for a GET, adding conditional headers when a
+    cached copy of the resource exists.
+    """
+    url = _url(endpoint)
+    key = http_cache.cache_key(url, params, token)
+    entry = http_cache.load(key)
+    headers = github_headers(token)
+    headers.update(http_cache.conditional_headers(entry))
+    return url, headers, key, entry
+
+
+def _finish(response: httpx.Response, key: str, entry: dict | None) -> httpx.Response:
+    """Serves a `304` from the cache, or stores a fresh `200` for next time."""
+    if response.status_code == 304 and entry is not None:
+        return http_cache.cached_response(entry, response.request)
+    http_cache.store(key, response)
+    return response
+
+
+def get(endpoint: str, token: str | None = None, params: dict = None) -> httpx.Response:
+    """Makes a (cached, conditional) GET request to the GitHub API."""
+    url, headers, key, entry = _prepare(endpoint, token, params)
+    response = _send("GET", url, headers=headers, params=params)
+    scheduler.update(response)
+    return _finish(response, key, entry)
+
+
+def post(url: str, data: dict = None, headers: dict = None) -> httpx.Response:
+    """Makes a form-encoded POST request (e.g. the OAuth device flow)."""
+    return _send("POST", _url(url), data=data, headers=headers)
+
+
+async def aget(
+    endpoint: str, token: str | None = None, params: dict = None
+) -> httpx.Response:
+    """
+    Makes a (cached, conditional) asynchronous GET request to the GitHub API,
+    paced and retried by the shared rate-limit `scheduler`.
+    """
+    url, headers, key, entry = _prepare(endpoint, token, params)
+    response = await scheduler.send(
+        lambda: _asend("GET", url, headers=headers, params=params)
+    )
+    return _finish(response, key, entry)
+
+
+async def apaginate(endpoint: str, token: str | None = None, params: dict = None):
+    """
+    Streams every page of a paginated GitHub list endpoint.
+
+    Follows the `Link: rel="next"` header until the last page, yielding each
+    page's JSON list as soon as it arrives so callers can process results
+    incrementally instead of holding the whole collection.
+
+    Raises:
+        httpx.HTTPStatusError: If any page request fails.
+    """
+    response = await aget(endpoint, token, params=params)
+    while True:
+        response.raise_for_status()
+        yield response.json()
+
+        next_url = response.links.get("next", {}).get("url")
+        if not next_url:
+            break
+        # The next link already carries the query string
+        response = await aget(next_url, token)
+
+
+async def agraphql(query: str, token: str, variables: dict = None) -> dict:
+    """
+    Runs a query against the GitHub GraphQL API and returns its `data`.
+
+    Raises:
+        httpx.HTTPStatusError: If the request itself fails.
+        GraphQLError: If GitHub reports errors for the query.
+    """
+    response = await scheduler.send(
+        lambda: _asend(
+            "POST",
+            _url("graphql"),
+            json={"query": query, "variables": variables or {}},
+            headers={"Authorization": f"bearer {token}"},
+        )
+    )
+    response.raise_for_status()
+    payload = response.json()
+    if payload.get("errors"):
+        raise GraphQLError("; ".join(e.get("message", "") for e in payload["errors"]))
+    return payload["data"]
@@ -0,0 +1,143 @@
+# File: packages/cli/udicti_cli/http_cache.py
+
+"""
+This module implements a small on-disk HTTP cache for GitHub API responses.
+Each entry remembers the `ETag`/`Last-Modified` validators for a URL so the
+next request can be made conditional; GitHub answers unchanged resources with
+a `304 Not Modified`, which is fast and does not count against the rate limit.
+"""
+
+import hashlib
+import json
+import os
+
+import httpx
+
+from .utils import APP_DIR
+
+CACHE_DIR = APP_DIR / "http_cache"
+MAX_CACHE_BYTES = 50 * 1024 * 1024  # Evict least recently used entries past 50 MB
+
+# Response headers worth replaying when an entry is served from the cache
+STORED_HEADERS = ("content-type", "etag", "last-modified", "link")
+
+# When disabled, requests are sent unconditionally (entries are still refreshed)
+enabled = True
+
+_dirty = False
+
+
+def disable():
+    """Stops sending conditional requests for the rest of this process."""
+    global enabled
+    enabled = False
+
+
+def cache_key(url: str, params: dict | None, token: str | None) -> str:
+    """
+    Builds the cache key for a request. GitHub responses vary by the
+    authenticated user, so a hash of the token is part of the key.
+    """
+    material = json.dumps(
+        {
+            "url": url,
+            "params": sorted((str(k), str(v)) for k, v in (params or {}).items()),
+            "token": hashlib.sha256((token or "").encode()).hexdigest(),
+        }
+    )
+    return hashlib.sha256(material.encode()).hexdigest()
+
+
+def _entry_path(key: str):
+    return CACHE_DIR / f"{key}.json"
+
+
+def load(key: str) -> dict | None:
+    """Returns the cached entry for `key`, or None if there isn't a usable one."""
+    path = _entry_path(key)
+    try:
+        with open(path, "r") as f:
+            entry = json.load(f)
+        os.utime(path)  # Mark as recently used for eviction
+        return entry
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def conditional_headers(entry: dict | None) -> dict:
+    """Returns the `If-None-Match`/`If-Modified-Since` headers for an entry."""
+    if not entry or not enabled:
+        return {}
+    headers = {}
+    if entry["headers"].get("etag"):
+        headers["If-None-Match"] = entry["headers"]["etag"]
+    if entry["headers"].get("last-modified"):
+        headers["If-Modified-Since"] = entry["headers"]["last-modified"]
+    return headers
+
+
+def store(key: str, response: httpx.Response):
+    """Saves a successful response if it carries a validator GitHub can check."""
+    global _dirty
+    if response.status_code != 200:
+        return
+    if "etag" not in response.headers and "last-modified" not in response.headers:
+        return
+
+    entry = {
+        "url": str(response.request.url),
+        "headers": {
+            name: response.headers[name]
+            for name in STORED_HEADERS
+            if name in response.headers
+        },
+        "body": response.text,
+    }
+    try:
+        CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+        tmp_path = _entry_path(key).with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, _entry_path(key))
+        _dirty = True
+    except OSError:
+        pass  # Caching is best-effort
+
+
+def cached_response(entry: dict, request: httpx.Request) -> httpx.Response:
+    """Rebuilds a `200` response from a cache entry after a `304` revalidation."""
+    return httpx.Response(
+        200,
+        headers=entry["headers"],
+        content=entry["body"].encode(),
+        request=request,
+        extensions={"from_cache": True},
+    )
+
+
+def prune(max_bytes: int = MAX_CACHE_BYTES):
+    """
+    Evicts the least recently used entries until the cache fits in `max_bytes`.
+    Only runs if something was written during this process.
+    """
+    global _dirty
+    if not _dirty:
+        return
+    _dirty = False
+    try:
+        entries = []
+        for path in CACHE_DIR.glob("*.json"):
+            stat = path.stat()
+            entries.append((stat.st_mtime, stat.st_size, path))
+    except OSError:
+        return
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            path.unlink()
+            total -= size
+        except OSError:
+            pass
@@ -0,0 +1,70 @@
+# File: packages/cli/udicti_cli/lazy.py
+
+"""
+This module implements lazy subcommand registration. Command modules (and
+the heavy libraries they use, like `httpx` or `rich_gradient`) are only
+imported when their command is actually invoked, so `udicti --help` and
+shell completion start quickly.
+"""
+
+import importlib
+from typing import NamedTuple
+
+import click
+import typer
+from typer.core import TyperGroup
+
+
+class LazyCommand(NamedTuple):
+    """Where to find a subcommand's Typer app, and the help `--help` lists."""
+
+    module: str
+    attribute: str
+    help: str
+    # False for apps whose commands sit directly on the parent, like an app
+    # added with `add_typer` and no name (e.g. `join`)
+    group: bool = True
+
+
+class LazyGroup(TyperGroup):
+    """
+    A Typer group whose subcommands are imported only when invoked.
+
+    Subclasses set `lazy_commands`, mapping each command name to a
+    `LazyCommand`. Listing commands (for help or shell completion) uses
+    lightweight placeholders built from the stored help texts; resolving a
+    command to run it imports its module and builds the real command.
+    """
+
+    lazy_commands: dict[str, LazyCommand] = {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        names = super().list_commands(ctx)
+        return names + [name for name in self.lazy_commands if name not in names]
+
+    def get_command(self, ctx: click.Context, cmd_name: str):
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in self.lazy_commands:
+            # Only its name and help are needed to list it
+            return click.Command(cmd_name, help=self.lazy_commands[cmd_name].help)
+        return command
+
+    def resolve_command(self, ctx: click.Context, args: list[str]):
+        name = click.utils.make_str(args[0]) if args else None
+        if name in self.lazy_commands and name not in self.commands:
+            self.add_command(load_command(name, self.lazy_commands[name]), name)
+        return super().resolve_command(ctx, args)
+
+
+def load_command(name: str, lazy_command: LazyCommand) -> click.Command:
+    """
+    Imports a lazy command's module and builds its Click command, exactly as
+    `add_typer` would have registered it on the parent app.
+    """
+    module = importlib.import_module(lazy_command.module)
+    sub_app = getattr(module, lazy_command.attribute)
+
+    parent = typer.Typer(add_completion=False)
+    parent.add_typer(sub_app, name=name if lazy_command.group else None)
+    parent_group = typer.main.get_command(parent)
+    return parent_group.commands[name]
@@ -2,51 +2,106 @@
 
 """
 This is the main entry point for the udicti cli application.
-It serves as the central router, importing all command modules and
-making them accessible to the user via the `typer` framework.
+It serves as the central router, registering all command modules and
+making them accessible to the user via the `typer` framework. Command
+modules are registered lazily (see `lazy.py`), so each is only imported
+when its command runs.
 """
+
+# Imported first so `--profile` can time the imports below
+from udicti_cli import profiling
+
 import typer
 from rich.console import Console
-import requests
-from datetime import datetime
-import os
-
-# Import all command modules
-from udicti_cli.commands import welcome
-from udicti_cli.commands import onboarding
-from udicti_cli.commands import show
-from udicti_cli.commands import github_auth
-from udicti_cli.commands import dashboard
-from udicti_cli.utils import log_event, api_request
+from pathlib import Path
+
+from udicti_cli.lazy import LazyCommand, LazyGroup
 
 console = Console()
 
 
+class UdictiGroup(LazyGroup):
+    """The top-level command group, listing every command module."""
+
+    # The help texts repeat each app's own `help=`, so `udicti --help` can
+    # list commands without importing them; scripts/check_import_time.py
+    # checks they stay in sync
+    lazy_commands = {
+        "welcome": LazyCommand(
+            "udicti_cli.commands.welcome",
+            "app",
+            "Display welcome messages and CLI information.",
+        ),
+        "join": LazyCommand(
+            "udicti_cli.commands.onboarding",
+            "onboarding_app",
+            "Joins the UDICTI community using GitHub authentication and backend API.",
+            group=False,
+        ),
+        "show": LazyCommand(
+            "udicti_cli.commands.show",
+            "show_app",
+            "Show information about UDICTI community",
+        ),
+        "github-auth": LazyCommand(
+            "udicti_cli.commands.github_auth",
+            "github_auth_app",
+            "A secure way to authenticate with your Github Account",
+        ),
+        "dashboard": LazyCommand(
+            "udicti_cli.commands.dashboard",
+            "dashboard_app",
+            "Display an overview of your current profile and progress in Github",
+        ),
+    }
+
+
 # Create the main Typer application object
 app = typer.Typer(
-    help="UDICTI CLI a modern and simple developers analytics and workflow tool to be used by devs, odds are this tool will be used to simplfy workflows and faster speed for your projects"
+    cls=UdictiGroup,
+    help="UDICTI CLI a modern and simple developers analytics and workflow tool to be used by devs, odds are this tool will be used to simplfy workflows and faster speed for your projects",
 )
 
+
 @app.callback(invoke_without_command=True)
-def main(ctx: typer.Context):
+def main(
+    ctx: typer.Context,
+    profile: bool = typer.Option(
+        False,
+        "--profile",
+        help="Print where the time went (imports, requests, rendering) on exit.",
+    ),
+    profile_trace: Path = typer.Option(
+        None,
+        "--profile-trace",
+        dir_okay=False,
+        writable=True,
+        help="Also write the profile as a Chrome trace-event JSON file (implies --profile).",
+    ),
+):
     """
     The main callback for the CLI. Displays a welcome message and banner if no
     subcommand is specified.
     """
+    if profile or profile_trace:
+        profiling.enable()
+        ctx.call_on_close(lambda: profiling.report(profile_trace))
+
+    # Imported here rather than at the top so `--help` and shell completion,
+    # which never run this callback, don't load the HTTP stack
+    from udicti_cli.utils import log_event
+
     # Log CLI startup
     log_event("cli_startup", {"subcommand": ctx.invoked_subcommand})
 
     # If no subcommand was provided by the user, display the welcome banner.
     if ctx.invoked_subcommand is None:
+        from udicti_cli.commands import welcome
+
         welcome.show_welcome()
         log_event("welcome_shown")
 
-app.add_typer(welcome.app, name="welcome")
-app.add_typer(onboarding.onboarding_app)
-app.add_typer(show.show_app, name="show")
-app.add_typer(github_auth.github_auth_app, name="github-auth")
-app.add_typer(dashboard.dashboard_app, name="dashboard")
 
 # This block ensures that the Typer application runs when the script is executed directly.
 if __name__ == "__main__":
-    app()
\ No newline at end of file
+    app()
@@ -0,0 +1,250 @@
+# File: packages/cli/udicti_cli/profiling.py
+
+"""
+This module implements the global `--profile` instrumentation. When enabled,
+it records how long imports, HTTP requests, Firestore/backend calls and
+rendering take, prints a summary table when the command exits and can write
+the raw timings as a Chrome trace-event file (open it in chrome://tracing or
+https://ui.perfetto.dev).
+
+Recording is a no-op until `enable()` is called, so the hooks can stay in
+place on every code path.
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+# Taken when the CLI starts importing its modules (main.py imports us first)
+IMPORT_START = time.perf_counter()
+
+# Path segments that are followed by identifiers rather than fixed names,
+# so `repos/alice/cli/commits` is reported as `repos/{owner}/{repo}/commits`
+PARAM_SEGMENTS = {
+    "repos": ("{owner}", "{repo}"),
+    "users": ("{user}",),
+    "orgs": ("{org}",),
+}
+
+enabled = False
+
+_events: list[dict] = []
+_lock = threading.Lock()
+
+
+def enable():
+    """Starts recording, counting everything imported so far as startup."""
+    global enabled
+    enabled = True
+    record("startup", "imports", IMPORT_START, time.perf_counter())
+
+
+def record(category: str, name: str, start: float, end: float, **args):
+    """
+    Records a completed span.
+
+    Args:
+        category: The kind of work, e.g. `http`, `firestore` or `render`.
+        name: What was done, e.g. a URL template or function name.
+        start: The `time.perf_counter()` value when the work started.
+        end: The `time.perf_counter()` value when it finished.
+        **args: Extra details shown in the table and the trace.
+    """
+    if not enabled:
+        return
+    event = {
+        "category": category,
+        "name": name,
+        "start": start,
+        "end": end,
+        "thread": threading.get_ident(),
+        "args": args,
+    }
+    with _lock:
+        _events.append(event)
+
+
+@contextmanager
+def span(category: str, name: str, **args):
+    """Records the time spent in a `with` block."""
+    if not enabled:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(category, name, start, time.perf_counter(), **args)
+
+
+def timed(category: str):
+    """Decorates a function so each call is recorded under its name."""
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(category, func.__name__):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def url_template(url: str) -> str:
+    """Reduces a request URL to its host and path template."""
+    parts = urlsplit(url)
+    segments = parts.path.strip("/").split("/")
+    template = []
+    i = 0
+    while i < len(segments):
+        template.append(segments[i])
+        placeholders = PARAM_SEGMENTS.get(segments[i], ())
+        for placeholder in placeholders:
+            if i + 1 < len(segments):
+                template.append(placeholder)
+                i += 1
+        i += 1
+    return f"{parts.netloc}/{'/'.join(template)}"
+
+
+def record_http(
+    method: str,
+    url: str,
+    start: float,
+    status: int | None = None,
+    size: int = 0,
+    cache: str | None = None,
+):
+    """
+    Records one HTTP request.
+
+    Args:
+        method: The HTTP method.
+        url: The full request URL; it is reported as a template.
+        start: The `time.perf_counter()` value when the request was sent.
+        status: The response status, or None if the request failed.
+        size: The number of response body bytes received.
+        cache: `hit` or `miss` for cacheable requests, None otherwise.
+    """
+    record(
+        "http",
+        f"{method} {url_template(url)}",
+        start,
+        time.perf_counter(),
+        status=status,
+        bytes=size,
+        cache=cache,
+    )
+
+
+def _summarize_events(events: list[dict]) -> list[dict]:
+    """Groups events by category and name, in order of first appearance."""
+    groups = {}
+    for event in events:
+        key = (event["category"], event["name"])
+        group = groups.setdefault(
+            key,
+            {
+                "category": event["category"],
+                "name": event["name"],
+                "calls": 0,
+                "total": 0.0,
+                "max": 0.0,
+                "statuses": {},
+                "bytes": 0,
+                "hits": 0,
+            },
+        )
+        duration = event["end"] - event["start"]
+        group["calls"] += 1
+        group["total"] += duration
+        group["max"] = max(group["max"], duration)
+        args = event["args"]
+        if "status" in args:
+            status = str(args["status"] or "ERR")
+            group["statuses"][status] = group["statuses"].get(status, 0) + 1
+        group["bytes"] += args.get("bytes") or 0
+        if args.get("cache") == "hit":
+            group["hits"] += 1
+    return list(groups.values())
+
+
+def write_trace(path: str, events: list[dict]):
+    """Writes events in the Chrome trace-event format."""
+    pid = os.getpid()
+    trace = [
+        {
+            "name": event["name"],
+            "cat": event["category"],
+            "ph": "X",
+            "ts": (event["start"] - IMPORT_START) * 1e6,
+            "dur": (event["end"] - event["start"]) * 1e6,
+            "pid": pid,
+            "tid": event["thread"],
+            "args": event["args"],
+        }
+        for event in events
+    ]
+    with open(path, "w") as f:
+        json.dump({"traceEvents": trace, "displayTimeUnit": "ms"}, f)
+
+
+def report(trace_path: str | None = None):
+    """
+    Prints the recorded timings as a table on stderr, so it never mixes with
+    a command's own output, and optionally writes a Chrome trace file.
+    """
+    if not enabled:
+        return
+    # Imported here so profiling costs nothing when it isn't used
+    from rich.console import Console
+    from rich.table import Table
+
+    console = Console(stderr=True)
+    with _lock:
+        events = sorted(_events, key=lambda event: event["start"])
+
+    table = Table(
+        title="[bold white]⏱️  Profile[/bold white]",
+        show_header=True,
+        header_style="bold magenta",
+    )
+    table.add_column("Category", style="cyan", no_wrap=True)
+    table.add_column("Name", style="bold yellow")
+    table.add_column("Calls", justify="right")
+    table.add_column("Total ms", justify="right")
+    table.add_column("Max ms", justify="right")
+    table.add_column("Status", style="dim")
+    table.add_column("Bytes", justify="right")
+    table.add_column("Cache hits", justify="right")
+
+    for group in _summarize_events(events):
+        is_http = group["category"] == "http"
+        table.add_row(
+            group["category"],
+            group["name"],
+            str(group["calls"]),
+            f"{group['total'] * 1000:.1f}",
+            f"{group['max'] * 1000:.1f}",
+            ", ".join(f"{s}×{n}" for s, n in group["statuses"].items()),
+            f"{group['bytes']:,}" if is_http else "",
+            f"{group['hits']}/{group['calls']}" if is_http else "",
+        )
+
+    console.print(table)
+    console.print(
+        f"[dim]Total wall time: {(time.perf_counter() - IMPORT_START) * 1000:.1f} ms "
+        "(since the CLI started importing)[/dim]"
+    )
+
+    if trace_path:
+        try:
+            write_trace(trace_path, events)
+            console.print(f"[dim]Trace written to {trace_path}[/dim]")
+        except OSError as e:
+            console.print(f"[bold red]Could not write trace file: {e}[/bold red]")
@@ -0,0 +1,313 @@
+# File: packages/cli/udicti_cli/roster.py
+
+"""
+This module keeps a local SQLite replica of the developer roster. Each sync
+asks the backend only for the developers added or changed since the last
+one (by their `updated_at`), so commands like `show devs` stay fast however
+large the community grows, and still work from the last copy when the
+backend can't be reached.
+"""
+
+import datetime
+import json
+import sqlite3
+
+from .utils import APP_DIR, api_request
+
+ROSTER_PATH = APP_DIR / "roster.sqlite3"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS developers (
+    email TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    github TEXT NOT NULL,
+    github_lower TEXT NOT NULL,
+    interests TEXT NOT NULL,
+    skills TEXT NOT NULL,
+    joined_at TEXT,
+    updated_at TEXT
+);
+CREATE INDEX IF NOT EXISTS developers_github_lower ON developers (github_lower);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+# Column order expected by `_row_to_developer`
+DEVELOPER_COLUMNS = "email, name, github, interests, skills, joined_at, updated_at"
+
+# Developers per page, both when downloading the roster and when reading it
+PAGE_SIZE = 200
+
+# How far before the watermark delta syncs start. The watermark comes from
+# the backend host's clock, while `updated_at` is stamped by Firestore when
+# a write commits, so a write in flight at the last sync (or any clock skew)
+# can carry an earlier time. Re-fetching a few minutes is harmless, as
+# developers are upserted by email.
+WATERMARK_OVERLAP = datetime.timedelta(minutes=5)
+
+
+def _connect() -> sqlite3.Connection:
+    ROSTER_PATH.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    connection = sqlite3.connect(ROSTER_PATH)
+    connection.executescript(SCHEMA)
+    return connection
+
+
+def _row_to_developer(row: tuple) -> dict:
+    email, name, github, interests, skills, joined_at, updated_at = row
+    return {
+        "name": name,
+        "email": email,
+        "github": github,
+        "interests": json.loads(interests),
+        "skills": json.loads(skills),
+        "joined_at": joined_at,
+        "updated_at": updated_at,
+    }
+
+
+def _get_meta(connection: sqlite3.Connection, key: str) -> str | None:
+    row = connection.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+    return row[0] if row else None
+
+
+def _set_meta(connection: sqlite3.Connection, key: str, value: str | None):
+    connection.execute(
+        "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value)
+    )
+
+
+def _store(connection: sqlite3.Connection, developers: list[dict]):
+    connection.executemany(
+        "INSERT OR REPLACE INTO developers VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        [
+            (
+                dev["email"],
+                dev["name"],
+                dev["github"],
+                dev["github"].lower(),
+                json.dumps(dev.get("interests", [])),
+                json.dumps(dev.get("skills", [])),
+                dev.get("joined_at"),
+                dev.get("updated_at"),
+            )
+            for dev in developers
+        ],
+    )
+
+
+def _download(connection: sqlite3.Connection, on_page=None) -> int | None:
+    """
+    Downloads the whole roster page by page (ordered by email), so neither
+    the backend nor this process ever holds all of it at once.
+
+    Each page replaces the replica's rows in its email range, dropping the
+    developers that no longer exist, so an interrupted download still leaves
+    a consistent replica. The watermark is only set once the last page is in.
+    """
+    total = 0
+    cursor = None
+    server_time = None
+    while True:
+        params = {"limit": PAGE_SIZE}
+        if cursor:
+            params["cursor"] = cursor
+        result = api_request("developers", params=params, cache_ttl=0)
+        if result is None:
+            return None
+
+        developers = result.get("developers", [])
+        # Changes made while downloading are picked up by the next delta sync
+        server_time = server_time or result.get("server_time")
+        # Backends without pagination send everything, and no cursor
+        next_cursor = result.get("next_cursor")
+        with connection:
+            if next_cursor:
+                connection.execute(
+                    "DELETE FROM developers WHERE email > ? AND email <= ?",
+                    (cursor or "", next_cursor),
+                )
+            else:
+                connection.execute(
+                    "DELETE FROM developers WHERE email > ?", (cursor or "",)
+                )
+            _store(connection, developers)
+            if not next_cursor:
+                _set_meta(connection, "watermark", server_time)
+        total += len(developers)
+        if on_page is not None:
+            on_page(developers)
+        if not next_cursor:
+            return total
+        cursor = next_cursor
+
+
+def sync(on_page=None) -> int | None:
+    """
+    Brings the replica up to date with the backend.
+
+    The first sync downloads the whole roster, a page at a time; later ones
+    pass the watermark (the backend's clock at the previous sync, less
+    `WATERMARK_OVERLAP`) as `updated_since` and only receive what changed.
+
+    Args:
+        on_page: Optional callback, called with each page of developers as
+            it is stored during a full download (pages come ordered by
+            email), so callers can show them without waiting for the rest.
+
+    Returns:
+        The number of developers added or updated, or None if the backend
+        couldn't be reached.
+    """
+    try:
+        connection = _connect()
+    except (OSError, sqlite3.Error):
+        return None
+    try:
+        watermark = _get_meta(connection, "watermark")
+        if watermark is None:
+            return _download(connection, on_page)
+
+        since = datetime.datetime.fromisoformat(watermark.replace("Z", "+00:00"))
+        result = api_request(
+            "developers",
+            params={"updated_since": (since - WATERMARK_OVERLAP).isoformat()},
+            cache_ttl=0,
+        )
+        if result is None:
+            return None
+
+        developers = result.get("developers", [])
+        with connection:
+            _store(connection, developers)
+            # Backends without delta support don't send `server_time`, which
+            # keeps every sync a full download
+            _set_meta(connection, "watermark", result.get("server_time"))
+        return len(developers)
+    finally:
+        connection.close()
+
+
+def count_developers() -> int:
+    """Returns the number of developers in the replica."""
+    try:
+        connection = _connect()
+    except (OSError, sqlite3.Error):
+        return 0
+    try:
+        return connection.execute("SELECT COUNT(*) FROM developers").fetchone()[0]
+    finally:
+        connection.close()
+
+
+def iter_pages(page_size: int = PAGE_SIZE):
+    """
+    Yields the developers in the replica a page at a time, ordered by email.
+    Each page is a separate query, so nothing past what's consumed is read.
+    """
+    try:
+        connection = _connect()
+    except (OSError, sqlite3.Error):
+        return
+    try:
+        last_email = ""
+        while True:
+            rows = connection.execute(
+                f"SELECT {DEVELOPER_COLUMNS} FROM developers WHERE email > ? "
+                "ORDER BY email LIMIT ?",
+                (last_email, page_size),
+            ).fetchall()
+            if not rows:
+                return
+            yield [_row_to_developer(row) for row in rows]
+            last_email = rows[-1][0]
+    finally:
+        connection.close()
+
+
+def list_developers() -> list[dict]:
+    """Returns every developer in the replica, ordered by email."""
+    try:
+        connection = _connect()
+    except (OSError, sqlite3.Error):
+        return []
+    try:
+        rows = connection.execute(
+            f"SELECT {DEVELOPER_COLUMNS} FROM developers ORDER BY email"
+        ).fetchall()
+    finally:
+        connection.close()
+    return [_row_to_developer(row) for row in rows]
+
+
+def find_developer(github: str) -> dict | None:
+    """Returns the developer with a GitHub handle (any case), or None."""
+    try:
+        connection = _connect()
+    except (OSError, sqlite3.Error):
+        return None
+    try:
+        row = connection.execute(
+            f"SELECT {DEVELOPER_COLUMNS} FROM developers WHERE github_lower = ?",
+            (github.lower(),),
+        ).fetchone()
+    finally:
+        connection.close()
+    return _row_to_developer(row) if row else None
+
+
+def handles_with_prefix(prefix: str, limit: int = 10) -> list[dict]:
+    """
+    Returns the GitHub handles in the replica starting with `prefix` (any
+    case), in order, with their developers' names. Reads one range of the
+    handle index.
+    """
+    try:
+        connection = _connect()
+    except (OSError, sqlite3.Error):
+        return []
+    try:
+        rows = connection.execute(
+            "SELECT github, name FROM developers "
+            "WHERE github_lower >= ? AND github_lower < ? "
+            "ORDER BY github_lower LIMIT ?",
+            (prefix.lower(), prefix.lower() + "\U0010ffff", limit),
+        ).fetchall()
+    finally:
+        connection.close()
+    return [{"github": github, "name": name} for github, name in rows]
+
+
+def normalize_term(term: str) -> str:
+    """Normalizes a skill or interest the way the backend's search index does."""
+    return " ".join(term.split()).casefold()
+
+
+def search(
+    skills: list[str], interests: list[str], match_all: bool = True
+) -> list[dict]:
+    """
+    Finds developers in the replica by skill and interest, for when the
+    backend's search can't be reached.
+
+    Args:
+        skills: Skills to look for.
+        interests: Interests to look for.
+        match_all: Whether developers need every term, or just one.
+
+    Returns:
+        The matching developers, ordered by email.
+    """
+    wanted = [("skills", normalize_term(term)) for term in skills] + [
+        ("interests", normalize_term(term)) for term in interests
+    ]
+    matches = []
+    for page in iter_pages():
+        for dev in page:
+            terms = {
+                field: {normalize_term(term) for term in dev[field]}
+                for field in ("skills", "interests")
+            }
+            hits = [term in terms[field] for field, term in wanted]
+            if all(hits) if match_all else any(hits):
+                matches.append(dev)
+    return matches
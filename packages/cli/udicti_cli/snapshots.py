@@ -0,0 +1,146 @@
+# File: packages/cli/udicti_cli/snapshots.py
+
+"""
+This module persists the dashboard's per-repository aggregates between runs.
+A snapshot records, for each repository, its language bytes, commit count
+and recent commits for the one-year window, keyed by the `pushed_at` they
+were computed for, and a watermark of when its commits were last synced, so
+the next run only has to ask GitHub about the repositories pushed to since.
+It also keeps the profiles shown alongside, so the last dashboard can be
+shown again without the network, but only to the login it belongs to.
+"""
+
+import datetime
+import hashlib
+import json
+import os
+
+from .utils import APP_DIR
+
+SNAPSHOT_DIR = APP_DIR / "snapshots"
+SNAPSHOT_VERSION = 1
+# Maps a hash of each stored GitHub token to the login whose snapshot it
+# saved, so a saved dashboard can be found before GitHub is asked who the
+# token belongs to (and never shown after logging in as someone else)
+LOGINS_PATH = SNAPSHOT_DIR / "logins.json"
+
+
+def _snapshot_path(username: str):
+    return SNAPSHOT_DIR / f"{username.lower()}.json"
+
+
+def _token_hash(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def _load_logins() -> dict:
+    try:
+        with open(LOGINS_PATH, "r") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def _parse_date(value: str) -> datetime.datetime:
+    return datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def load_snapshot(username: str) -> dict | None:
+    """
+    Loads the last saved snapshot for a GitHub user.
+
+    Returns:
+        A dictionary with `saved_at` and `window_start` (datetimes), `repos`
+        (repo name to stats, with recent commit dates parsed back into
+        datetimes) and the `user`/`udicti` profiles if they were saved, or
+        None if there is no usable snapshot.
+    """
+    try:
+        with open(_snapshot_path(username), "r") as f:
+            snapshot = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return None
+
+    if snapshot.get("version") != SNAPSHOT_VERSION:
+        return None
+
+    snapshot["saved_at"] = _parse_date(snapshot["saved_at"])
+    snapshot["window_start"] = _parse_date(snapshot["window_start"])
+    for stats in snapshot["repos"].values():
+        for entry in stats["recent"]:
+            entry["date"] = _parse_date(entry["date"])
+    return snapshot
+
+
+def load_token_snapshot(token: str) -> dict | None:
+    """
+    Loads the snapshot saved with a GitHub token, so the dashboard of the
+    logged in user can be shown before GitHub confirms who that is.
+
+    Returns:
+        The snapshot, as from `load_snapshot`, or None if this token hasn't
+        saved one (e.g. after logging in again or as someone else).
+    """
+    username = _load_logins().get(_token_hash(token))
+    return load_snapshot(username) if username else None
+
+
+def save_snapshot(
+    username: str,
+    window_start: datetime.datetime,
+    repo_stats: list[dict],
+    user: dict | None = None,
+    udicti: dict | None = None,
+    token: str | None = None,
+):
+    """
+    Saves the per-repository stats from a dashboard run.
+
+    Args:
+        username: The GitHub login the stats belong to.
+        window_start: The start of the one-year window the counts cover.
+        repo_stats: The per-repository stats dictionaries from the run.
+        user: The GitHub profile shown with the stats.
+        udicti: The UDICTI profile shown with the stats.
+        token: The GitHub token the stats were fetched with, which
+            `load_token_snapshot` finds them by.
+    """
+    snapshot = {
+        "version": SNAPSHOT_VERSION,
+        "username": username,
+        "saved_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "window_start": window_start.isoformat(),
+        "user": user,
+        "udicti": udicti,
+        "repos": {
+            stats["name"]: {
+                **stats,
+                "recent": [
+                    {**entry, "date": entry["date"].isoformat()}
+                    for entry in stats["recent"]
+                ],
+            }
+            for stats in repo_stats
+        },
+    }
+    try:
+        SNAPSHOT_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+        path = _snapshot_path(username)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(snapshot, f)
+        os.replace(tmp_path, path)
+        if token:
+            # One token per login: logging in again replaces the old one
+            logins = {
+                token_hash: login
+                for token_hash, login in _load_logins().items()
+                if login.lower() != username.lower()
+            }
+            logins[_token_hash(token)] = username
+            tmp_path = LOGINS_PATH.with_suffix(".tmp")
+            with open(tmp_path, "w") as f:
+                json.dump(logins, f)
+            os.replace(tmp_path, LOGINS_PATH)
+    except OSError:
+        pass  # Snapshots only speed up the next run
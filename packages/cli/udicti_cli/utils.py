@@ -1,38 +1,427 @@
 # File: packages/cli/udicti_cli/utils.py
+import atexit
+import hashlib
+import json
+import os
+import queue
+import random
 import requests
-from datetime import datetime
+import shutil
+import threading
+import time
+import typer
+from datetime import datetime, timezone
+from pathlib import Path
 from rich.console import Console
 
-console = Console()
+from . import profiling
+
+# Errors go to stderr so they never end up in machine-readable output
+console = Console(stderr=True)
+
+# Point to your Render backend (overridable, e.g. to run against a local stub)
+BACKEND_API = os.environ.get(
+    "UDICTI_BACKEND_API", "https://udicti-cli.onrender.com/api"
+)
+
+# Per-user directory for local state (auth, caches, snapshots)
+APP_DIR = Path(typer.get_app_dir("udicti-cli"))
+
+# Backend client: one pooled keep-alive session per process, so Render's
+# slow TLS/cold-start round trips are paid once rather than per request
+BACKEND_CACHE_DIR = APP_DIR / "backend_cache"
+BACKEND_CACHE_TTL = 300  # Seconds a GET response is reused without asking again
+# Cached responses older than the default TTL are deleted
+BACKEND_MAX_RETRIES = 3
+# Seconds to wait for a connection, and for a response once connected
+BACKEND_CONNECT_TIMEOUT = 3.05
+BACKEND_READ_TIMEOUT = 10
+# Longest a GET may take overall, retries and backoff included
+BACKEND_DEADLINE = 15
+# Worth retrying idempotent requests on: the backend is waking up or restarting
+BACKEND_RETRY_STATUSES = (502, 503, 504)
+
+_session = None
+_session_lock = threading.Lock()
+_response_cache = {}
+_cache_pruned = False
+
+
+def get_session() -> requests.Session:
+    """Returns the shared backend session, creating it on first use."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=2, pool_maxsize=8)
+            _session.mount("https://", adapter)
+            _session.mount("http://", adapter)
+    return _session
+
+
+def _timed_request(method: str, url: str, **kwargs) -> requests.Response:
+    """Sends a backend request, timing it for `--profile`."""
+    started = time.perf_counter()
+    try:
+        response = get_session().request(method, url, **kwargs)
+    except requests.exceptions.RequestException:
+        profiling.record_http(method, url, started)
+        raise
+    profiling.record_http(
+        method, url, started, response.status_code, len(response.content)
+    )
+    return response
+
+
+# Telemetry: events are queued and sent in batches by a background thread,
+# so a slow or unreachable backend never delays a command. Events that can't
+# be sent are appended to a spool file and retried on a later run.
+TELEMETRY_SPOOL_PATH = APP_DIR / "telemetry_spool.jsonl"
+TELEMETRY_BATCH_SIZE = 50
+# Spooled events are resent in chunks; the backend accepts up to 5000 at once
+TELEMETRY_SPOOL_CHUNK = 500
+TELEMETRY_BATCH_WINDOW = 0.2  # Seconds to wait for more events to batch
+TELEMETRY_EXIT_DEADLINE = 0.5  # Longest a command may wait for telemetry at exit
+TELEMETRY_MAX_SPOOL_BYTES = 1024 * 1024
+
+_telemetry_queue = queue.Queue()
+_telemetry_thread = None
+_telemetry_lock = threading.Lock()
+# Events claimed from the spool that the sender hasn't taken yet. The sender
+# takes a chunk at a time under `_telemetry_lock`; at exit, only what is
+# left here (and in the queue) is spooled again, never a chunk that may be
+# on its way to the backend.
+_telemetry_spool_backlog = []
+_telemetry_spool_drained = False
+
+
+def _spool_events(events: list):
+    """Appends events to the spool file, unless it has grown too large."""
+    if not events:
+        return
+    try:
+        if (
+            TELEMETRY_SPOOL_PATH.exists()
+            and TELEMETRY_SPOOL_PATH.stat().st_size > TELEMETRY_MAX_SPOOL_BYTES
+        ):
+            return
+        TELEMETRY_SPOOL_PATH.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        with open(TELEMETRY_SPOOL_PATH, "a") as f:
+            f.write("".join(json.dumps(event) + "\n" for event in events))
+    except OSError:
+        pass
+
+
+def _claim_spooled_events() -> list:
+    """Takes the spooled events out of the spool file."""
+    try:
+        claimed = TELEMETRY_SPOOL_PATH.with_suffix(".sending")
+        TELEMETRY_SPOOL_PATH.replace(claimed)
+        with open(claimed, "r") as f:
+            lines = f.readlines()
+        claimed.unlink()
+    except OSError:
+        return []
+    events = []
+    for line in lines:
+        try:
+            events.append(json.loads(line))
+        except json.JSONDecodeError:
+            pass
+    return events
+
+
+def _send_events(events: list) -> bool:
+    """
+    POSTs a batch of events, spooling them if the backend can't be reached.
+
+    Returns:
+        Whether the backend took the events.
+    """
+    try:
+        response = _timed_request(
+            "POST", f"{BACKEND_API}/log/batch", json={"events": events}, timeout=3
+        )
+        response.raise_for_status()
+    except requests.exceptions.RequestException:
+        _spool_events(events)
+        return False
+    return True
+
+
+def _drain_spool():
+    """Resends what earlier runs couldn't send, a chunk at a time."""
+    claimed = _claim_spooled_events()
+    with _telemetry_lock:
+        _telemetry_spool_backlog.extend(claimed)
+    while True:
+        with _telemetry_lock:
+            chunk = _telemetry_spool_backlog[:TELEMETRY_SPOOL_CHUNK]
+            del _telemetry_spool_backlog[:TELEMETRY_SPOOL_CHUNK]
+        if not chunk or not _send_events(chunk):
+            break
+    # Offline again: keep the rest for a later run
+    with _telemetry_lock:
+        rest = list(_telemetry_spool_backlog)
+        _telemetry_spool_backlog.clear()
+    _spool_events(rest)
+
+
+def _telemetry_worker():
+    """Drains the queue in batches until it receives the `None` sentinel."""
+    global _telemetry_spool_drained
+    while True:
+        event = _telemetry_queue.get()
+        if event is None:
+            return
+        batch = [event]
+        stop = False
+        deadline = time.monotonic() + TELEMETRY_BATCH_WINDOW
+        while len(batch) < TELEMETRY_BATCH_SIZE:
+            try:
+                event = _telemetry_queue.get(
+                    timeout=max(deadline - time.monotonic(), 0)
+                )
+            except queue.Empty:
+                break
+            if event is None:
+                stop = True
+                break
+            batch.append(event)
+        sent = _send_events(batch)
+        # Online again: retry whatever earlier runs couldn't send, once per run
+        if sent and not _telemetry_spool_drained:
+            _telemetry_spool_drained = True
+            _drain_spool()
+        if stop:
+            return
+
+
+def flush_telemetry(deadline: float = TELEMETRY_EXIT_DEADLINE):
+    """
+    Gives queued events until `deadline` seconds to be sent, then spools
+    whatever the sender hasn't taken for the next run. Registered to run at
+    exit.
+    """
+    global _telemetry_thread
+    with _telemetry_lock:
+        thread, _telemetry_thread = _telemetry_thread, None
+    if thread is None:
+        return
+    _telemetry_queue.put(None)
+    thread.join(deadline)
+
+    # A batch the sender already took may have reached the backend, so it
+    # isn't spooled again; only events it hasn't taken are
+    with _telemetry_lock:
+        pending = list(_telemetry_spool_backlog)
+        _telemetry_spool_backlog.clear()
+    while True:
+        try:
+            event = _telemetry_queue.get_nowait()
+        except queue.Empty:
+            break
+        if event is not None:
+            pending.append(event)
+    _spool_events(pending)
 
-# Point to your Render backend
-BACKEND_API = "https://udicti-cli.onrender.com/api"
 
 def log_event(event: str, data: dict = None):
-    """Send anonymous usage event to your secure backend"""
+    """Queue an anonymous usage event for the backend (never blocks)"""
+    global _telemetry_thread
     try:
         payload = {
             "event": event,
-            "timestamp": datetime.now(datetime.UTC),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
             "source": "cli",
-            "data": data or {}
+            "data": data or {},
         }
-        # Non-blocking, fast timeout
-        requests.post(f"{BACKEND_API}/log", json=payload, timeout=3)
-    except:
+        _telemetry_queue.put(payload)
+        with _telemetry_lock:
+            if _telemetry_thread is None:
+                _telemetry_thread = threading.Thread(
+                    target=_telemetry_worker, name="udicti-telemetry", daemon=True
+                )
+                _telemetry_thread.start()
+                atexit.register(flush_telemetry)
+    except Exception:
         pass  # Silent fail — UX first
 
-def api_request(endpoint: str, method: str = "GET", data: dict = None):
-    """Make API request to backend"""
+
+def _cache_path(endpoint: str, params: dict | None):
+    """
+    Returns where a GET response is cached. Entries are grouped by the
+    endpoint's first path segment, which is what a POST invalidates.
+    """
+    group = endpoint.strip("/").split("/")[0] or "_root"
+    material = json.dumps([endpoint, sorted((params or {}).items())], default=str)
+    key = hashlib.sha256(material.encode()).hexdigest()
+    return BACKEND_CACHE_DIR / group / f"{key}.json"
+
+
+def _cache_load(path: Path, ttl: float):
+    """Returns a cached response body if it is younger than `ttl` seconds."""
+    entry = _response_cache.get(path)
+    if entry is None:
+        try:
+            with open(path, "r") as f:
+                entry = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        _response_cache[path] = entry
+    if time.time() - entry["stored_at"] > ttl:
+        return None
+    return entry["body"]
+
+
+def _cache_prune():
+    """Deletes the cached responses past `BACKEND_CACHE_TTL`, once per process."""
+    global _cache_pruned
+    if _cache_pruned:
+        return
+    _cache_pruned = True
+    expired_before = time.time() - BACKEND_CACHE_TTL
+    for path in BACKEND_CACHE_DIR.glob("*/*.json"):
+        try:
+            if path.stat().st_mtime < expired_before:
+                path.unlink()
+        except OSError:
+            pass
+
+
+def _cache_store(path: Path, body):
+    """Saves a response body in memory and on disk."""
+    entry = {"stored_at": time.time(), "body": body}
+    _response_cache[path] = entry
+    _cache_prune()
+    try:
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        pass  # Caching is best-effort
+
+
+def _cache_invalidate(endpoint: str):
+    """Drops every cached GET under the same first path segment as `endpoint`."""
+    group_dir = _cache_path(endpoint, None).parent
+    for path in list(_response_cache):
+        if path.parent == group_dir:
+            del _response_cache[path]
+    shutil.rmtree(group_dir, ignore_errors=True)
+
+
+def _get_with_retries(
+    url: str,
+    params: dict | None,
+    retries: int = BACKEND_MAX_RETRIES,
+    deadline: float = BACKEND_DEADLINE,
+) -> requests.Response:
+    """
+    GETs a backend URL, retrying connection errors, timeouts and 502-504
+    responses with exponential backoff plus jitter, for at most `deadline`
+    seconds in all.
+    """
+    give_up_at = time.monotonic() + deadline
+    for attempt in range(retries + 1):
+        # Every attempt, the last included, ends by the deadline
+        remaining = give_up_at - time.monotonic()
+        timeout = (
+            min(BACKEND_CONNECT_TIMEOUT, remaining),
+            min(BACKEND_READ_TIMEOUT, remaining),
+        )
+        error = None
+        try:
+            response = _timed_request("GET", url, params=params, timeout=timeout)
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            response, error = None, e
+        if response is not None and response.status_code not in BACKEND_RETRY_STATUSES:
+            return response
+
+        backoff = 0.5 * 2**attempt + random.uniform(0, 0.5)
+        # Give up once out of retries, or if the next attempt couldn't start
+        # with at least a second to go
+        if attempt == retries or time.monotonic() + backoff + 1 > give_up_at:
+            break
+        time.sleep(backoff)
+    if error is not None:
+        raise error
+    return response
+
+
+def api_request(
+    endpoint: str,
+    method: str = "GET",
+    data: dict = None,
+    params: dict = None,
+    cache_ttl: float = BACKEND_CACHE_TTL,
+    missing_ok: bool = False,
+    retry: bool = True,
+    deadline: float = BACKEND_DEADLINE,
+    quiet: bool = False,
+):
+    """
+    Make API request to backend
+
+    GET responses are cached for `cache_ttl` seconds (0 to always ask the
+    backend, and not store the response); a POST invalidates the cached GETs of the same resource, so
+    e.g. the roster is fetched fresh right after `udicti join`. With
+    `missing_ok`, a 404 returns an empty dictionary instead of being
+    reported, so callers can tell "not found" from "unreachable" (None).
+
+    GETs give up after `deadline` seconds. Interactive callers with a
+    fallback (e.g. shell completion) can pass `retry=False`, a shorter
+    deadline and `quiet=True`, so nothing is printed when they give up.
+    """
     try:
         url = f"{BACKEND_API}/{endpoint}"
         if method == "GET":
-            response = requests.get(url, timeout=10)
+            cache_path = _cache_path(endpoint, params)
+            if cache_ttl > 0:
+                body = _cache_load(cache_path, cache_ttl)
+                if body is not None:
+                    return body
+            retries = BACKEND_MAX_RETRIES if retry else 0
+            response = _get_with_retries(url, params, retries, deadline)
         elif method == "POST":
-            response = requests.post(url, json=data, timeout=10)
-        
+            # POSTs aren't idempotent, so they are never retried
+            response = _timed_request(
+                "POST",
+                url,
+                json=data,
+                timeout=(BACKEND_CONNECT_TIMEOUT, BACKEND_READ_TIMEOUT),
+            )
+
+        if missing_ok and response.status_code == 404:
+            return {}
         response.raise_for_status()
-        return response.json()
+        body = response.json()
+        if isinstance(body, dict) and body.get("error"):
+            # Streamed responses that fail part way still have a 200 status
+            if not quiet:
+                console.print(
+                    f"[bold red]The UDICTI backend failed: {body['error']}[/bold red]"
+                )
+            return None
+        if method == "GET" and cache_ttl > 0:
+            _cache_store(cache_path, body)
+        elif method == "POST":
+            _cache_invalidate(endpoint)
+        return body
     except requests.exceptions.RequestException as e:
-        console.print(f"[bold red]Error connecting to UDICTI backend: {e}[/bold red]")
-        return None
\ No newline at end of file
+        if quiet:
+            return None
+        try:
+            # The backend explains errors it refuses a request with
+            message = e.response.json()["error"]
+        except (AttributeError, ValueError, KeyError, TypeError):
+            message = None
+        if message:
+            console.print(f"[bold red]UDICTI backend: {message}[/bold red]")
+        else:
+            console.print(
+                f"[bold red]Error connecting to UDICTI backend: {e}[/bold red]"
+            )
+        return None
@@ -0,0 +1,106 @@
+"""
+Checks that the CLI keeps starting quickly.
+
+1. `import udicti_cli.main` must stay within an import-time budget, measured
+   with `python -X importtime` in a fresh interpreter (best of a few runs).
+2. It must not import any command module or heavy dependency; those are
+   loaded lazily when their command runs.
+3. The help texts registered for lazy commands (at any level) must match the
+   help of the real command apps, so `--help` never drifts from the commands.
+
+Usage:
+    python scripts/check_import_time.py [--budget-ms 150] [--runs 5]
+"""
+
+import argparse
+import subprocess
+import sys
+
+# Modules that must only be imported once a command that needs them runs
+FORBIDDEN_AT_STARTUP = (
+    "udicti_cli.commands",
+    "udicti_cli.utils",
+    "requests",
+    "httpx",
+    "rich_gradient",
+    "firebase_admin",
+)
+
+
+def measure_import_ms() -> tuple[float, set[str]]:
+    """Imports the CLI in a fresh interpreter; returns its time and modules."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import udicti_cli.main"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total_us = 0
+    modules = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue  # The header line
+        modules.add(name.strip())
+        if name.strip() == "udicti_cli.main":
+            total_us = int(cumulative)
+    return total_us / 1000, modules
+
+
+def check_help_texts(group=None, prefix: str = "") -> list[str]:
+    """
+    Compares each lazy command's help with the real command's help, then
+    does the same for the lazy subcommands of lazy groups (e.g. `dashboard`).
+    Line breaks don't count, as docstrings wrap where the listings don't.
+    """
+    from udicti_cli.lazy import LazyGroup, load_command
+    from udicti_cli.main import UdictiGroup
+
+    group = group or UdictiGroup
+    problems = []
+    for name, lazy_command in group.lazy_commands.items():
+        command = load_command(name, lazy_command)
+        real_help = command.short_help or command.help
+        if " ".join(real_help.split()) != " ".join(lazy_command.help.split()):
+            problems.append(
+                f"'{prefix}{name}' is listed as {lazy_command.help!r} but its help "
+                f"is {real_help!r}; update {group.__name__}.lazy_commands"
+            )
+        if isinstance(command, LazyGroup):
+            problems.extend(check_help_texts(type(command), f"{prefix}{name} "))
+    return problems
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--budget-ms", type=float, default=150.0)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    failures = []
+
+    # 1. Import time, keeping the fastest run to smooth out noise
+    runs = [measure_import_ms() for _ in range(args.runs)]
+    best_ms = min(ms for ms, _ in runs)
+    print(f"import udicti_cli.main: {best_ms:.1f} ms (budget {args.budget_ms} ms)")
+    if best_ms > args.budget_ms:
+        failures.append(f"import took {best_ms:.1f} ms, over the budget")
+
+    # 2. Modules that should have been deferred
+    modules = runs[0][1]
+    for forbidden in FORBIDDEN_AT_STARTUP:
+        if forbidden in modules:
+            failures.append(f"'{forbidden}' is imported at startup")
+
+    # 3. Lazy help texts
+    failures.extend(check_help_texts())
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,41 @@
+"""
+Shared fixtures: the benchmark stub server, standing in for both the UDICTI
+backend and the GitHub API, and a CLI pointed at it with its app directory
+(roster replica, caches) under a temporary path.
+"""
+
+import pytest
+from stub_server import StubServer
+
+from udicti_cli import github_client, http_cache, roster, utils
+
+
+@pytest.fixture(scope="session")
+def stub():
+    server = StubServer().start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def backend(stub, tmp_path, monkeypatch):
+    """Points the backend client and the roster replica at the stub."""
+    monkeypatch.setattr(utils, "BACKEND_API", f"{stub.url}/api")
+    monkeypatch.setattr(utils, "BACKEND_CACHE_DIR", tmp_path / "backend_cache")
+    monkeypatch.setattr(utils, "_response_cache", {})
+    monkeypatch.setattr(utils, "_cache_pruned", False)
+    monkeypatch.setattr(roster, "ROSTER_PATH", tmp_path / "roster.sqlite3")
+    stub.take_counts()
+    return stub
+
+
+@pytest.fixture
+def github(stub, tmp_path, monkeypatch):
+    """Points the GitHub client and its HTTP cache at the stub."""
+    monkeypatch.setattr(github_client, "GITHUB_API_BASE_URL", stub.url)
+    monkeypatch.setattr(http_cache, "CACHE_DIR", tmp_path / "http_cache")
+    monkeypatch.setattr(http_cache, "enabled", True)
+    github_client.close_client()
+    stub.take_counts()
+    yield stub
+    github_client.close_client()
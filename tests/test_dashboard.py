@@ -0,0 +1,149 @@
+import copy
+import datetime
+
+import pytest
+
+from udicti_cli import github_client, snapshots
+from udicti_cli.commands import dashboard
+from udicti_cli.commands.dashboard import Backend
+
+TOKEN = "benchmark-token"
+DAY = datetime.timedelta(days=1)
+
+
+@pytest.fixture
+def collect(backend, github, tmp_path, monkeypatch):
+    """Runs `dashboard me`'s collection against the stub; returns its repos."""
+    monkeypatch.setattr(snapshots, "SNAPSHOT_DIR", tmp_path / "snapshots")
+    monkeypatch.setattr(snapshots, "LOGINS_PATH", tmp_path / "snapshots" / "logins")
+
+    def run(backend=Backend.rest, use_snapshot=True, today=None):
+        monkeypatch.setattr(
+            github_client, "scheduler", github_client.RateLimitScheduler()
+        )
+        today = today or datetime.datetime.now(datetime.timezone.utc)
+        result = github_client.run(
+            dashboard._collect_dashboard(TOKEN, today, backend, use_snapshot)
+        )
+        return {stats["name"]: stats for stats in result["repo_stats"]}
+
+    return run
+
+
+@pytest.fixture
+def fixture_data(github, monkeypatch):
+    """A copy of the stub's GitHub data that a test can change."""
+    data = copy.deepcopy(github.github)
+    monkeypatch.setattr(github, "github", data)
+    return data
+
+
+def _iso(moment: datetime.datetime) -> str:
+    return moment.isoformat().replace("+00:00", "Z")
+
+
+def _without_watermarks(repos: dict) -> dict:
+    return {
+        name: {key: value for key, value in stats.items() if key != "watermark"}
+        for name, stats in repos.items()
+    }
+
+
+def _totals(repos: dict) -> dict:
+    summary = dashboard._summarize(list(repos.values()))
+    return {
+        key: summary[key] for key in ("total_commits", "languages_used", "active_repos")
+    }
+
+
+def test_graphql_covers_the_same_repositories_as_rest(collect, github):
+    rest = collect(Backend.rest, use_snapshot=False)
+    github.take_counts()
+
+    graphql = collect(Backend.graphql, use_snapshot=False)
+
+    # The stub also lists a private and an organization repository for the
+    # viewer, as GitHub does, unless the query leaves them out like REST
+    assert sorted(graphql) == sorted(rest)
+    assert _totals(graphql) == _totals(rest)
+    counts = github.take_counts()
+    assert counts["github:graphql"] == 2
+    assert "github:repos" not in counts
+
+
+def test_unchanged_repositories_are_not_asked_again(collect, github):
+    first = collect()
+    github.take_counts()
+
+    second = collect()
+
+    assert _without_watermarks(second) == _without_watermarks(first)
+    # Only the user and their repositories, to see which were pushed to
+    assert github.take_counts() == {"github:user": 1, "github:repos": 1}
+
+
+def test_failed_languages_fetch_is_retried(collect, github, monkeypatch):
+    route_get = github.route_get
+
+    def failing_route_get(path, query, params=None):
+        if path.endswith("/project-00/languages"):
+            return "github:languages", (404, {"message": "Not Found"}, None)
+        return route_get(path, query, params)
+
+    monkeypatch.setattr(github, "route_get", failing_route_get)
+    first = collect()
+    assert first["project-00"]["languages"] == {}
+    monkeypatch.setattr(github, "route_get", route_get)
+    github.take_counts()
+
+    second = collect()
+
+    assert second["project-00"]["languages"] == github.github["languages"]["project-00"]
+    assert github.take_counts()["github:languages"] == 1
+
+
+def test_late_push_is_recounted(collect, github, fixture_data):
+    collect()
+    now = datetime.datetime.now(datetime.timezone.utc)
+    # A branch merged now, with a commit authored before the last run
+    commits = fixture_data["commits"]["project-00"]
+    commits.insert(
+        0,
+        {
+            "sha": "f" * 40,
+            "author": {"login": "benchdev"},
+            "commit": {
+                "message": "Old work, merged late",
+                "author": {"name": "benchdev", "date": _iso(now - DAY * 20)},
+            },
+        },
+    )
+    fixture_data["repos"][0]["pushed_at"] = _iso(now)
+
+    incremental = collect()
+
+    assert _without_watermarks(incremental) == _without_watermarks(
+        collect(use_snapshot=False)
+    )
+    assert "Old work, merged late" in [
+        commit["message"] for commit in incremental["project-00"]["recent"]
+    ]
+
+
+def test_commits_expire_out_of_the_window(collect, fixture_data):
+    now = datetime.datetime.now(datetime.timezone.utc)
+    mine = [
+        commit
+        for commit in fixture_data["commits"]["project-00"]
+        if commit["author"]["login"] == "benchdev"
+    ]
+    for commit in mine[-3:]:
+        commit["commit"]["author"]["date"] = _iso(now - DAY * 380)
+    first = collect(today=now - DAY * 30)
+
+    second = collect(today=now)
+
+    assert second["project-00"]["commit_count"] == (
+        first["project-00"]["commit_count"] - 3
+    )
+    assert _totals(second) == _totals(collect(use_snapshot=False, today=now))
@@ -0,0 +1,52 @@
+from udicti_cli import github_client, http_cache
+
+
+def test_unchanged_resource_is_served_from_cache(github):
+    first = github_client.get("user", token="token")
+    assert first.status_code == 200
+    assert not first.extensions.get("from_cache")
+    assert "If-None-Match" not in first.request.headers
+
+    second = github_client.get("user", token="token")
+
+    # The stub answered the conditional request with a 304...
+    assert second.request.headers["If-None-Match"] == first.headers["etag"]
+    assert second.extensions.get("from_cache")
+    # ...and the client rebuilt the 200 from the entry on disk
+    assert second.status_code == 200
+    assert second.json() == first.json() == github.github["user"]
+    assert second.headers["etag"] == first.headers["etag"]
+    assert github.take_counts() == {"github:user": 2}
+
+
+def test_async_requests_revalidate_too(github):
+    async def fetch_twice():
+        first = await github_client.aget("user", token="token")
+        second = await github_client.aget("user", token="token")
+        return first, second
+
+    first, second = github_client.run(fetch_twice())
+
+    assert not first.extensions.get("from_cache")
+    assert second.extensions.get("from_cache")
+    assert second.json() == first.json()
+
+
+def test_entries_are_kept_per_token(github):
+    github_client.get("user", token="token")
+
+    response = github_client.get("user", token="another-token")
+
+    assert "If-None-Match" not in response.request.headers
+    assert not response.extensions.get("from_cache")
+
+
+def test_disabled_cache_sends_unconditional_requests(github, monkeypatch):
+    github_client.get("user", token="token")
+    monkeypatch.setattr(http_cache, "enabled", False)
+
+    response = github_client.get("user", token="token")
+
+    assert "If-None-Match" not in response.request.headers
+    assert not response.extensions.get("from_cache")
+    assert response.json() == github.github["user"]
@@ -0,0 +1,115 @@
+from datetime import datetime, timezone
+
+from udicti_cli import roster
+
+
+def _emails():
+    connection = roster._connect()
+    try:
+        rows = connection.execute("SELECT email FROM developers ORDER BY email")
+        return [email for (email,) in rows]
+    finally:
+        connection.close()
+
+
+def _watermark():
+    connection = roster._connect()
+    try:
+        return roster._get_meta(connection, "watermark")
+    finally:
+        connection.close()
+
+
+def _developer(email, github, skills=()):
+    now = datetime.now(timezone.utc).isoformat()
+    return {
+        "name": github.title(),
+        "email": email,
+        "github": github,
+        "skills": list(skills),
+        "interests": [],
+        "joined_at": now,
+        "updated_at": now,
+    }
+
+
+def test_first_sync_downloads_every_page(backend, monkeypatch):
+    monkeypatch.setattr(roster, "PAGE_SIZE", 25)
+    pages = []
+
+    assert roster.sync(on_page=pages.append) == 120
+
+    assert [len(page) for page in pages] == [25, 25, 25, 25, 20]
+    assert _emails() == sorted(d["email"] for d in backend.developers)
+    assert _watermark() is not None
+    assert backend.take_counts() == {"backend:developers": 5}
+
+
+def test_interrupted_download_resumes_on_next_sync(backend, monkeypatch):
+    monkeypatch.setattr(roster, "PAGE_SIZE", 25)
+    real_request = roster.api_request
+    calls = []
+
+    def failing_request(*args, **kwargs):
+        calls.append(kwargs.get("params"))
+        if len(calls) == 3:
+            return None  # The backend goes away mid-download
+        return real_request(*args, **kwargs)
+
+    monkeypatch.setattr(roster, "api_request", failing_request)
+    assert roster.sync() is None
+    # The pages already in are kept, but without a watermark the next sync
+    # is a full download rather than a delta from a partial replica
+    assert len(_emails()) == 50
+    assert _watermark() is None
+
+    assert roster.sync() == 120
+    assert roster.count_developers() == 120
+    assert _watermark() is not None
+
+
+def test_download_drops_developers_removed_from_the_backend(backend, monkeypatch):
+    monkeypatch.setattr(roster, "PAGE_SIZE", 25)
+    emails = sorted(d["email"] for d in backend.developers)
+    stale = [
+        _developer(emails[30] + "x", "gone-mid-roster"),
+        _developer("zzz-" + emails[-1], "gone-past-the-end"),
+    ]
+    connection = roster._connect()
+    with connection:
+        roster._store(connection, stale)
+    connection.close()
+    assert roster.count_developers() == 2
+
+    assert roster.sync() == 120
+
+    assert _emails() == emails
+    assert roster.find_developer("gone-mid-roster") is None
+    assert roster.find_developer("gone-past-the-end") is None
+
+
+def test_delta_sync_fetches_only_changes(backend, monkeypatch):
+    assert roster.sync() == 120
+    backend.take_counts()
+
+    added = _developer("new@example.com", "newcomer", skills=["Rust"])
+    changed = dict(backend.developers[0], skills=["Go"])
+    changed["updated_at"] = added["updated_at"]
+    monkeypatch.setattr(
+        backend, "developers", [changed, *backend.developers[1:], added]
+    )
+
+    assert roster.sync() == 2
+
+    assert roster.count_developers() == 121
+    assert roster.find_developer("newcomer")["skills"] == ["Rust"]
+    assert roster.find_developer(changed["github"])["skills"] == ["Go"]
+    assert backend.take_counts() == {"backend:developers": 1}
+
+
+def test_sync_without_backend_keeps_the_replica(backend, monkeypatch):
+    assert roster.sync() == 120
+    monkeypatch.setattr(roster, "api_request", lambda *args, **kwargs: None)
+
+    assert roster.sync() is None
+    assert roster.count_developers() == 120
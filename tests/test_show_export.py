@@ -0,0 +1,84 @@
+import csv
+import io
+import json
+
+import pytest
+
+from udicti_cli.commands.show import EXPORT_FIELDS, DeveloperExporter, OutputFormat
+
+DEVELOPERS = [
+    {
+        "name": "Ada Lovelace",
+        "email": "ada@example.com",
+        "github": "ada",
+        "skills": ["Python", "Math"],
+        "interests": ["AI"],
+        "joined_at": "2026-01-01T00:00:00Z",
+        "updated_at": "2026-01-02T00:00:00Z",
+    },
+    {
+        "name": "Grace Hopper",
+        "email": "grace@example.com",
+        "github": "grace",
+        "skills": [],
+        "interests": ["Compilers", "Navy"],
+        "joined_at": "2026-01-03T00:00:00Z",
+        "updated_at": None,
+    },
+]
+
+
+def _export(output_format, pages, capsys):
+    exporter = DeveloperExporter(output_format)
+    for page in pages:
+        exporter.add_page(page)
+    exporter.close()
+    assert exporter.shown == sum(len(page) for page in pages)
+    return capsys.readouterr().out
+
+
+@pytest.mark.parametrize("pages", [[DEVELOPERS], [DEVELOPERS[:1], DEVELOPERS[1:]]])
+def test_csv(pages, capsys):
+    rows = list(csv.reader(io.StringIO(_export(OutputFormat.csv, pages, capsys))))
+
+    assert rows[0] == EXPORT_FIELDS
+    assert len(rows) == 3
+    first = dict(zip(rows[0], rows[1]))
+    assert first["github"] == "ada"
+    assert first["skills"] == "Python;Math"
+    assert dict(zip(rows[0], rows[2]))["skills"] == ""
+
+
+@pytest.mark.parametrize("pages", [[DEVELOPERS], [DEVELOPERS[:1], DEVELOPERS[1:]]])
+def test_json(pages, capsys):
+    records = json.loads(_export(OutputFormat.json, pages, capsys))
+
+    assert [list(record) for record in records] == [EXPORT_FIELDS] * 2
+    assert records[0]["skills"] == ["Python", "Math"]
+    assert records[1]["interests"] == ["Compilers", "Navy"]
+
+
+@pytest.mark.parametrize("pages", [[DEVELOPERS], [DEVELOPERS[:1], DEVELOPERS[1:]]])
+def test_ndjson(pages, capsys):
+    lines = _export(OutputFormat.ndjson, pages, capsys).splitlines()
+
+    assert [json.loads(line)["github"] for line in lines] == ["ada", "grace"]
+    assert all(list(json.loads(line)) == EXPORT_FIELDS for line in lines)
+
+
+def test_empty_exports(capsys):
+    assert _export(OutputFormat.csv, [], capsys) == ",".join(EXPORT_FIELDS) + "\n"
+    assert _export(OutputFormat.json, [[]], capsys) == "[]\n"
+    assert json.loads(_export(OutputFormat.json, [], capsys)) == []
+    assert _export(OutputFormat.ndjson, [], capsys) == ""
+
+
+@pytest.mark.parametrize(
+    "output_format", [OutputFormat.csv, OutputFormat.json, OutputFormat.ndjson]
+)
+def test_empty_pages_are_skipped(output_format, capsys):
+    pages = [[], DEVELOPERS, []]
+
+    assert _export(output_format, pages, capsys) == _export(
+        output_format, [DEVELOPERS], capsys
+    )
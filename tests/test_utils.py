@@ -0,0 +1,131 @@
+import os
+import time
+
+import pytest
+
+from udicti_cli import utils
+
+
+def _cached_files():
+    return sorted(path.name for path in utils.BACKEND_CACHE_DIR.glob("*/*.json"))
+
+
+@pytest.fixture
+def failing_backend(backend, monkeypatch):
+    """Makes the stub answer backend GETs with a 503 the first `failures` times."""
+    route_get = backend.route_get
+    state = {"failures": 0}
+
+    def flaky_route_get(path, query, params=None):
+        route, response = route_get(path, query, params)
+        if route.startswith("backend:") and state["failures"] > 0:
+            state["failures"] -= 1
+            return route, (503, {"error": "Waking up"}, None)
+        return route, response
+
+    monkeypatch.setattr(backend, "route_get", flaky_route_get)
+    return state
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Records the retry backoffs instead of waiting them out."""
+    slept = []
+    monkeypatch.setattr(utils.time, "sleep", slept.append)
+    return slept
+
+
+def test_get_is_cached_within_its_ttl(backend):
+    first = utils.api_request("developers", params={"github": "benchdev"})
+    second = utils.api_request("developers", params={"github": "benchdev"})
+
+    assert first["developers"] == second["developers"]
+    assert backend.take_counts() == {"backend:developers": 1}
+    assert len(_cached_files()) == 1
+
+
+def test_uncached_get_is_not_stored(backend):
+    for _ in range(2):
+        result = utils.api_request("developers", params={"limit": 10}, cache_ttl=0)
+        assert len(result["developers"]) == 10
+
+    assert backend.take_counts() == {"backend:developers": 2}
+    assert _cached_files() == []
+
+
+def test_expired_entries_are_pruned(backend):
+    group = utils.BACKEND_CACHE_DIR / "search"
+    group.mkdir(parents=True)
+    expired, fresh = group / "expired.json", group / "fresh.json"
+    for path in (expired, fresh):
+        path.write_text('{"stored_at": 0, "body": {}}')
+    an_hour_ago = time.time() - 3600
+    os.utime(expired, (an_hour_ago, an_hour_ago))
+
+    utils.api_request("developers", params={"github": "benchdev"})
+
+    assert not expired.exists()
+    assert fresh.exists()
+
+
+def test_post_invalidates_cached_gets(backend, monkeypatch):
+    monkeypatch.setattr(backend, "developers", list(backend.developers))
+    before = utils.api_request("developers")
+    newcomer = {
+        "name": "Newcomer",
+        "email": "newcomer@example.com",
+        "github": "newcomer",
+        "skills": [],
+        "interests": [],
+    }
+
+    result = utils.api_request("developers", method="POST", data=newcomer)
+    after = utils.api_request("developers")
+
+    assert result["success"]
+    assert after["count"] == before["count"] + 1
+    assert backend.take_counts() == {
+        "backend:developers": 2,
+        "backend:add-developer": 1,
+    }
+
+
+def test_missing_resource(backend):
+    assert utils.api_request("developers/nobody", missing_ok=True) == {}
+    assert utils.api_request("developers/nobody", quiet=True) is None
+
+
+def test_get_retries_while_the_backend_wakes_up(backend, failing_backend, sleeps):
+    failing_backend["failures"] = 2
+
+    result = utils.api_request("developers", params={"github": "benchdev"})
+
+    assert result["developers"][0]["github"] == "benchdev"
+    assert backend.take_counts() == {"backend:developers": 3}
+    # Exponential backoff, with up to half a second of jitter
+    assert 0.5 <= sleeps[0] <= 1 and 1 <= sleeps[1] <= 1.5
+
+
+def test_get_without_retry_fails_fast(backend, failing_backend, sleeps):
+    failing_backend["failures"] = 1
+
+    result = utils.api_request(
+        "developers", params={"github": "benchdev"}, retry=False, quiet=True
+    )
+
+    assert result is None
+    assert sleeps == []
+    assert backend.take_counts() == {"backend:developers": 1}
+
+
+def test_get_gives_up_at_its_deadline(backend, monkeypatch):
+    monkeypatch.setattr(backend, "latency", 2)
+    started = time.monotonic()
+
+    result = utils.api_request(
+        "developers", params={"github": "benchdev"}, deadline=0.5, quiet=True
+    )
+
+    assert result is None
+    assert time.monotonic() - started < 1.5
+    assert backend.take_counts() == {"backend:developers": 1}
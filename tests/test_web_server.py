@@ -0,0 +1,185 @@
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+import web_server
+
+SERVER_TIME = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+
+class Doc:
+    """Stands in for a Firestore document snapshot."""
+
+    def __init__(self, data):
+        self._data = data
+
+    def to_dict(self):
+        return dict(self._data)
+
+
+def _docs(count):
+    return [
+        Doc(
+            {
+                "name": f"Dev {i}",
+                "email": f"dev{i:02}@example.com",
+                "github": f"dev{i:02}",
+                "updated_at": SERVER_TIME,
+            }
+        )
+        for i in range(count)
+    ]
+
+
+def _stream(docs, limit=None):
+    return json.loads("".join(web_server.stream_developers(docs, SERVER_TIME, limit)))
+
+
+def test_stream_is_valid_json_with_a_tail():
+    body = _stream(_docs(3))
+
+    assert [dev["github"] for dev in body["developers"]] == ["dev00", "dev01", "dev02"]
+    assert body["developers"][0]["interests"] == []
+    assert body["developers"][0]["updated_at"] == SERVER_TIME.isoformat()
+    assert body["count"] == 3
+    assert body["server_time"] == SERVER_TIME.isoformat()
+    assert "next_cursor" not in body
+
+
+def test_empty_stream():
+    assert _stream([]) == {
+        "developers": [],
+        "count": 0,
+        "server_time": SERVER_TIME.isoformat(),
+    }
+
+
+def test_full_page_ends_with_a_cursor():
+    body = _stream(_docs(3), limit=3)
+
+    assert body["next_cursor"] == "dev02@example.com"
+
+
+def test_last_page_has_no_cursor():
+    assert _stream(_docs(2), limit=3)["next_cursor"] is None
+    assert _stream([], limit=3)["next_cursor"] is None
+
+
+def test_cursor_advances_past_skipped_documents():
+    docs = _docs(2) + [Doc({"email": "incomplete@example.com"})]
+
+    body = _stream(docs, limit=3)
+
+    # Documents missing fields are skipped, but still count towards the page
+    assert body["count"] == 2
+    assert body["next_cursor"] == "incomplete@example.com"
+
+
+def test_failure_mid_stream_ends_with_an_error():
+    def failing_docs():
+        yield from _docs(3)
+        raise RuntimeError("deadline exceeded")
+
+    body = _stream(failing_docs(), limit=5)
+
+    assert body["count"] == 3
+    assert body["error"] == "deadline exceeded"
+    assert body["next_cursor"] is None
+
+
+def test_read_ahead_raises_before_the_response_starts():
+    def failing_query():
+        raise RuntimeError("missing index")
+        yield  # pragma: no cover
+
+    with pytest.raises(RuntimeError):
+        web_server.read_ahead(failing_query())
+
+
+def test_read_ahead_keeps_every_document():
+    docs = _docs(3)
+
+    assert list(web_server.read_ahead(iter(docs))) == docs
+    assert list(web_server.read_ahead(iter([]))) == []
+
+
+class FakeSnapshot:
+    def __init__(self, ref, data):
+        self.reference = ref
+        self.exists = data is not None
+        self._data = data
+
+    def get(self, key):
+        return self._data[key]
+
+    def to_dict(self):
+        return dict(self._data)
+
+
+class FakeRef:
+    def __init__(self, db, path):
+        self.db = db
+        self.path = path
+
+
+class FakeCollection:
+    def __init__(self, db, name):
+        self.db = db
+        self.name = name
+
+    def document(self, doc_id):
+        return FakeRef(self.db, f"{self.name}/{doc_id}")
+
+
+class FakeFirestore:
+    """Just enough of a Firestore client for the search endpoint."""
+
+    def __init__(self, documents):
+        self.documents = documents
+        self.batch_reads = []
+
+    def collection(self, name):
+        return FakeCollection(self, name)
+
+    def get_all(self, refs):
+        refs = list(refs)
+        self.batch_reads.append([ref.path for ref in refs])
+        return [FakeSnapshot(ref, self.documents.get(ref.path)) for ref in refs]
+
+
+@pytest.fixture
+def search_db(monkeypatch):
+    db = FakeFirestore(
+        {
+            "skill_index/python": {"developers": ["ada@example.com"]},
+            "skill_index/rust": {"developers": ["grace@example.com"]},
+            "developers/ada@example.com": {
+                "name": "Ada",
+                "email": "ada@example.com",
+                "github": "ada",
+            },
+        }
+    )
+    monkeypatch.setattr(web_server, "db", db)
+    return db
+
+
+def test_search_reads_the_matching_developers(search_db):
+    response = web_server.app.test_client().get("/api/search/developers?skill=Python")
+
+    assert response.status_code == 200
+    assert [dev["github"] for dev in response.get_json()["developers"]] == ["ada"]
+    assert search_db.batch_reads == [
+        ["skill_index/python"],
+        ["developers/ada@example.com"],
+    ]
+
+
+def test_search_without_matches_skips_the_developers_read(search_db):
+    response = web_server.app.test_client().get(
+        "/api/search/developers?skill=python,rust"
+    )
+
+    assert response.get_json() == {"developers": [], "count": 0, "match": "all"}
+    assert len(search_db.batch_reads) == 1
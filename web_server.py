@@ -1,11 +1,22 @@
 # File: web_server.py
 
-from flask import Flask, render_template_string, request, jsonify
+from flask import (
+    Flask,
+    Response,
+    render_template_string,
+    request,
+    jsonify,
+    stream_with_context,
+)
 import subprocess
 import os
+import sys
+import json
+import itertools
 import firebase_admin
 from firebase_admin import credentials, firestore
-from datetime import datetime
+from datetime import datetime, timezone
+from urllib.parse import quote
 
 app = Flask(__name__)
 
@@ -13,7 +24,6 @@ app = Flask(__name__)
 try:
     firebase_config_json = os.environ.get("FIREBASE_CONFIG_JSON")
     if firebase_config_json:
-        import json
         firebase_config = json.loads(firebase_config_json)
         cred = credentials.Certificate(firebase_config)
         firebase_admin.initialize_app(cred)
@@ -92,121 +102,509 @@ HTML_TEMPLATE = """
 </html>
 """
 
-@app.route('/')
+
+@app.route("/")
 def home():
     return render_template_string(HTML_TEMPLATE)
 
-@app.route('/health')
+
+@app.route("/health")
 def health():
-    return {'status': 'healthy', 'firebase': 'connected' if db else 'disconnected'}
+    return {"status": "healthy", "firebase": "connected" if db else "disconnected"}
+
 
 # API Routes for CLI
-@app.route('/api/log', methods=['POST'])
+@app.route("/api/log", methods=["POST"])
 def api_log():
     """Log CLI usage events"""
     try:
         data = request.get_json()
         if db:
-            db.collection('cli_logs').add({
-                **data,
-                'timestamp': firestore.SERVER_TIMESTAMP,
-                'ip': request.remote_addr,
-                'user_agent': request.user_agent.string
-            })
-        return jsonify({'status': 'logged'})
+            db.collection("cli_logs").add(
+                {
+                    **data,
+                    "timestamp": firestore.SERVER_TIMESTAMP,
+                    "ip": request.remote_addr,
+                    "user_agent": request.user_agent.string,
+                }
+            )
+        return jsonify({"status": "logged"})
+    except Exception as e:
+        print(f"Log error: {e}")
+        return jsonify({"error": str(e)}), 500
+
+
+# Most events accepted in one /api/log/batch request
+LOG_BATCH_MAX = 5000
+
+
+@app.route("/api/log/batch", methods=["POST"])
+def api_log_batch():
+    """Log a batch of CLI usage events with as few Firestore writes as possible"""
+    try:
+        data = request.get_json()
+        events = data.get("events", [])
+        if len(events) > LOG_BATCH_MAX:
+            # Refuse rather than drop the rest, so the client keeps them
+            return jsonify({"error": f"At most {LOG_BATCH_MAX} events per batch"}), 413
+        if db and events:
+            # A Firestore batch holds at most 500 writes
+            for start in range(0, len(events), 500):
+                batch = db.batch()
+                for event in events[start : start + 500]:
+                    batch.set(
+                        db.collection("cli_logs").document(),
+                        {
+                            **event,
+                            # Events may have been spooled offline, keep when they happened
+                            "client_timestamp": event.get("timestamp"),
+                            "timestamp": firestore.SERVER_TIMESTAMP,
+                            "ip": request.remote_addr,
+                            "user_agent": request.user_agent.string,
+                        },
+                    )
+                batch.commit()
+        return jsonify({"status": "logged", "count": len(events)})
     except Exception as e:
         print(f"Log error: {e}")
-        return jsonify({'error': str(e)}), 500
+        return jsonify({"error": str(e)}), 500
+
+
+def escape_doc_id(key):
+    """Quote a string for use as a document id"""
+    # Ids can't contain '/', be '.' or '..', or look like '__name__'
+    return quote(key, safe="").replace(".", "%2E").replace("_", "%5F")
+
+
+# Handle index: one document per lowercased GitHub handle, pointing at the
+# developer's document, so a developer is found with two keyed reads
+HANDLES_COLLECTION = "developer_handles"
+
 
-@app.route('/api/developers', methods=['GET'])
+def handle_ref(github):
+    return db.collection(HANDLES_COLLECTION).document(escape_doc_id(github.lower()))
+
+
+def handle_entry(developer_data):
+    """The handle document for a developer; `name` is there for typeahead"""
+    return {
+        "github": developer_data["github"],
+        "github_lower": developer_data["github"].lower(),
+        "email": developer_data["email"],
+        "name": developer_data["name"],
+    }
+
+
+def update_handle_index(batch, old_data, new_data):
+    """Point the developer's handle at them, dropping a handle they changed"""
+    batch.set(handle_ref(new_data["github"]), handle_entry(new_data))
+    old_github = (old_data or {}).get("github")
+    if old_github and old_github.lower() != new_data["github"].lower():
+        batch.delete(handle_ref(old_github))
+
+
+def find_developer_docs(github):
+    """Find developer documents by GitHub handle, case-insensitively (read only)"""
+    developers_ref = db.collection("developers")
+    handle = handle_ref(github).get()
+    if handle.exists:
+        doc = developers_ref.document(handle.get("email")).get()
+        if doc.exists:
+            return [doc]
+
+    # Developers not in the handle index yet (until --rebuild-search-index)
+    docs = list(
+        developers_ref.where("github_lower", "==", github.lower()).limit(1).stream()
+    )
+    if not docs:
+        # Added before `github_lower` existed too: exact match
+        docs = list(developers_ref.where("github", "==", github).limit(1).stream())
+    return docs
+
+
+def serialize_developer(dev_data):
+    """Convert a developer document to JSON-friendly values (ISO timestamps)"""
+    return {
+        key: value.isoformat() if isinstance(value, datetime) else value
+        for key, value in dev_data.items()
+    }
+
+
+# Largest page a client can ask for with ?limit=
+DEVELOPERS_PAGE_MAX = 500
+
+
+def stream_developers(docs, server_time, limit=None):
+    """
+    Stream a developers response as JSON, one document at a time, so the
+    server never holds the whole roster in memory. When a page `limit` is
+    given, the response ends with the `next_cursor` to ask for the next page
+    (None once the last page has been sent).
+
+    The status has already been sent by the time a document fails to read,
+    so a failure ends the body with an `error` key instead; clients must
+    treat such a response as failed.
+    """
+    yield '{"developers": ['
+    count = 0
+    read = 0
+    last_email = None
+    error = None
+    try:
+        for doc in docs:
+            read += 1
+            dev_data = doc.to_dict()
+            last_email = dev_data.get("email", last_email)
+            dev_data["interests"] = dev_data.get("interests", [])
+            dev_data["skills"] = dev_data.get("skills", [])
+
+            if all(key in dev_data for key in ["name", "email", "github"]):
+                yield ("," if count else "") + json.dumps(serialize_developer(dev_data))
+                count += 1
+    except Exception as e:
+        print(f"Developers stream error: {e}")
+        error = str(e)
+
+    tail = {"count": count, "server_time": server_time.isoformat()}
+    if limit is not None:
+        tail["next_cursor"] = last_email if read == limit and not error else None
+    if error:
+        tail["error"] = error
+    yield "], " + json.dumps(tail)[1:]
+
+
+def read_ahead(docs):
+    """
+    Read the first document of a query before the response starts, so that
+    errors setting the query up (permissions, missing indexes, deadlines)
+    are still reported with an error status
+    """
+    docs = iter(docs)
+    first = next(docs, None)
+    return docs if first is None else itertools.chain([first], docs)
+
+
+@app.route("/api/developers", methods=["GET"])
 def api_get_developers():
-    """Get all developers"""
+    """
+    Get all developers, the one with a given GitHub handle (?github=), the
+    ones added or changed since a timestamp (?updated_since=, ISO 8601), or
+    one page of the roster ordered by email (?limit=, then ?cursor= set to
+    the previous page's `next_cursor`). For one developer, prefer
+    /api/developers/<github>.
+    """
     try:
         if not db:
-            return jsonify({'error': 'Database not available'}), 500
-            
-        developers_ref = db.collection("developers")
-        docs = developers_ref.stream()
+            return jsonify({"error": "Database not available"}), 500
+
+        # Taken before querying, so clients can use it as their next watermark
+        server_time = datetime.now(timezone.utc)
+
+        github = request.args.get("github")
+        updated_since = request.args.get("updated_since")
+        limit = request.args.get("limit", type=int)
+        cursor = request.args.get("cursor")
+        page_limit = None
+        if github:
+            # Keyed lookup: a single indexed read instead of streaming the roster
+            docs = find_developer_docs(github)
+        elif updated_since:
+            # Delta sync: only the documents written since the client's watermark
+            since = datetime.fromisoformat(updated_since.replace("Z", "+00:00"))
+            docs = (
+                db.collection("developers")
+                .where("updated_at", ">=", since)
+                .order_by("updated_at")
+                .stream()
+            )
+        elif limit is not None:
+            # Cursor pagination: each page costs the same however big the roster is
+            if limit < 1:
+                return jsonify({"error": "limit must be positive"}), 400
+            page_limit = min(limit, DEVELOPERS_PAGE_MAX)
+            query = db.collection("developers").order_by("email")
+            if cursor:
+                query = query.start_after({"email": cursor})
+            docs = query.limit(page_limit).stream()
+        else:
+            developers_ref = db.collection("developers")
+            docs = developers_ref.stream()
+
+        # Firestore is read lazily while the response is sent
+        docs = read_ahead(docs)
+        return Response(
+            stream_with_context(stream_developers(docs, server_time, page_limit)),
+            mimetype="application/json",
+        )
+
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+@app.route("/api/developers/<github>", methods=["GET"])
+def api_get_developer(github):
+    """Get one developer by GitHub handle (case-insensitive), via the handle index"""
+    try:
+        if not db:
+            return jsonify({"error": "Database not available"}), 500
+
+        for doc in find_developer_docs(github):
+            dev_data = doc.to_dict()
+            dev_data["interests"] = dev_data.get("interests", [])
+            dev_data["skills"] = dev_data.get("skills", [])
+            if all(key in dev_data for key in ["name", "email", "github"]):
+                return jsonify({"developer": serialize_developer(dev_data)})
+        return jsonify({"error": "Developer not found"}), 404
+
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+# Most handles a typeahead request returns
+HANDLES_PAGE_MAX = 50
+
+
+@app.route("/api/developer-handles", methods=["GET"])
+def api_get_developer_handles():
+    """
+    Typeahead: the GitHub handles starting with ?prefix= (case-insensitive),
+    in order, with their developers' names. At most ?limit= (default 10) are
+    returned, read as one range of the handle index.
+    """
+    try:
+        if not db:
+            return jsonify({"error": "Database not available"}), 500
+
+        prefix = request.args.get("prefix", "").lower()
+        limit = request.args.get("limit", 10, type=int)
+        if limit < 1:
+            return jsonify({"error": "limit must be positive"}), 400
+
+        query = db.collection(HANDLES_COLLECTION).order_by("github_lower")
+        if prefix:
+            # Every string starting with the prefix sorts before prefix + U+F8FF
+            query = query.start_at({"github_lower": prefix}).end_at(
+                {"github_lower": prefix + "\uf8ff"}
+            )
+        handles = [
+            {"github": doc.get("github"), "name": doc.get("name")}
+            for doc in query.limit(min(limit, HANDLES_PAGE_MAX)).stream()
+        ]
+        return jsonify({"handles": handles, "count": len(handles)})
+
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+
+# Inverted indexes for search: one document per normalized term, listing the
+# ids (emails) of the developers who have it
+SEARCH_INDEXES = {"skills": "skill_index", "interests": "interest_index"}
+
+
+def normalize_term(term):
+    """Normalize a skill or interest so search ignores case and spacing"""
+    return " ".join(str(term).split()).casefold()
+
+
+def index_ref(field, term):
+    """Reference to a term's index document, with the term quoted as its id"""
+    return db.collection(SEARCH_INDEXES[field]).document(escape_doc_id(term))
+
+
+def normalized_terms(values):
+    return {normalize_term(value) for value in values or []} - {""}
+
+
+def update_search_index(batch, email, old_data, new_data):
+    """Add a developer under each of their terms, and remove them from dropped ones"""
+    for field in SEARCH_INDEXES:
+        old_terms = normalized_terms((old_data or {}).get(field))
+        new_terms = normalized_terms(new_data.get(field))
+        for term in new_terms - old_terms:
+            batch.set(
+                index_ref(field, term),
+                {"term": term, "developers": firestore.ArrayUnion([email])},
+                merge=True,
+            )
+        for term in old_terms - new_terms:
+            batch.set(
+                index_ref(field, term),
+                {"developers": firestore.ArrayRemove([email])},
+                merge=True,
+            )
+
+
+def rebuild_search_index():
+    """
+    Index every existing developer's terms and handle, e.g. the ones added
+    before search or the handle index existed, and backfill `github_lower`
+    """
+    for doc in db.collection("developers").stream():
+        dev_data = doc.to_dict()
+        batch = db.batch()
+        update_search_index(batch, doc.id, None, dev_data)
+        if all(key in dev_data for key in ["name", "email", "github"]):
+            if "github_lower" not in dev_data:
+                batch.update(
+                    doc.reference, {"github_lower": dev_data["github"].lower()}
+                )
+            update_handle_index(batch, None, dev_data)
+        batch.commit()
+
+
+def search_terms(name):
+    """Terms from a repeatable, comma-separated query parameter"""
+    values = request.args.getlist(name)
+    return normalized_terms(term for value in values for term in value.split(","))
+
+
+@app.route("/api/search/developers", methods=["GET"])
+def api_search_developers():
+    """
+    Find developers by skill (?skill=) and/or interest (?interest=), both
+    repeatable or comma-separated. With ?match=all (the default) developers
+    need every term; with ?match=any, at least one. Served from the inverted
+    indexes, so it reads one document per term plus the matches.
+    """
+    try:
+        if not db:
+            return jsonify({"error": "Database not available"}), 500
+
+        match = request.args.get("match", "all")
+        if match not in ("all", "any"):
+            return jsonify({"error": "match must be 'all' or 'any'"}), 400
+        refs = [
+            index_ref(field, term)
+            for field, param in (("skills", "skill"), ("interests", "interest"))
+            for term in search_terms(param)
+        ]
+        if not refs:
+            return jsonify({"error": "Give at least one skill or interest"}), 400
+
+        # One batched read for all the terms' index documents
+        postings = {ref.path: set() for ref in refs}
+        for snapshot in db.get_all(refs):
+            if snapshot.exists:
+                postings[snapshot.reference.path] = set(
+                    snapshot.get("developers") or []
+                )
+        if match == "all":
+            ids = set.intersection(*postings.values())
+        else:
+            ids = set.union(*postings.values())
+        if not ids:
+            return jsonify({"developers": [], "count": 0, "match": match})
 
+        developers_ref = db.collection("developers")
         devs = []
-        for doc in docs:
+        for doc in db.get_all([developers_ref.document(dev_id) for dev_id in ids]):
+            if not doc.exists:
+                continue
             dev_data = doc.to_dict()
             dev_data["interests"] = dev_data.get("interests", [])
             dev_data["skills"] = dev_data.get("skills", [])
-            
             if all(key in dev_data for key in ["name", "email", "github"]):
-                devs.append(dev_data)
+                devs.append(serialize_developer(dev_data))
+        devs.sort(key=lambda dev: dev["email"])
+
+        return jsonify({"developers": devs, "count": len(devs), "match": match})
 
-        return jsonify({'developers': devs, 'count': len(devs)})
-        
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return jsonify({"error": str(e)}), 500
+
 
-@app.route('/api/developers', methods=['POST'])
+@app.route("/api/developers", methods=["POST"])
 def api_add_developer():
     """Add new developer"""
     try:
         if not db:
-            return jsonify({'error': 'Database not available'}), 500
-            
+            return jsonify({"error": "Database not available"}), 500
+
         data = request.get_json()
-        
+
         # Validate required fields
-        required_fields = ['name', 'email', 'github']
+        required_fields = ["name", "email", "github"]
         if not all(field in data for field in required_fields):
-            return jsonify({'error': 'Missing required fields'}), 400
-        
+            return jsonify({"error": "Missing required fields"}), 400
+
         # Add to Firebase
         developer_data = {
-            "name": data['name'],
-            "email": data['email'],
-            "github": data['github'],
-            "interests": data.get('interests', []),
-            "skills": data.get('skills', []),
-            "joined_at": firestore.SERVER_TIMESTAMP
+            "name": data["name"],
+            "email": data["email"],
+            "github": data["github"],
+            "github_lower": data["github"].lower(),
+            "interests": data.get("interests", []),
+            "skills": data.get("skills", []),
+            "joined_at": firestore.SERVER_TIMESTAMP,
+            # Lets clients sync only the developers that changed
+            "updated_at": firestore.SERVER_TIMESTAMP,
         }
-        
-        # Use email as document ID
-        db.collection("developers").document(data['email']).set(developer_data)
-        
-        return jsonify({'success': True, 'message': 'Developer added successfully'})
-        
+
+        # A GitHub username belongs to one developer: refuse it for another email
+        for doc in find_developer_docs(data["github"]):
+            if doc.id != data["email"]:
+                return (
+                    jsonify(
+                        {
+                            "error": f"GitHub username '{data['github']}' is already registered"
+                        }
+                    ),
+                    409,
+                )
+
+        # Use email as document ID, and keep the search and handle indexes in
+        # step in the same batch (re-joining can change any of them)
+        developer_ref = db.collection("developers").document(data["email"])
+        previous = developer_ref.get()
+        previous_data = previous.to_dict() if previous.exists else None
+        batch = db.batch()
+        batch.set(developer_ref, developer_data)
+        update_search_index(batch, data["email"], previous_data, developer_data)
+        update_handle_index(batch, previous_data, developer_data)
+        batch.commit()
+
+        return jsonify({"success": True, "message": "Developer added successfully"})
+
     except Exception as e:
-        return jsonify({'error': str(e)}), 500
+        return jsonify({"error": str(e)}), 500
 
-@app.route('/run-command', methods=['POST'])
+
+@app.route("/run-command", methods=["POST"])
 def run_command():
     try:
         data = request.get_json()
-        command = data.get('command', '--help')
-        
+        command = data.get("command", "--help")
+
         # Log web usage
         if db:
-            db.collection('web_usage').add({
-                'command': command,
-                'timestamp': firestore.SERVER_TIMESTAMP,
-                'ip': request.remote_addr,
-                'user_agent': request.user_agent.string
-            })
-        
+            db.collection("web_usage").add(
+                {
+                    "command": command,
+                    "timestamp": firestore.SERVER_TIMESTAMP,
+                    "ip": request.remote_addr,
+                    "user_agent": request.user_agent.string,
+                }
+            )
+
         # Run the UDICTI command
         result = subprocess.run(
-            ['udicti'] + command.split(),
-            capture_output=True,
-            text=True,
-            timeout=30
+            ["udicti"] + command.split(), capture_output=True, text=True, timeout=30
         )
-        
+
         output = result.stdout
         if result.stderr:
             output += f"\nError: {result.stderr}"
-            
-        return jsonify({'output': output})
+
+        return jsonify({"output": output})
     except subprocess.TimeoutExpired:
-        return jsonify({'output': 'Command timed out'}), 408
+        return jsonify({"output": "Command timed out"}), 408
     except Exception as e:
-        return jsonify({'output': f'Error: {str(e)}'}), 500
+        return jsonify({"output": f"Error: {str(e)}"}), 500
+
 
-if __name__ == '__main__':
-    port = int(os.environ.get('PORT', 10000))
-    app.run(host='0.0.0.0', port=port)
\ No newline at end of file
+if __name__ == "__main__":
+    if "--rebuild-search-index" in sys.argv:
+        rebuild_search_index()
+    else:
+        port = int(os.environ.get("PORT", 10000))
+        app.run(host="0.0.0.0", port=port)